@@ -1,7 +1,6 @@
 import pygame
 import math
 import random
-import time
 
 from utils.animation import (
     load_sprite_sheet,
@@ -10,13 +9,13 @@ from utils.animation import (
     advance_animation,
 )
 
-from actions.fire_ball import FireBall
 from actions.bomb import Bomb
-from actions.actions import TAB_ACTION
 
 class AllyBot(pygame.sprite.Sprite):
-    def __init__(self, x, y, player):
+    def __init__(self, x, y, player, rng=None):
         super().__init__()
+        # Flux aléatoire propre à l'entité (module random si aucun flux n'est fourni)
+        self.rng = rng if rng is not None else random
         # Utiliser le même sprite sheet que le joueur mais avec une couleur différente
         self.sprite_sheet = load_sprite_sheet('./assets/sprites/player/BigBoss.png')
         self.rect = pygame.Rect(x, y, 32, 32)
@@ -129,6 +128,10 @@ class AllyBot(pygame.sprite.Sprite):
        
         # Système de collision avec les objets TMX
         self.collision_objects = []
+        self.collision_index = None  # Index spatial partagé (construit par le GameManager)
+        self.trap_manager = None  # Registre des pièges (fourni par le GameManager)
+        self.projectile_pool = None  # Pool de boules de feu (fourni par le GameManager)
+        self.game_clock = None  # Horloge de simulation (fournie par le GameManager)
         
         # Récupérer toutes les frames (même système que le joueur)
         self.animations = load_directional_animations(
@@ -149,9 +152,28 @@ class AllyBot(pygame.sprite.Sprite):
         self.image = self.animations['down'][0]
         self.is_moving = False
 
-    def set_collision_objects(self, collision_objects):
-        """Définir les objets de collision TMX"""
+    def set_collision_objects(self, collision_objects, collision_index=None):
+        """Définir les objets de collision TMX (et l'index spatial partagé s'il existe)"""
         self.collision_objects = collision_objects
+        self.collision_index = collision_index
+
+    def set_trap_manager(self, trap_manager):
+        """Définir le registre de pièges dans lequel poser les pièges et les bombes"""
+        self.trap_manager = trap_manager
+
+    def set_projectile_pool(self, projectile_pool):
+        """Définir le pool dans lequel puiser les boules de feu"""
+        self.projectile_pool = projectile_pool
+
+    def set_game_clock(self, game_clock):
+        """Définir l'horloge de simulation qui cadence les actions"""
+        self.game_clock = game_clock
+
+    def get_now(self):
+        """Temps simulé (ms), ou temps réel si aucune horloge n'est fournie"""
+        if self.game_clock is not None:
+            return self.game_clock.now_ms
+        return pygame.time.get_ticks()
 
     def save_position(self):
         """Sauvegarder la position actuelle pour pouvoir revenir en arrière en cas de collision"""
@@ -169,6 +191,8 @@ class AllyBot(pygame.sprite.Sprite):
 
     def check_collision_at_position(self, x, y):
         """Vérifier s'il y a collision à une position donnée"""
+        if self.collision_index is not None:
+            return self.collision_index.collides_point(x, y)
         for obj in self.collision_objects:
             if (x >= obj.x and y >= obj.y and
                 x <= obj.x + obj.width and y <= obj.y + obj.height):
@@ -205,34 +229,34 @@ class AllyBot(pygame.sprite.Sprite):
         if self.direction_change_timer >= base_interval:
             self.direction_change_timer = 0
             # Variation dans l'intervalle pour plus de naturel
-            self.direction_change_interval = random.randint(40, 220)
+            self.direction_change_interval = self.rng.randint(40, 220)
             
             # Parfois hésiter avant de changer de direction
-            if random.random() < 0.3:  # 30% de chance d'hésiter
+            if self.rng.random() < 0.3:  # 30% de chance d'hésiter
                 self.is_hesitating = True
-                self.hesitation_timer = random.randint(10, 30)
+                self.hesitation_timer = self.rng.randint(10, 30)
                 return
             
             # Mouvement aléatoire avec forte tendance vers le haut mais plus de variation
-            self.random_direction_x = random.uniform(-0.7, 0.7)  # Plus de variation horizontale
-            self.random_direction_y = random.uniform(-1.2, -0.1)  # Variation verticale
+            self.random_direction_x = self.rng.uniform(-0.7, 0.7)  # Plus de variation horizontale
+            self.random_direction_y = self.rng.uniform(-1.2, -0.1)  # Variation verticale
             
             # Ajouter des micro-corrections occasionnelles
-            if random.random() < 0.4:  # 40% de chance
-                self.random_direction_x += random.uniform(-0.3, 0.3)
-                self.random_direction_y += random.uniform(-0.2, 0.2)
+            if self.rng.random() < 0.4:  # 40% de chance
+                self.random_direction_x += self.rng.uniform(-0.3, 0.3)
+                self.random_direction_y += self.rng.uniform(-0.2, 0.2)
             
             # Éviter les bords de la carte avec plus de fluidité
             edge_buffer = 150  # Zone tampon plus large
             if self.position[0] < edge_buffer:  # Trop à gauche
-                self.random_direction_x = abs(self.random_direction_x) + random.uniform(0.1, 0.3)
+                self.random_direction_x = abs(self.random_direction_x) + self.rng.uniform(0.1, 0.3)
             elif self.position[0] > self.map_width - edge_buffer:  # Trop à droite
-                self.random_direction_x = -abs(self.random_direction_x) - random.uniform(0.1, 0.3)
+                self.random_direction_x = -abs(self.random_direction_x) - self.rng.uniform(0.1, 0.3)
                 
             if self.position[1] < edge_buffer:  # Trop en haut
-                self.random_direction_y = abs(self.random_direction_y) + random.uniform(0.1, 0.3)
+                self.random_direction_y = abs(self.random_direction_y) + self.rng.uniform(0.1, 0.3)
             elif self.position[1] > self.map_height - edge_buffer:  # Trop en bas
-                self.random_direction_y = -abs(self.random_direction_y) - random.uniform(0.1, 0.3)
+                self.random_direction_y = -abs(self.random_direction_y) - self.rng.uniform(0.1, 0.3)
         
         # Gérer l'hésitation
         if self.is_hesitating:
@@ -240,17 +264,17 @@ class AllyBot(pygame.sprite.Sprite):
             if self.hesitation_timer <= 0:
                 self.is_hesitating = False
             # Réduire le mouvement pendant l'hésitation
-            self.natural_speed_variation = 0.3 + random.uniform(0, 0.4)
+            self.natural_speed_variation = 0.3 + self.rng.uniform(0, 0.4)
         else:
             # Variation naturelle de la vitesse
-            self.natural_speed_variation = 0.8 + random.uniform(0, 0.4)
+            self.natural_speed_variation = 0.8 + self.rng.uniform(0, 0.4)
         
         # Micro-mouvements pour simuler l'imprécision naturelle
         self.micro_movement_timer += 1
         if self.micro_movement_timer >= 5:  # Chaque 5 frames
             self.micro_movement_timer = 0
-            self.micro_movement_x = random.uniform(-0.1, 0.1)
-            self.micro_movement_y = random.uniform(-0.1, 0.1)
+            self.micro_movement_x = self.rng.uniform(-0.1, 0.1)
+            self.micro_movement_y = self.rng.uniform(-0.1, 0.1)
         
         # Effet de "respiration" subtil
         self.breathing_timer += 0.1
@@ -296,7 +320,7 @@ class AllyBot(pygame.sprite.Sprite):
                 self.velocity_y = (self.velocity_y / speed) * adjusted_speed
         
         # Appliquer une friction variable pour plus de naturel
-        friction_factor = self.friction + random.uniform(-0.02, 0.02)
+        friction_factor = self.friction + self.rng.uniform(-0.02, 0.02)
         self.velocity_x *= friction_factor
         self.velocity_y *= friction_factor
         
@@ -324,14 +348,19 @@ class AllyBot(pygame.sprite.Sprite):
                 self.change_animation('up')
 
     def update(self, fireballs_group=None, group=None):
-        """Mise à jour principale du bot allié"""
+        """Enchaîne les phases du bot allié (le jeu passe par le SystemScheduler)"""
         self.update_ai()
+        self.update_combat(fireballs_group, group)
         self.update_movement()
-        
-        # Gérer le système de tir sur le hero bot
+        self.update_animation()
+
+    def update_combat(self, fireballs_group=None, group=None):
+        """Gérer le système de tir sur le hero bot"""
         if fireballs_group and group:
             self.handle_hero_shooting(fireballs_group, group)
-        
+
+    def update_animation(self):
+        """Synchronise le rect et choisit l'animation d'après la vitesse"""
         # Mettre à jour le rect
         self.rect.center = (int(self.position[0]), int(self.position[1]))
         
@@ -429,21 +458,18 @@ class AllyBot(pygame.sprite.Sprite):
         else:
             direction = "up"
         
-        # Créer la boule de feu avec les paramètres corrects
-        fireball = FireBall(
-            self.position[0] + 16,  # Centre du sprite
-            self.position[1] + 16,  # Centre du sprite
-            direction,  # Direction textuelle au lieu de l'angle numérique
-            speed=8,  # Vitesse de la boule de feu
-            spread_angle=5  # Petit angle de dispersion
-        )
-        
-        # Ajouter la boule de feu aux groupes
-        fireballs_group.add(fireball)
-        group.add(fireball)
+        # Prendre une boule de feu dans le pool (elle est ajoutée aux groupes par le pool)
+        if self.projectile_pool is not None:
+            self.projectile_pool.spawn(
+                self.position[0] + 16,  # Centre du sprite
+                self.position[1] + 16,  # Centre du sprite
+                direction,  # Direction textuelle au lieu de l'angle numérique
+                speed=8,  # Vitesse de la boule de feu
+                spread_angle=5  # Petit angle de dispersion
+            )
         
         # Mettre à jour le temps du dernier tir
-        self.last_shot_time = time.time()
+        self.last_shot_time = self.get_now() / 1000.0
 
     def launch_bomb_at_hero(self, group):
         """Lance une bombe vers le hero bot"""
@@ -456,12 +482,13 @@ class AllyBot(pygame.sprite.Sprite):
             self.position[1] + 16   # Centre du sprite
         )
         
-        # Ajouter la bombe aux groupes
-        TAB_ACTION.append(bomb)
+        # Ajouter la bombe au registre de pièges et aux groupes
+        if self.trap_manager is not None:
+            self.trap_manager.add(bomb, self.get_now())
         group.add(bomb)
         
         # Mettre à jour le temps du dernier lancement de bombe
-        self.last_bomb_time = time.time()
+        self.last_bomb_time = self.get_now() / 1000.0
 
     def handle_hero_shooting(self, fireballs_group, group):
         """Gère le système de tir sur le hero bot avec possibilité de lancer des bombes"""
@@ -469,7 +496,7 @@ class AllyBot(pygame.sprite.Sprite):
             return
         
         distance_to_hero = self.get_distance_to_hero_bot()
-        current_time = time.time()
+        current_time = self.get_now() / 1000.0
         
         # Vérifier si le hero bot est à portée
         if distance_to_hero <= self.hero_detection_distance:
@@ -479,7 +506,7 @@ class AllyBot(pygame.sprite.Sprite):
             if current_time - self.last_shot_time >= self.shot_interval:
                 # Décider entre bombe et boule de feu
                 if (current_time - self.last_bomb_time >= self.bomb_interval and 
-                    random.random() < self.bomb_probability):
+                    self.rng.random() < self.bomb_probability):
                     # Lancer une bombe
                     self.launch_bomb_at_hero(group)
                 else:
@@ -551,9 +578,9 @@ class AllyBot(pygame.sprite.Sprite):
         """Définir une cible aléatoire pour les mouvements pendant la pause"""
         # Mouvement aléatoire dans un petit rayon autour de la position actuelle
         pause_radius = 40
-        angle = random.uniform(0, 2 * math.pi)
-        self.random_target_x = self.position[0] + math.cos(angle) * random.uniform(10, pause_radius)
-        self.random_target_y = self.position[1] + math.sin(angle) * random.uniform(10, pause_radius)
+        angle = self.rng.uniform(0, 2 * math.pi)
+        self.random_target_x = self.position[0] + math.cos(angle) * self.rng.uniform(10, pause_radius)
+        self.random_target_y = self.position[1] + math.sin(angle) * self.rng.uniform(10, pause_radius)
         self.target_x = self.random_target_x
         self.target_y = self.random_target_y
 
@@ -575,7 +602,7 @@ class AllyBot(pygame.sprite.Sprite):
         
         # Se déplacer dans la direction opposée avec un peu d'aléatoire
         avoidance_distance = 60
-        angle_variation = random.uniform(-0.5, 0.5)  # Variation d'angle pour plus de naturel
+        angle_variation = self.rng.uniform(-0.5, 0.5)  # Variation d'angle pour plus de naturel
         
         final_dx = dx * math.cos(angle_variation) - dy * math.sin(angle_variation)
         final_dy = dx * math.sin(angle_variation) + dy * math.cos(angle_variation)
@@ -604,13 +631,13 @@ class AllyBot(pygame.sprite.Sprite):
         
         # Micro-mouvements pour simuler l'imprécision naturelle
         self.micro_movement_timer += 1
-        if self.micro_movement_timer >= random.randint(4, 8):  # Variation dans le timing
+        if self.micro_movement_timer >= self.rng.randint(4, 8):  # Variation dans le timing
             self.micro_movement_timer = 0
-            self.micro_movement_x = random.uniform(-0.1, 0.1)
-            self.micro_movement_y = random.uniform(-0.1, 0.1)
+            self.micro_movement_x = self.rng.uniform(-0.1, 0.1)
+            self.micro_movement_y = self.rng.uniform(-0.1, 0.1)
         
         # Effet de "respiration" subtil
-        self.breathing_timer += 0.08 + random.uniform(-0.01, 0.01)
+        self.breathing_timer += 0.08 + self.rng.uniform(-0.01, 0.01)
         breathing_effect_x = math.sin(self.breathing_timer) * 0.05
         breathing_effect_y = math.cos(self.breathing_timer * 0.9) * 0.03
         
@@ -626,9 +653,9 @@ class AllyBot(pygame.sprite.Sprite):
         if distance_to_target > 3:
             current_direction = math.atan2(dy, dx)
             if abs(current_direction - self.last_direction_change) > 0.3:
-                if random.random() < 0.12 and not self.is_hesitating:  # 12% de chance
+                if self.rng.random() < 0.12 and not self.is_hesitating:  # 12% de chance
                     self.is_hesitating = True
-                    self.hesitation_timer = random.randint(5, 12)
+                    self.hesitation_timer = self.rng.randint(5, 12)
                     self.last_direction_change = current_direction
         
         # Gérer l'hésitation
@@ -637,10 +664,10 @@ class AllyBot(pygame.sprite.Sprite):
             if self.hesitation_timer <= 0:
                 self.is_hesitating = False
             # Réduire le mouvement pendant l'hésitation
-            self.natural_speed_variation = 0.5 + random.uniform(0, 0.3)
+            self.natural_speed_variation = 0.5 + self.rng.uniform(0, 0.3)
         else:
             # Variation naturelle de la vitesse
-            base_variation = 0.9 + random.uniform(0, 0.3)
+            base_variation = 0.9 + self.rng.uniform(0, 0.3)
             # Ajuster selon la distance (plus loin = plus rapide)
             distance_factor = min(1.2, 0.95 + distance_to_target * 0.003)
             self.natural_speed_variation = base_variation * distance_factor
@@ -656,14 +683,14 @@ class AllyBot(pygame.sprite.Sprite):
         self.velocity_y += (target_velocity_y - self.velocity_y) * transition_speed
         
         # Limiter la vitesse maximale avec variation naturelle
-        current_max_speed = self.speed * (0.9 + random.uniform(0, 0.2))
+        current_max_speed = self.speed * (0.9 + self.rng.uniform(0, 0.2))
         speed = math.sqrt(self.velocity_x * self.velocity_x + self.velocity_y * self.velocity_y)
         if speed > current_max_speed:
             self.velocity_x = (self.velocity_x / speed) * current_max_speed
             self.velocity_y = (self.velocity_y / speed) * current_max_speed
         
         # Appliquer une friction variable
-        friction_factor = self.friction + random.uniform(-0.015, 0.015)
+        friction_factor = self.friction + self.rng.uniform(-0.015, 0.015)
         self.velocity_x *= friction_factor
         self.velocity_y *= friction_factor
         
@@ -8,14 +8,14 @@ from utils.animation import (
     change_direction,
     advance_animation,
 )
-from actions.fire_ball import FireBall
 from actions.bomb import Bomb
 from actions.trap import Trap
-from actions.actions import TAB_ACTION
 
 class SubordinateBot(pygame.sprite.Sprite):
-    def __init__(self, x, y, leader, formation_angle, formation_radius=60):
+    def __init__(self, x, y, leader, formation_angle, formation_radius=60, rng=None):
         super().__init__()
+        # Flux aléatoire propre à l'entité (module random si aucun flux n'est fourni)
+        self.rng = rng if rng is not None else random
         # Utiliser le même sprite sheet que le joueur mais avec une couleur différente
         self.sprite_sheet = load_sprite_sheet('./assets/sprites/player/Sousfifre.png')
         self.rect = pygame.Rect(x, y, 32, 32)
@@ -45,19 +45,19 @@ class SubordinateBot(pygame.sprite.Sprite):
         self.micro_movement_timer = 0
         self.micro_movement_x = 0
         self.micro_movement_y = 0
-        self.breathing_timer = random.uniform(0, math.pi * 2)
+        self.breathing_timer = self.rng.uniform(0, math.pi * 2)
         self.hesitation_timer = 0
         self.is_hesitating = False
         self.natural_speed_variation = 1.0
         self.last_direction_change = 0
         
         # Variables pour mouvement aléatoire autour de l'ally bot
-        self.random_angle_offset = random.uniform(-math.pi/3, math.pi/3)  # Offset aléatoire de l'angle
-        self.random_radius_offset = random.uniform(-20, 20)  # Variation du rayon
-        self.angle_drift_speed = random.uniform(0.005, 0.02)  # Vitesse de dérive de l'angle
-        self.radius_oscillation_timer = random.uniform(0, math.pi * 2)
-        self.radius_oscillation_speed = random.uniform(0.01, 0.03)
-        self.position_change_timer = random.randint(60, 180)  # Timer pour changer de position
+        self.random_angle_offset = self.rng.uniform(-math.pi/3, math.pi/3)  # Offset aléatoire de l'angle
+        self.random_radius_offset = self.rng.uniform(-20, 20)  # Variation du rayon
+        self.angle_drift_speed = self.rng.uniform(0.005, 0.02)  # Vitesse de dérive de l'angle
+        self.radius_oscillation_timer = self.rng.uniform(0, math.pi * 2)
+        self.radius_oscillation_speed = self.rng.uniform(0.01, 0.03)
+        self.position_change_timer = self.rng.randint(60, 180)  # Timer pour changer de position
         self.target_angle_offset = self.random_angle_offset
         
         # Variables pour suivi de trajectoire de l'ally bot
@@ -69,7 +69,7 @@ class SubordinateBot(pygame.sprite.Sprite):
         # Variables pour cohérence directionnelle avec l'ally bot
         self.leader_direction_influence = 0.4  # Influence de la direction du leader
         self.direction_alignment_speed = 0.05  # Vitesse d'alignement directionnel
-        self.preferred_direction_offset = random.uniform(-math.pi/4, math.pi/4)  # Offset préféré par rapport au leader
+        self.preferred_direction_offset = self.rng.uniform(-math.pi/4, math.pi/4)  # Offset préféré par rapport au leader
         
         # Variables pour éviter les collisions entre subordonnés
         self.separation_radius = 25
@@ -82,6 +82,10 @@ class SubordinateBot(pygame.sprite.Sprite):
         
         # Système de collision avec les objets TMX
         self.collision_objects = []
+        self.collision_index = None  # Index spatial partagé (construit par le GameManager)
+        self.trap_manager = None  # Registre des pièges (fourni par le GameManager)
+        self.projectile_pool = None  # Pool de boules de feu (fourni par le GameManager)
+        self.game_clock = None  # Horloge de simulation (fournie par le GameManager)
         
         # Variables pour le système de tir et piège aléatoire
         self.last_action_time = pygame.time.get_ticks()
@@ -107,9 +111,29 @@ class SubordinateBot(pygame.sprite.Sprite):
         self.image = self.animations['up'][0]
         self.is_moving = True
 
-    def set_collision_objects(self, collision_objects):
-        """Définir les objets de collision TMX"""
+    def set_collision_objects(self, collision_objects, collision_index=None):
+        """Définir les objets de collision TMX (et l'index spatial partagé s'il existe)"""
         self.collision_objects = collision_objects
+        self.collision_index = collision_index
+
+    def set_trap_manager(self, trap_manager):
+        """Définir le registre de pièges dans lequel poser les pièges et les bombes"""
+        self.trap_manager = trap_manager
+
+    def set_projectile_pool(self, projectile_pool):
+        """Définir le pool dans lequel puiser les boules de feu"""
+        self.projectile_pool = projectile_pool
+
+    def set_game_clock(self, game_clock):
+        """Définir l'horloge de simulation qui cadence les actions"""
+        self.game_clock = game_clock
+        self.last_action_time = game_clock.now_ms
+
+    def get_now(self):
+        """Temps simulé (ms), ou temps réel si aucune horloge n'est fournie"""
+        if self.game_clock is not None:
+            return self.game_clock.now_ms
+        return pygame.time.get_ticks()
 
     def save_position(self):
         """Sauvegarder la position actuelle pour pouvoir revenir en arrière en cas de collision"""
@@ -127,6 +151,8 @@ class SubordinateBot(pygame.sprite.Sprite):
 
     def check_collision_at_position(self, x, y):
         """Vérifier s'il y a collision à une position donnée"""
+        if self.collision_index is not None:
+            return self.collision_index.collides_point(x, y)
         for obj in self.collision_objects:
             if (x >= obj.x and y >= obj.y and
                 x <= obj.x + obj.width and y <= obj.y + obj.height):
@@ -182,9 +208,9 @@ class SubordinateBot(pygame.sprite.Sprite):
         self.position_change_timer -= 1
         if self.position_change_timer <= 0:
             # Changer vers une nouvelle position aléatoire
-            self.target_angle_offset = random.uniform(-math.pi/2, math.pi/2)
-            self.random_radius_offset = random.uniform(-25, 25)
-            self.position_change_timer = random.randint(120, 300)  # 2-5 secondes à 60 FPS
+            self.target_angle_offset = self.rng.uniform(-math.pi/2, math.pi/2)
+            self.random_radius_offset = self.rng.uniform(-25, 25)
+            self.position_change_timer = self.rng.randint(120, 300)  # 2-5 secondes à 60 FPS
         
         # Transition douce vers le nouvel angle cible
         angle_diff = self.target_angle_offset - self.random_angle_offset
@@ -197,7 +223,7 @@ class SubordinateBot(pygame.sprite.Sprite):
         self.random_angle_offset += angle_diff * 0.02  # Transition douce
         
         # Dérive continue de l'angle pour un mouvement plus naturel
-        self.random_angle_offset += self.angle_drift_speed * random.uniform(-1, 1)
+        self.random_angle_offset += self.angle_drift_speed * self.rng.uniform(-1, 1)
         
         # Oscillation du rayon pour un mouvement plus dynamique
         self.radius_oscillation_timer += self.radius_oscillation_speed
@@ -224,13 +250,13 @@ class SubordinateBot(pygame.sprite.Sprite):
         
         # Micro-mouvements pour simuler l'imprécision naturelle
         self.micro_movement_timer += 1
-        if self.micro_movement_timer >= random.randint(3, 8):  # Variation dans le timing
+        if self.micro_movement_timer >= self.rng.randint(3, 8):  # Variation dans le timing
             self.micro_movement_timer = 0
-            self.micro_movement_x = random.uniform(-0.15, 0.15)
-            self.micro_movement_y = random.uniform(-0.15, 0.15)
+            self.micro_movement_x = self.rng.uniform(-0.15, 0.15)
+            self.micro_movement_y = self.rng.uniform(-0.15, 0.15)
         
         # Effet de "respiration" subtil
-        self.breathing_timer += 0.08 + random.uniform(-0.02, 0.02)  # Variation du rythme
+        self.breathing_timer += 0.08 + self.rng.uniform(-0.02, 0.02)  # Variation du rythme
         breathing_effect_x = math.sin(self.breathing_timer) * 0.08
         breathing_effect_y = math.cos(self.breathing_timer * 0.7) * 0.06
         
@@ -275,9 +301,9 @@ class SubordinateBot(pygame.sprite.Sprite):
         if distance_to_target > 5:
             current_direction = math.atan2(dy, dx)
             if abs(current_direction - self.last_direction_change) > 0.5:  # Changement significatif
-                if random.random() < 0.2 and not self.is_hesitating:  # 20% de chance
+                if self.rng.random() < 0.2 and not self.is_hesitating:  # 20% de chance
                     self.is_hesitating = True
-                    self.hesitation_timer = random.randint(8, 20)
+                    self.hesitation_timer = self.rng.randint(8, 20)
                     self.last_direction_change = current_direction
         
         # Gérer l'hésitation
@@ -286,10 +312,10 @@ class SubordinateBot(pygame.sprite.Sprite):
             if self.hesitation_timer <= 0:
                 self.is_hesitating = False
             # Réduire le mouvement pendant l'hésitation
-            self.natural_speed_variation = 0.2 + random.uniform(0, 0.3)
+            self.natural_speed_variation = 0.2 + self.rng.uniform(0, 0.3)
         else:
             # Variation naturelle de la vitesse basée sur la distance
-            base_variation = 0.7 + random.uniform(0, 0.5)
+            base_variation = 0.7 + self.rng.uniform(0, 0.5)
             # Plus on est loin, plus on va vite (dans une certaine mesure)
             distance_factor = min(1.2, 0.8 + distance_to_target * 0.01)
             self.natural_speed_variation = base_variation * distance_factor
@@ -305,8 +331,8 @@ class SubordinateBot(pygame.sprite.Sprite):
         separation_x, separation_y = self.calculate_separation(subordinates_list)
         
         # Ajouter une variation naturelle à la force de séparation
-        separation_x *= (0.8 + random.uniform(0, 0.4))
-        separation_y *= (0.8 + random.uniform(0, 0.4))
+        separation_x *= (0.8 + self.rng.uniform(0, 0.4))
+        separation_y *= (0.8 + self.rng.uniform(0, 0.4))
         
         # Transition plus douce vers la nouvelle vélocité
         transition_speed = 0.12 if not self.is_hesitating else 0.04
@@ -321,12 +347,12 @@ class SubordinateBot(pygame.sprite.Sprite):
         adjusted_velocity_y = self.velocity_y * self.natural_speed_variation
         
         # Appliquer une friction variable
-        friction = self.friction + random.uniform(-0.03, 0.03)
+        friction = self.friction + self.rng.uniform(-0.03, 0.03)
         adjusted_velocity_x *= friction
         adjusted_velocity_y *= friction
         
         # Limiter la vitesse maximale avec une variation naturelle
-        current_max_speed = self.max_speed * (0.8 + random.uniform(0, 0.4))
+        current_max_speed = self.max_speed * (0.8 + self.rng.uniform(0, 0.4))
         speed = math.sqrt(adjusted_velocity_x**2 + adjusted_velocity_y**2)
         if speed > current_max_speed:
             adjusted_velocity_x = (adjusted_velocity_x / speed) * current_max_speed
@@ -394,14 +420,14 @@ class SubordinateBot(pygame.sprite.Sprite):
 
     def handle_random_action(self, fireballs_group, group):
         """Gère les actions aléatoires (tir, bombe ou piège) toutes les 10 secondes avec 50% de probabilité"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.get_now()
         
         # Vérifier si 10 secondes se sont écoulées
         if current_time - self.last_action_time >= self.action_interval:
             # 50% de probabilité d'effectuer une action
-            if random.random() < self.action_probability:
+            if self.rng.random() < self.action_probability:
                 # Choisir aléatoirement entre tir (0), bombe (1) et piège (2)
-                action_choice = random.randint(0, 2)
+                action_choice = self.rng.randint(0, 2)
                 
                 if action_choice == 0:
                     # Tirer une boule de feu
@@ -418,13 +444,12 @@ class SubordinateBot(pygame.sprite.Sprite):
 
     def shoot_fireball(self, fireballs_group, group):
         """Tire une boule de feu dans la direction actuelle"""
-        fireball = FireBall(
-            self.position[0] + 16,  # Centre du sprite
-            self.position[1] + 16,
-            self.current_direction
-        )
-        fireballs_group.add(fireball)
-        group.add(fireball)
+        if self.projectile_pool is not None:
+            self.projectile_pool.spawn(
+                self.position[0] + 16,  # Centre du sprite
+                self.position[1] + 16,
+                self.current_direction
+            )
 
     def launch_bomb(self, group):
         """Lance une bombe à la position actuelle"""
@@ -432,17 +457,19 @@ class SubordinateBot(pygame.sprite.Sprite):
             self.position[0] + 16,  # Centre du sprite
             self.position[1] + 16   # Centre du sprite
         )
-        TAB_ACTION.append(bomb)
+        if self.trap_manager is not None:
+            self.trap_manager.add(bomb, self.get_now())
         group.add(bomb)
 
     def place_trap(self, group):
         """Place un piège à la position actuelle"""
         trap = Trap(self.position[0], self.position[1])
-        TAB_ACTION.append(trap)
+        if self.trap_manager is not None:
+            self.trap_manager.add(trap, self.get_now())
         group.add(trap)
 
     def update(self, subordinates_list=None, fireballs_group=None, group=None):
-        """Met à jour le subordonné"""
+        """Enchaîne les phases du subordonné (le jeu passe par le FormationManager)"""
         # Mettre à jour le mouvement de formation
         if subordinates_list is None:
             subordinates_list = []
@@ -452,6 +479,10 @@ class SubordinateBot(pygame.sprite.Sprite):
         if fireballs_group is not None and group is not None:
             self.handle_random_action(fireballs_group, group)
         
+        self.update_animation()
+
+    def update_animation(self):
+        """Synchronise le rect et avance l'animation"""
         # Mettre à jour la position du rectangle
         self.rect.topleft = self.position
         
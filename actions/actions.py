@@ -1,48 +1,27 @@
-import time
+from actions.bomb import Bomb
+from game.events import TRAP_TRIGGERED
+from game.replay import HERO_HIT, TRAP_KIND, BOMB_KIND
+from game.status_effects import DOT, STUN
 
-import pygame
-
-
-TAB_ACTION = []
 
 def stunt_hero(hero, action):
-    hero.speed = 0
-    hero.acceleration = 0
-    time.sleep(action.stunt)
-    hero.speed = 3
-    hero.acceleration = 0.75
+    """Étourdit le héros pendant action.stunt secondes ; l'effet expire pendant son update()"""
+    hero.status.apply(STUN, action.stunt)
+    if action.burn > 0:
+        hero.status.apply(DOT, action.burn_duration, action.burn)
 
 def check_trap(hero):
-    for i in range(len(TAB_ACTION)):
-        action = TAB_ACTION[i]
-        x = int(action.pos[0])
-        y = int(action.pos[1])
-
-        trap_top = [x+15, y+15]
-        trap_bottom = [x, y]
-
-        hero_x = int(hero.position[0])
-        hero_y = int(hero.position[1])
-
-        if hero_x < trap_top[0] and hero_x < trap_top[1] and hero_x > trap_bottom[0] and hero_y > trap_bottom[1] and action.active:
-            action.active = False
-            hero.game_manager.percentage += action.damage
-            hero.game_manager.group.remove(action)
-            #TAB_ACTION.pop(i)
-
-
-def place(action):
-    TAB_ACTION.append(action)
-    x = action.x
-    y = action.y
-
-    sprite_sheet = pygame.image.load(action.image).convert_alpha()
-    image = pygame.Surface((32, 32), pygame.SRCALPHA)
-    image.blit(sprite_sheet, (0, 0), (x, y, 32, 32))
-    rect = image.get_rect()
-    # Actualiser l'affichage
-    pygame.display.flip()
-
-    # placer visuellement
+    """Déclenche les pièges armés sous le héros (requête par cellule dans le TrapManager)"""
+    game_manager = hero.game_manager
+    for action in game_manager.trap_manager.query_rect(hero.rect):
+        cause = BOMB_KIND if isinstance(action, Bomb) else TRAP_KIND
+        game_manager.record_event(HERO_HIT, cause, action.rect.centerx, action.rect.centery)
+        game_manager.event_bus.emit(TRAP_TRIGGERED, type(action).__name__.lower(),
+                                    action.rect.centerx, action.rect.centery)
+        game_manager.percentage += action.damage
+        game_manager.danger_map.add_danger(action.rect.centerx, action.rect.centery, action.danger, radius=2)
+        game_manager.trap_manager.remove(action)
+        stunt_hero(hero, action)
+        game_manager.on_hero_hit(type(action).__name__.lower())
 
 
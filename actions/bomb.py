@@ -1,25 +1,34 @@
 import pygame
 
+from utils.animation import get_image
+
+BOMB_SHEET = './traps/00 All_Rocket.png'
+
 
 class Bomb(pygame.sprite.Sprite):
+    @staticmethod
+    def load_assets():
+        """Charge les images de la bombe dans le cache (appelé au chargement du niveau)"""
+        get_image(BOMB_SHEET, (0, 48, 32, 15))
+
     def __init__(self, x, y):
         super().__init__()
         self.damage = 1
         self.pos = [x, y]
         self.active = True
         self.countdown = 45000
+        self.lifetime = 30000  # Durée de vie (ms) avant disparition si elle n'explose pas
 
-        self.sprite_sheet = pygame.image.load('./traps/00 All_Rocket.png').subsurface(pygame.Rect(0, 48, 32, 15)).copy()
         self.image = self.get_image(0, 0)
         self.rect = pygame.Rect(x, y, 32, 32)
         self.score = 30
-        self.stunt = 5
+        self.danger = 8.0  # Danger ajouté à la danger map du héros quand le piège se déclenche
+        self.stunt = 5  # Durée d'étourdissement (s)
+        self.burn = 0.2  # Brûlure : pourcentage ajouté par seconde
+        self.burn_duration = 3
 
 
 
     def get_image(self, x, y):
-        """Récupère une frame depuis le sprite sheet"""
-        image = pygame.Surface((32, 32), pygame.SRCALPHA)
-        image.blit(self.sprite_sheet, (0, 0), (x, y, 32, 32))
-
-        return image
\ No newline at end of file
+        """Récupère une frame de la rangée de la bombe (surface partagée du cache)"""
+        return get_image(BOMB_SHEET, (x, 48 + y, 32, 15))
@@ -2,66 +2,65 @@
 import math
 import random
 
-from utils.animation import (
-    load_sprite_sheet,
-    load_directional_animations,
-    advance_animation,
-)
+from utils.animation import get_directional_animations
+
+FIREBALL_SHEET = './assets/sprites/effects/All_Fire_Bullet_Pixel_16x16.png'
+# Rangée du sprite sheet par direction (identique pour chaque orientation)
+FIREBALL_ROWS = {
+    'down': 2,
+    'left': 2,
+    'right': 2,
+    'up': 2,
+}
 
 
 class FireBall(pygame.sprite.Sprite):
+    countdown = 5000  # Délai (ms) entre deux tirs du joueur
+
+    @staticmethod
+    def load_assets():
+        """Animations partagées par toutes les boules de feu (chargées une seule fois)"""
+        return get_directional_animations(FIREBALL_SHEET, 16, 16, FIREBALL_ROWS)
+
     def __init__(self, x, y, direction, speed=6, spread_angle=30):
         super().__init__()
-        # Charger le sprite sheet de la boule de feu
-        self.sprite_sheet = load_sprite_sheet('./assets/sprites/effects/All_Fire_Bullet_Pixel_16x16.png')
         self.rect = pygame.Rect(x, y, 16, 16)
         self.pos = [x, y]
+        self.velocity = [0.0, 0.0]
 
-        self.speed = speed
-        self.frame_index = 0
         self.animation_speed = 0.2
-        self.current_direction = direction
         self.damage = 0.01
-        self.active = True
-        self.countdown = 5000
+        self.slow = 0.4  # Ralentissement du héros touché (fraction de vitesse retirée)
+        self.slow_duration = 1.0
+        self.danger = 1.0  # Danger ajouté à la danger map du héros à l'impact
         self.score = 10
+        self.max_age = 180  # Durée de vie maximale en ticks (3 secondes)
+
+        # Animations par direction, partagées via le cache d'assets
+        self.animations = FireBall.load_assets()
+        self.reset(x, y, direction, speed, spread_angle)
+
+    def reset(self, x, y, direction, speed=6, spread_angle=30, rng=None):
+        """Réinitialise la boule de feu pour un nouveau tir (réutilisation par le pool).
+
+        Le déplacement et l'animation sont ensuite gérés par le ProjectilePool.
+        rng : flux aléatoire du tireur pour la dispersion (module random par défaut).
+        """
+        self.pos[0] = x
+        self.pos[1] = y
+        self.rect.topleft = (int(x), int(y))
+        self.speed = speed
+        self.current_direction = direction
+        self.frame_index = 0
+        self.active = True
 
         # Determiner l'angle avec un petit cone aleatoire
         base_angle = {"up": -90, "down": 90, "left": 180, "right": 0}.get(direction, 0)
-        angle_variation = random.uniform(-spread_angle, spread_angle)
+        if rng is None:
+            rng = random
+        angle_variation = rng.uniform(-spread_angle, spread_angle)
         angle = math.radians(base_angle + angle_variation)
-        self.velocity = [math.cos(angle) * self.speed, math.sin(angle) * self.speed]
+        self.velocity[0] = math.cos(angle) * self.speed
+        self.velocity[1] = math.sin(angle) * self.speed
 
-        # Animations par direction (identiques pour chaque orientation)
-        self.animations = load_directional_animations(
-            self.sprite_sheet,
-            16,
-            16,
-            {
-                'down': 2,
-                'left': 2,
-                'right': 2,
-                'up': 2,
-            },
-        )
         self.image = self.animations[self.current_direction][0]
-
-    def update(self):
-        # Avancer
-        self.pos[0] += self.velocity[0]
-        self.pos[1] += self.velocity[1]
-        self.rect.topleft = (int(self.pos[0]), int(self.pos[1]))
-
-        # Animation
-        frames = self.animations[self.current_direction]
-        self.frame_index, self.image = advance_animation(
-            self.frame_index,
-            frames,
-            self.animation_speed,
-            True,
-        )
-
-        # Kill si trop loin de la zone active
-        if (self.pos[0] < -2000 or self.pos[0] > 20000 or
-            self.pos[1] < -2000 or self.pos[1] > 20000):
-            self.kill()
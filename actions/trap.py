@@ -1,24 +1,34 @@
 import pygame
 
+from utils.animation import get_image
+
+TRAP_SHEET = './traps/Bear_Trap.png'
+
 
 class Trap(pygame.sprite.Sprite):
+    @staticmethod
+    def load_assets():
+        """Charge les images du piège dans le cache (appelé au chargement du niveau)"""
+        get_image(TRAP_SHEET, (0, 0, 32, 32))
+
     def __init__(self, x, y):
         super().__init__()
         self.damage = 0.5
         self.pos = [x, y]
         self.active = True
         self.countdown = 10000
+        self.lifetime = 60000  # Durée de vie (ms) avant disparition s'il ne se déclenche pas
 
-        self.sprite_sheet = pygame.image.load('./traps/Bear_Trap.png')
         self.image = self.get_image(0, 0)
         self.rect = pygame.Rect(x, y, 32, 32)
         self.score = 10
-        self.stunt = 3
+        self.danger = 4.0  # Danger ajouté à la danger map du héros quand le piège se déclenche
+        self.stunt = 3  # Durée d'étourdissement (s)
+        self.burn = 0.0  # Pas de dégâts sur la durée
+        self.burn_duration = 0
 
 
 
     def get_image(self, x, y):
-        """Récupère une frame depuis le sprite sheet"""
-        image = pygame.Surface((32, 32), pygame.SRCALPHA)
-        image.blit(self.sprite_sheet, (0, 0), (x, y, 32, 32))
-        return image
\ No newline at end of file
+        """Récupère une frame du sprite sheet (surface partagée du cache)"""
+        return get_image(TRAP_SHEET, (x, y, 32, 32))
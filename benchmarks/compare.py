@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Compare deux fichiers de résultats de run_benchmarks.py (avant / après).
+
+    python benchmarks/compare.py avant.json apres.json
+    python benchmarks/compare.py avant.json apres.json --threshold 10
+
+Affiche, par scénario commun, ms/tick, p99 et allocations avant -> après avec
+l'écart relatif. Le code de sortie vaut 1 si un scénario ralentit (ms/tick)
+de plus de --threshold pour cent, ce qui permet de l'utiliser dans un script.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def change(before, after):
+    if before == 0:
+        return 0.0 if after == 0 else float("inf")
+    return (after - before) / before * 100.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare deux résultats de benchmarks")
+    parser.add_argument("before", help="JSON de référence")
+    parser.add_argument("after", help="JSON à comparer")
+    parser.add_argument("--threshold", type=float, default=5.0,
+                        help="ralentissement (%%) signalé comme régression (défaut : 5)")
+    args = parser.parse_args(argv)
+
+    before = load(args.before)
+    after = load(args.after)
+    print(f"avant : {before['meta'].get('revision')} ({before['meta'].get('date')})")
+    print(f"après : {after['meta'].get('revision')} ({after['meta'].get('date')})")
+    print()
+    print(f"{'scénario':<16} {'ms/tick':>19} {'écart':>8} {'p99 ms':>19} {'alloc Kio/tick':>21}")
+
+    regressions = []
+    for name, old in before["results"].items():
+        new = after["results"].get(name)
+        if new is None:
+            print(f"{name:<16} absent du second fichier")
+            continue
+        delta = change(old["ms_per_tick"], new["ms_per_tick"])
+        flag = ""
+        if delta > args.threshold:
+            flag = "  <- régression"
+            regressions.append(name)
+        elif delta < -args.threshold:
+            flag = "  <- gain"
+        print(f"{name:<16} {old['ms_per_tick']:8.3f} -> {new['ms_per_tick']:8.3f} {delta:+7.1f}% "
+              f"{old['p99_ms']:8.3f} -> {new['p99_ms']:8.3f} "
+              f"{old['alloc_kib_per_tick']:9.1f} -> {new['alloc_kib_per_tick']:9.1f}{flag}")
+    for name in after["results"]:
+        if name not in before["results"]:
+            print(f"{name:<16} nouveau scénario")
+
+    if regressions:
+        print(f"\n{len(regressions)} régression(s) au-delà de {args.threshold:.0f}% : {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
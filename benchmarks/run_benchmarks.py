@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Lance les scénarios de benchmarks/scenarios.py sans fenêtre et écrit un JSON.
+
+    python benchmarks/run_benchmarks.py -o bench.json
+    python benchmarks/run_benchmarks.py --only fireballs_1000 hero_crossing
+
+Pour chaque scénario : quelques ticks d'échauffement, une passe chronométrée
+(ms par tick : moyenne, p50, p99) puis une passe plus courte sous tracemalloc
+(pic de mémoire allouée pendant un tick, et blocs nets conservés par tick, qui
+trahissent les fuites). Comparer deux fichiers avec benchmarks/compare.py.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Les assets sont chargés en chemins relatifs depuis la racine du dépôt
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from scenarios import SCENARIOS, SCREEN_SIZE, SEED
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_ticks(step, ticks):
+    """Durée de chaque tick (ns)"""
+    samples = np.empty(ticks, dtype=np.int64)
+    clock = time.perf_counter_ns
+    for i in range(ticks):
+        start = clock()
+        step()
+        samples[i] = clock() - start
+    return samples
+
+
+def measure_allocations(step, ticks):
+    """(pic moyen alloué pendant un tick en Kio, blocs nets conservés par tick)"""
+    tracemalloc.start()
+    peaks = []
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(ticks):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        step()
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+    return sum(peaks) / len(peaks) / 1024, (blocks_after - blocks_before) / ticks
+
+
+def run_scenario(name, factory, ticks, alloc_ticks, warmup):
+    ticks = max(ticks, getattr(factory, "min_ticks", 0))
+    build_start = time.perf_counter()
+    step, metrics = factory()
+    build_s = time.perf_counter() - build_start
+
+    for _ in range(warmup):
+        step()
+    gc.collect()
+    samples = time_ticks(step, ticks) / 1e6
+    alloc_kib, net_blocks = measure_allocations(step, alloc_ticks)
+
+    result = {
+        "ticks": ticks,
+        "ms_per_tick": float(samples.mean()),
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p99_ms": float(np.percentile(samples, 99)),
+        "max_ms": float(samples.max()),
+        "alloc_kib_per_tick": alloc_kib,
+        "net_blocks_per_tick": net_blocks,
+        "setup_s": build_s,
+        "metrics": metrics,
+    }
+    print(f"{name:<16} {result['ms_per_tick']:8.3f} ms/tick  p50 {result['p50_ms']:7.3f}  "
+          f"p99 {result['p99_ms']:7.3f}  alloc {alloc_kib:7.1f} Kio/tick  net {net_blocks:+7.2f} blocs/tick")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de la simulation et du rendu")
+    parser.add_argument("-o", "--output", default="bench.json", help="fichier JSON de résultats")
+    parser.add_argument("--only", nargs="+", choices=list(SCENARIOS), help="scénarios à lancer")
+    parser.add_argument("--ticks", type=int, default=600, help="ticks chronométrés par scénario")
+    parser.add_argument("--alloc-ticks", type=int, default=120, help="ticks mesurés sous tracemalloc")
+    parser.add_argument("--warmup", type=int, default=60, help="ticks d'échauffement")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    names = args.only or list(SCENARIOS)
+    results = {}
+    for name in names:
+        results[name] = run_scenario(name, SCENARIOS[name], args.ticks, args.alloc_ticks, args.warmup)
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": SEED,
+            "ticks": args.ticks,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Résultats écrits dans {args.output}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Scénarios de benchmark (simulation et rendu), exécutés sur les pilotes SDL factices.
+
+Chaque scénario est une fabrique qui construit son état (toujours avec la même
+graine) et retourne une fonction step() exécutée une fois par tick mesuré,
+ainsi qu'un dictionnaire de métriques propres au scénario (rempli pendant
+l'exécution). Le script run_benchmarks.py chronomètre ces step().
+"""
+
+import math
+
+import pygame
+
+from actions.trap import Trap
+from game.formation_manager import FormationManager
+from game.game_manager import GameManager
+from game.projectile_pool import ProjectilePool
+from game.trap_manager import TrapManager
+
+SEED = 12345
+SCREEN_SIZE = (1024, 768)
+DIRECTIONS = ('up', 'down', 'left', 'right')
+
+
+def make_game(headless=True):
+    """GameManager prêt à simuler, dialogue d'introduction fermé"""
+    screen = pygame.display.get_surface() or pygame.display.set_mode(SCREEN_SIZE)
+    game_manager = GameManager(screen, headless=headless, seed=SEED)
+    game_manager.dialogue_manager.active = False
+    return game_manager
+
+
+def walkable_points(game_manager, count, rng):
+    """count centres de cellules praticables tirés avec rng (reproductible)"""
+    pathfinder = game_manager.pathfinder
+    cells = [(x, y) for y in range(pathfinder.height) for x in range(pathfinder.width)
+             if pathfinder.walkable[y * pathfinder.stride + x]]
+    size = game_manager.tmx_data.tilewidth
+    points = []
+    for _ in range(count):
+        cx, cy = rng.choice(cells)
+        points.append((cx * size + size // 2, cy * size + size // 2))
+    return points
+
+
+def game_tick():
+    """Tick complet de la simulation (headless), toutes phases confondues"""
+    game_manager = make_game()
+    metrics = {}
+
+    def step():
+        game_manager.update()
+        if game_manager.should_quit:
+            game_manager.reset_game()
+            game_manager.should_quit = False
+
+    return step, metrics
+
+
+def formation(count):
+    """FormationManager avec count subordonnés autour de l'allié (IA, physique, animation)"""
+    def factory():
+        game_manager = make_game()
+        manager = FormationManager(game_manager.ally_bot, game_manager.rng, count=count)
+        for subordinate in manager.get_subordinates():
+            subordinate.set_collision_objects(game_manager.collisions, game_manager.collision_index)
+            subordinate.set_trap_manager(game_manager.trap_manager)
+            subordinate.set_projectile_pool(game_manager.projectile_pool)
+            subordinate.set_game_clock(game_manager.clock)
+        ally = game_manager.ally_bot
+        metrics = {"subordinates": count}
+
+        def step():
+            game_manager.clock.step()
+            ally.update_ai()
+            ally.update_movement()
+            ally.update_animation()
+            manager.update_ai(game_manager.fireballs, game_manager.group)
+            manager.update_physics()
+            manager.update_animation()
+            game_manager.projectile_pool.update()
+            game_manager.trap_manager.update(game_manager.get_now())
+
+        return step, metrics
+    return factory
+
+
+def fireballs(count):
+    """count boules de feu en vol en permanence (déplacement, murs, héros, sprites visibles)"""
+    def factory():
+        game_manager = make_game()
+        pool = ProjectilePool(count, game_manager.collision_index,
+                              game_manager.tmx_data.width * game_manager.tmx_data.tilewidth,
+                              game_manager.tmx_data.height * game_manager.tmx_data.tileheight,
+                              pygame.sprite.Group(), pygame.sprite.Group(),
+                              rng=game_manager.rng.stream("bench_projectiles"))
+        rng = game_manager.rng.stream("bench_spawns")
+        spawn_points = walkable_points(game_manager, 4096, rng)
+        hero_rect = game_manager.bot.rect
+        view = pygame.Rect(0, 0, SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
+        view.center = hero_rect.center
+        metrics = {"fireballs": count, "respawned": 0}
+
+        def refill():
+            while pool.active_count < count:
+                x, y = rng.choice(spawn_points)
+                pool.spawn(x, y, rng.choice(DIRECTIONS))
+                metrics["respawned"] += 1
+
+        refill()
+        metrics["respawned"] = 0
+
+        def step():
+            pool.update()
+            pool.collide_rect(hero_rect)
+            pool.sync_sprites(view)
+            refill()
+
+        return step, metrics
+    return factory
+
+
+def hero_crossing():
+    """Le héros traverse toute la carte (200 tuiles) jusqu'à la sortie, puis recommence"""
+    game_manager = make_game()
+    bot = game_manager.bot
+    # L'allié est écarté de la carte : le héros ne s'arrête pas pour orbiter autour de lui
+    game_manager.ally_bot.position = [-10000.0, -10000.0]
+    spawn = (100.0, game_manager.tmx_data.height * game_manager.tmx_data.tileheight - 100.0)
+    metrics = {"crossings": 0, "ticks_to_goal": None}
+    state = {"ticks": 0}
+
+    def restart():
+        bot.position = [spawn[0], spawn[1]]
+        bot.rect.center = (int(spawn[0]), int(spawn[1]))
+        bot.set_state("path_following")
+        bot.plan_path()
+        state["ticks"] = 0
+
+    restart()
+
+    def step():
+        game_manager.clock.step()
+        bot.update_status()
+        bot.update_ai()
+        bot.update_movement()
+        bot.update_collisions()
+        state["ticks"] += 1
+        if game_manager.is_in_teleport_zone(bot.position[0], bot.position[1]):
+            metrics["crossings"] += 1
+            if metrics["ticks_to_goal"] is None:
+                metrics["ticks_to_goal"] = state["ticks"]
+            restart()
+
+    return step, metrics
+
+
+# Une traversée prend environ 2200 ticks : on en mesure au moins une complète
+hero_crossing.min_ticks = 2400
+
+
+def astar_spawn_exit():
+    """A* complet (GridPathfinder.find_path, lissage compris) du point d'apparition du héros à la sortie"""
+    game_manager = make_game()
+    pathfinder = game_manager.pathfinder
+    spawn = (100.0, game_manager.tmx_data.height * game_manager.tmx_data.tileheight - 100.0)
+    metrics = {"waypoints": len(pathfinder.find_path(spawn, game_manager.hero_goal))}
+
+    def step():
+        pathfinder.find_path(spawn, game_manager.hero_goal)
+
+    return step, metrics
+
+
+def planner_replan():
+    """Replanification du héros telle qu'en jeu (Bot.plan_path) : le héros avance d'une cellule
+    par tick le long de son chemin, un impact ajoute du danger là où il se trouve, puis
+    D* Lite applique les changements et recalcule le chemin depuis sa position"""
+    game_manager = make_game()
+    pathfinder = game_manager.pathfinder
+    planner = game_manager.hero_planner
+    danger_map = game_manager.danger_map
+    spawn = (100.0, game_manager.tmx_data.height * game_manager.tmx_data.tileheight - 100.0)
+    route = [pathfinder.cell_center(cx, cy)
+             for cx, cy in planner.plan(pathfinder.nearest_walkable(*pathfinder.cell_of(*spawn)))]
+    metrics = {"route_cells": len(route)}
+    state = {"tick": 0}
+
+    def step():
+        x, y = route[state["tick"] % len(route)]
+        state["tick"] += 1
+        danger_map.add_danger(x, y, 2.0)
+        planner.update_costs(danger_map.consume_changes())
+        planner.find_path((x, y))
+
+    return step, metrics
+
+
+def traps(count):
+    """count pièges armés sur la carte ; un rectangle de héros balaie la carte et interroge le registre"""
+    def factory():
+        game_manager = make_game()
+        manager = TrapManager(game_manager.tmx_data.tilewidth, game_manager.tmx_data.tileheight)
+        rng = game_manager.rng.stream("bench_traps")
+        for x, y in walkable_points(game_manager, count, rng):
+            trap = Trap(x - 16, y - 16)
+            trap.lifetime = 10 ** 9  # Les pièges s'accumulent sans expirer
+            manager.add(trap, 0)
+        map_height = game_manager.tmx_data.height * game_manager.tmx_data.tileheight
+        map_width = game_manager.tmx_data.width * game_manager.tmx_data.tilewidth
+        probe = pygame.Rect(0, 0, 32, 32)
+        metrics = {"traps": count, "hits": 0}
+        state = {"tick": 0}
+
+        def step():
+            tick = state["tick"]
+            state["tick"] = tick + 1
+            # Trajectoire en zigzag du bas vers le haut de la carte
+            probe.centery = map_height - (tick * 3) % map_height
+            probe.centerx = int(map_width / 2 + math.sin(tick / 30.0) * map_width / 3)
+            metrics["hits"] += len(manager.query_rect(probe))
+            manager.update(tick)
+
+        return step, metrics
+    return factory
+
+
+def render_frame():
+    """Image complète de GameManager.render (monde, minimap, UI, zone de mouvement)"""
+    game_manager = make_game(headless=False)
+    for _ in range(60):
+        game_manager.update()
+    metrics = {}
+
+    def step():
+        game_manager.render(0.5)
+
+    return step, metrics
+
+
+# Nom -> fabrique ; l'ordre est celui de l'exécution et du rapport
+SCENARIOS = {
+    "game_tick": game_tick,
+    "formation_10": formation(10),
+    "formation_100": formation(100),
+    "fireballs_100": fireballs(100),
+    "fireballs_1000": fireballs(1000),
+    "hero_crossing": hero_crossing,
+    "astar_spawn_exit": astar_spawn_exit,
+    "planner_replan": planner_replan,
+    "traps_100": traps(100),
+    "traps_5000": traps(5000),
+    "render_frame": render_frame,
+}
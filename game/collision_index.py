@@ -0,0 +1,81 @@
+"""
+Index spatial des objets de collision TMX.
+
+Les rectangles de collision sont rangés dans une grille uniforme (spatial hash)
+dont les cellules ont la taille d'une tuile : une requête ponctuelle ou
+rectangulaire ne teste que les rectangles des cellules qu'elle touche au lieu
+de parcourir toute la liste. Si une grille de marche est attachée, les
+cellules entièrement libres ou bloquées sont résolues en O(1) sans test.
+"""
+
+from game.walkability import FREE, BLOCKED
+
+
+class CollisionIndex:
+    """Spatial hash des rectangles de collision, construit une fois au chargement du niveau"""
+
+    def __init__(self, collision_objects, cell_width=32, cell_height=32):
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.walkability = None
+
+        # Rectangles stockés sous forme de tuples (x1, y1, x2, y2) pour des tests rapides
+        self.rects = [
+            (obj.x, obj.y, obj.x + obj.width, obj.y + obj.height)
+            for obj in collision_objects
+        ]
+
+        # Cellule (cx, cy) -> liste des rectangles qui la recouvrent
+        self.cells = {}
+        for rect in self.rects:
+            x1, y1, x2, y2 = rect
+            for cy in range(int(y1 // cell_height), int(y2 // cell_height) + 1):
+                for cx in range(int(x1 // cell_width), int(x2 // cell_width) + 1):
+                    self.cells.setdefault((cx, cy), []).append(rect)
+
+    def __len__(self):
+        return len(self.rects)
+
+    def set_walkability(self, walkability):
+        """Attache une WalkabilityGrid pour court-circuiter les cellules homogènes"""
+        self.walkability = walkability
+
+    def collides_point(self, x, y):
+        """Vérifie si le point (x, y) est dans un rectangle de collision (bords inclus)"""
+        if self.walkability is not None:
+            state = self.walkability.state_at(x, y)
+            if state == FREE:
+                return False
+            if state == BLOCKED:
+                return True
+        bucket = self.cells.get((int(x // self.cell_width), int(y // self.cell_height)))
+        if not bucket:
+            return False
+        for x1, y1, x2, y2 in bucket:
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return True
+        return False
+
+    def query_rect(self, x, y, width, height):
+        """Retourne les rectangles de collision qui chevauchent le rectangle donné"""
+        found = []
+        right = x + width
+        bottom = y + height
+        for cy in range(int(y // self.cell_height), int(bottom // self.cell_height) + 1):
+            for cx in range(int(x // self.cell_width), int(right // self.cell_width) + 1):
+                for rect in self.cells.get((cx, cy), ()):
+                    if (rect[0] < right and x < rect[2] and rect[1] < bottom and y < rect[3]
+                            and rect not in found):
+                        found.append(rect)
+        return found
+
+    def collides_rect(self, x, y, width, height):
+        """Vérifie si le rectangle donné chevauche au moins un rectangle de collision"""
+        right = x + width
+        bottom = y + height
+        for cy in range(int(y // self.cell_height), int(bottom // self.cell_height) + 1):
+            for cx in range(int(x // self.cell_width), int(right // self.cell_width) + 1):
+                for x1, y1, x2, y2 in self.cells.get((cx, cy), ()):
+                    if x1 < right and x < x2 and y1 < bottom and y < y2:
+                        return True
+        return False
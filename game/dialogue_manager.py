@@ -2,23 +2,64 @@ import pygame
 import json
 import os
 
+from utils.text_cache import get_font, render_text
+
 CHARACTER_SPRITE_MAP = {
     "Héro": "Hero",
     "Terreur du Crous": "BigBoss",
     "Brigand": "Brigand",
 }
 
+# Géométrie de la boîte de dialogue (relative à l'écran)
+BOX_MARGIN = 20
+BOX_HEIGHT = 200
+BOX_PADDING = 25
+SHADOW_OFFSET = 5
+PORTRAIT_FRAME = (32, 32)  # Première frame de la planche du personnage
+PORTRAIT_SCALE = 10
+INDICATOR_TEXT = "Appuyez sur ESPACE pour continuer..."
+
+
+class DialogueLine:
+    """Réplique mise en page une fois : nom et lignes rendus dans une seule surface.
+
+    line_rects donne la zone de chaque ligne dans la surface, char_offsets la
+    largeur cumulée des caractères de chaque ligne (pour l'effet machine à écrire).
+    """
+
+    def __init__(self, surface, name_height, line_rects, char_offsets):
+        self.surface = surface
+        self.name_height = name_height
+        self.line_rects = line_rects
+        self.char_offsets = char_offsets
+        self.char_count = sum(len(offsets) for offsets in char_offsets)
+
+
 class DialogueManager:
-    def __init__(self, sprite_folder="assets/sprites/player", font_path=None, line_font_size=28, character_font_size=36):
+    def __init__(self, sprite_folder="assets/sprites/player", font_path=None, line_font_size=28, character_font_size=36,
+                 typewriter_speed=None):
         # Police pour le texte
-        self.font = pygame.font.Font(font_path, line_font_size)
-        self.character_font = pygame.font.Font(font_path, character_font_size)
+        self.font_path = font_path
+        self.character_font_size = character_font_size
+        self.font = get_font(font_path, line_font_size)
+        self.character_font = get_font(font_path, character_font_size)
 
         self.dialogues = {}
         self.active_scene = None
         self.current_line = 0
         self.active = False
 
+        # Mise en page pré-calculée : (scène, réplique, taille d'écran) -> DialogueLine
+        self.layouts = {}
+        self.box_cache = {}  # taille d'écran -> boîte (ombre, cadre, indicateur)
+        self.portraits = {}  # personnage -> portrait agrandi (ou None)
+
+        # Effet machine à écrire (caractères par seconde, None = texte affiché d'un coup).
+        # Purement visuel : l'horloge murale ne décide jamais du passage d'une réplique,
+        # next_line() avance toujours (replays déterministes)
+        self.typewriter_speed = typewriter_speed
+        self.line_started_ms = 0
+
         # Chargement des sprites
         self.sprites = {}
         self.sprite_folder = sprite_folder
@@ -51,11 +92,15 @@ class DialogueManager:
                 self.dialogues.update(json.load(f))
 
     def start_scene(self, scene_id):
-        """Lance une séquence scénarisée (ex: 'scene_intro')"""
+        """Lance une séquence scénarisée (ex: 'scene_intro') et met en page toutes ses répliques"""
         if scene_id in self.dialogues:
             self.active_scene = scene_id
             self.current_line = 0
             self.active = True
+            self.line_started_ms = pygame.time.get_ticks()
+            screen = pygame.display.get_surface()
+            if screen is not None:
+                self.prepare_scene(scene_id, screen.get_size())
         else:
             print(f"[DialogueManager] ❌ Aucune scène trouvée pour {scene_id}")
 
@@ -63,6 +108,7 @@ class DialogueManager:
         if not self.active:
             return
         self.current_line += 1
+        self.line_started_ms = pygame.time.get_ticks()
         if self.current_line >= len(self.dialogues[self.active_scene]):
             self.active = False
             self.active_scene = None
@@ -84,79 +130,144 @@ class DialogueManager:
             lines.append(current_line.strip())
         return lines
 
-    def draw(self, screen):
-        if not self.active:
-            return
+    def prepare_scene(self, scene_id, screen_size):
+        """Met en page et rend toutes les répliques d'une scène pour cette taille d'écran"""
+        for index in range(len(self.dialogues.get(scene_id, ()))):
+            self.get_layout(scene_id, index, screen_size)
+        for entry in self.dialogues.get(scene_id, ()):
+            self.get_portrait(entry.get("character", "???"))
+
+    def get_layout(self, scene_id, index, screen_size):
+        """Mise en page de la réplique (construite au premier appel puis réutilisée)"""
+        key = (scene_id, index, screen_size)
+        layout = self.layouts.get(key)
+        if layout is None:
+            entry = self.dialogues[scene_id][index]
+            layout = self.layouts[key] = self._layout_line(
+                entry.get("character", "???"), entry.get("line", ""), screen_size
+            )
+        return layout
+
+    def _layout_line(self, character, line, screen_size):
+        """Découpe la réplique et rend le nom et les lignes dans une surface transparente"""
+        text_area_width = screen_size[0] - 2 * BOX_MARGIN - 2 * BOX_PADDING
+        name_surface = render_text(character + " :", self.character_font_size, (255, 215, 0), self.font_path)
 
-        dialogue_entry = self.dialogues[self.active_scene][self.current_line]
-        character = dialogue_entry.get("character", "???")
-        line = dialogue_entry.get("line", "")
-
-
-        screen_width, screen_height = screen.get_size()
-        
-        # Zone de dialogue
-        padding = 25
-        box_height = 200
-        box_width = screen_width - 40
-        text_area_width = box_width - 2 * padding
-        
-        box_x = 20
-        box_y = screen_height - box_height - 20
-        
-        dialogue_rect = pygame.Rect(box_x, box_y, box_width, box_height)
-        
-        # Ombre
-        shadow_rect = dialogue_rect.copy()
-        shadow_rect.x += 5
-        shadow_rect.y += 5
-        pygame.draw.rect(screen, (50, 50, 50), shadow_rect, border_radius=15)
-        
-        # Boîte principale
-        pygame.draw.rect(screen, (30, 30, 40), dialogue_rect, border_radius=15)
-        pygame.draw.rect(screen, (100, 100, 120), dialogue_rect, 3, border_radius=15)
-
-        # --- Affichage du sprite du personnage ---
-        if not character == "Narrator":
-            sprite_key = CHARACTER_SPRITE_MAP.get(character, character)
-            sprite_sheet = self.sprites.get(sprite_key)
-            
+        wrapped_lines = self.wrap_text(line, self.font, text_area_width)
+        line_surfaces = [self.font.render(text, True, (255, 255, 255)) for text in wrapped_lines]
+        height = name_surface.get_height() + 15 + sum(surface.get_height() + 5 for surface in line_surfaces)
+        width = max([name_surface.get_width()] + [surface.get_width() for surface in line_surfaces])
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.blit(name_surface, (0, 0))
+
+        line_rects = []
+        char_offsets = []
+        y = name_surface.get_height() + 15
+        for text, line_surface in zip(wrapped_lines, line_surfaces):
+            surface.blit(line_surface, (0, y))
+            line_rects.append(pygame.Rect(0, y, line_surface.get_width(), line_surface.get_height()))
+            # Largeur cumulée après chaque caractère (avances de la police)
+            offsets = []
+            x = 0
+            for metrics in self.font.metrics(text):
+                x += metrics[4] if metrics else 0
+                offsets.append(x)
+            char_offsets.append(offsets)
+            y += line_surface.get_height() + 5
+        return DialogueLine(surface, name_surface.get_height(), line_rects, char_offsets)
+
+    def get_box(self, screen_size):
+        """Boîte de dialogue (ombre, fond, bordure, indicateur) rendue une fois par taille d'écran"""
+        box = self.box_cache.get(screen_size)
+        if box is None:
+            box_width = screen_size[0] - 2 * BOX_MARGIN
+            box = pygame.Surface((box_width + SHADOW_OFFSET, BOX_HEIGHT + SHADOW_OFFSET), pygame.SRCALPHA)
+            dialogue_rect = pygame.Rect(0, 0, box_width, BOX_HEIGHT)
+            # Ombre
+            pygame.draw.rect(box, (50, 50, 50), dialogue_rect.move(SHADOW_OFFSET, SHADOW_OFFSET), border_radius=15)
+            # Boîte principale
+            pygame.draw.rect(box, (30, 30, 40), dialogue_rect, border_radius=15)
+            pygame.draw.rect(box, (100, 100, 120), dialogue_rect, 3, border_radius=15)
+            # Indicateur
+            indicator_surface = render_text(INDICATOR_TEXT, 22, (200, 200, 200))
+            box.blit(indicator_surface, (box_width - indicator_surface.get_width() - BOX_PADDING,
+                                         BOX_HEIGHT - indicator_surface.get_height() - 12))
+            self.box_cache[screen_size] = box
+        return box
+
+    def get_portrait(self, character):
+        """Première frame du personnage agrandie, mise en cache (None pour le narrateur)"""
+        if character in self.portraits:
+            return self.portraits[character]
+        portrait = None
+        if character != "Narrator":
+            sprite_sheet = self.sprites.get(CHARACTER_SPRITE_MAP.get(character, character))
             if sprite_sheet:
-                # Découpage de la première frame (ex: 16x16 ou 32x32 selon ton sheet)
-                FRAME_WIDTH, FRAME_HEIGHT = 32, 32  # ⚠️ adapte à la taille de tes sprites
-                rect = pygame.Rect(0, 0, FRAME_WIDTH, FRAME_HEIGHT)
-                first_frame = sprite_sheet.subsurface(rect)
+                frame_width, frame_height = PORTRAIT_FRAME
+                first_frame = sprite_sheet.subsurface(pygame.Rect(0, 0, frame_width, frame_height))
+                portrait = pygame.transform.scale(
+                    first_frame, (frame_width * PORTRAIT_SCALE, frame_height * PORTRAIT_SCALE)
+                )
+        self.portraits[character] = portrait
+        return portrait
 
-                # Agrandir le sprite (par ex x6)
-                sprite = pygame.transform.scale(first_frame, (FRAME_WIDTH * 10, FRAME_HEIGHT * 10))
+    def _revealed_chars(self):
+        """Nombre de caractères déjà affichés par l'effet machine à écrire (dessin uniquement)"""
+        elapsed_ms = pygame.time.get_ticks() - self.line_started_ms
+        return int(elapsed_ms * self.typewriter_speed / 1000)
 
-                # Position : centré au-dessus de la boîte de dialogue
-                sprite_x = box_x + 40
-                sprite_y = box_y - sprite.get_height() - 20
-                screen.blit(sprite, (sprite_x, sprite_y))
+    def _current_layout_chars(self):
+        screen = pygame.display.get_surface()
+        if screen is None:
+            return 0
+        return self.get_layout(self.active_scene, self.current_line, screen.get_size()).char_count
 
+    def draw_state(self):
+        """Ce qui détermine l'image du dialogue : elle ne change que si cet état change"""
+        if not self.active:
+            return None
+        revealed = None
+        if self.typewriter_speed:
+            revealed = min(self._revealed_chars(), self._current_layout_chars())
+        return self.active_scene, self.current_line, revealed
 
+    def draw(self, screen):
+        """Dessine la réplique courante : portrait, boîte et texte pré-rendus (quelques blits).
 
-        # Nom du personnage
-        character_surface = self.character_font.render(character + " :", True, (255, 215, 0))
-        character_x = box_x + padding
-        character_y = box_y + 15
-        screen.blit(character_surface, (character_x, character_y))
-        
-        # Texte
-        wrapped_lines = self.wrap_text(line, self.font, text_area_width)
-        text_x = box_x + padding
-        text_y = character_y + character_surface.get_height() + 15
-        
-        for wrapped_line in wrapped_lines:
-            line_surface = self.font.render(wrapped_line, True, (255, 255, 255))
-            screen.blit(line_surface, (text_x, text_y))
-            text_y += line_surface.get_height() + 5
-        
-        # Indicateur
-        indicator_text = "Appuyez sur ESPACE pour continuer..."
-        indicator_surface = pygame.font.Font(None, 22).render(indicator_text, True, (200, 200, 200))
-        indicator_x = box_x + box_width - indicator_surface.get_width() - padding
-        indicator_y = box_y + box_height - indicator_surface.get_height() - 12
-        
-        screen.blit(indicator_surface, (indicator_x, indicator_y))
+        Retourne le rectangle couvert (portrait compris), None si aucun dialogue n'est actif.
+        """
+        if not self.active:
+            return None
+
+        screen_size = screen.get_size()
+        character = self.dialogues[self.active_scene][self.current_line].get("character", "???")
+        layout = self.get_layout(self.active_scene, self.current_line, screen_size)
+
+        box_x = BOX_MARGIN
+        box_y = screen_size[1] - BOX_HEIGHT - BOX_MARGIN
+
+        # Portrait au-dessus de la boîte de dialogue
+        portrait = self.get_portrait(character)
+        covered = screen.blit(self.get_box(screen_size), (box_x, box_y))
+        if portrait is not None:
+            covered = covered.union(screen.blit(portrait, (box_x + 40, box_y - portrait.get_height() - 20)))
+
+        text_x = box_x + BOX_PADDING
+        text_y = box_y + 15
+        if not self.typewriter_speed:
+            screen.blit(layout.surface, (text_x, text_y))
+            return covered
+
+        # Machine à écrire : nom entier, puis chaque ligne découpée à la largeur déjà révélée
+        screen.blit(layout.surface, (text_x, text_y), pygame.Rect(0, 0, layout.surface.get_width(), layout.name_height))
+        remaining = self._revealed_chars()
+        for rect, offsets in zip(layout.line_rects, layout.char_offsets):
+            if remaining <= 0:
+                break
+            if remaining >= len(offsets):
+                area = rect
+            else:
+                area = pygame.Rect(rect.x, rect.y, offsets[remaining - 1], rect.height)
+            screen.blit(layout.surface, (text_x + area.x, text_y + area.y), area)
+            remaining -= len(offsets)
+        return covered
@@ -1,30 +1,142 @@
-class EventBus:
-    """Mini bus d'événements (pub/sub) très simple.
+import sys
+import time
+import traceback
+
+
+class Event:
+    """Enregistrement d'événement réutilisable (pris dans le pool de l'EventBus).
 
-    - on(event, handler): s'abonner
-    - off(event, handler): se désabonner
-    - emit(event, **data): émettre
+    Les valeurs sont rangées dans quatre emplacements positionnels a, b, c, d,
+    nommés par les champs du type (voir EventBus.fields). Un handler ne doit
+    pas garder l'objet : il retourne au pool après la distribution.
     """
 
+    __slots__ = ("type", "tick", "a", "b", "c", "d")
+
     def __init__(self):
-        self._handlers = {}
+        self.type = 0
+        self.tick = 0
+        self.a = self.b = self.c = self.d = None
+
+
+class EventBus:
+    """Bus d'événements (pub/sub) typé et différé.
+
+    - register(name, fields): déclare un type d'événement, retourne son id entier
+    - on(event_id, handler) / off(event_id, handler): (dés)abonnement, handler(event)
+    - emit(event_id, a, b, c, d): met l'événement en file (aucun handler appelé)
+    - dispatch(): distribue toute la file, une fois par tick (système "events")
+
+    Un emit sans abonné ne coûte qu'un test ; sinon il prend un enregistrement
+    dans le pool au lieu d'allouer un dict. Les exceptions des handlers sont
+    comptées par type (errors) et la première de chaque type est affichée ;
+    avec raise_errors=True elles remontent (débogage).
+    """
+
+    POOL_SIZE = 256
+
+    def __init__(self, clock=None, raise_errors=False):
+        self.clock = clock  # GameClock : tick de l'émission enregistré dans l'événement
+        self.raise_errors = raise_errors
+        self.names = []
+        self.fields = []
+        self._handlers = []
+        self._ids = {}
+        self._queue = []
+        self._pool = [Event() for _ in range(self.POOL_SIZE)]
+
+        # Statistiques
+        self.errors = []        # Exceptions levées par les handlers, par type
+        self.handler_ns = []    # Temps cumulé passé dans les handlers, par type
+        self.dispatched = 0     # Événements distribués depuis le début
+        self.last_dispatch_ns = 0
+        self.last_dispatch_count = 0
+
+    def register(self, name, fields=()):
+        """Déclare un type d'événement (au plus 4 champs) ; retourne son id"""
+        if name in self._ids:
+            return self._ids[name]
+        if len(fields) > 4:
+            raise ValueError(f"Trop de champs pour l'événement {name}: {fields}")
+        event_id = len(self.names)
+        self._ids[name] = event_id
+        self.names.append(name)
+        self.fields.append(tuple(fields))
+        self._handlers.append([])
+        self.errors.append(0)
+        self.handler_ns.append(0)
+        return event_id
+
+    def id_of(self, name):
+        return self._ids[name]
+
+    def on(self, event_id, handler):
+        self._handlers[event_id].append(handler)
+
+    def off(self, event_id, handler):
+        try:
+            self._handlers[event_id].remove(handler)
+        except ValueError:
+            pass
 
-    def on(self, event_name, handler):
-        self._handlers.setdefault(event_name, []).append(handler)
+    def emit(self, event_id, a=None, b=None, c=None, d=None):
+        if not self._handlers[event_id]:
+            return
+        event = self._pool.pop() if self._pool else Event()
+        event.type = event_id
+        event.tick = self.clock.ticks if self.clock is not None else 0
+        event.a = a
+        event.b = b
+        event.c = c
+        event.d = d
+        self._queue.append(event)
 
-    def off(self, event_name, handler):
-        if event_name in self._handlers:
-            try:
-                self._handlers[event_name].remove(handler)
-            except ValueError:
-                pass
+    def as_dict(self, event):
+        """Champs nommés d'un événement (pour les journaux)"""
+        values = (event.a, event.b, event.c, event.d)
+        return dict(zip(self.fields[event.type], values))
 
-    def emit(self, event_name, **data):
-        for handler in self._handlers.get(event_name, []):
-            try:
-                handler(data)
-            except Exception:
-                # Ne pas faire planter le jeu si un handler échoue
-                pass
+    def dispatch(self):
+        """Distribue les événements en file, dans l'ordre d'émission"""
+        queue = self._queue
+        if not queue:
+            self.last_dispatch_ns = 0
+            self.last_dispatch_count = 0
+            return
+        # Les handlers peuvent émettre : ces événements-là partent au prochain dispatch
+        self._queue = []
+        clock_ns = time.perf_counter_ns
+        start = clock_ns()
+        handlers = self._handlers
+        handler_ns = self.handler_ns
+        pool = self._pool
+        for event in queue:
+            event_id = event.type
+            before = clock_ns()
+            for handler in handlers[event_id]:
+                try:
+                    handler(event)
+                except Exception:
+                    self.errors[event_id] += 1
+                    if self.raise_errors:
+                        raise
+                    if self.errors[event_id] == 1:
+                        self._report_error(event_id)
+            handler_ns[event_id] += clock_ns() - before
+            event.a = event.b = event.c = event.d = None
+            pool.append(event)
+        self.dispatched += len(queue)
+        self.last_dispatch_count = len(queue)
+        self.last_dispatch_ns = clock_ns() - start
 
+    def _report_error(self, event_id):
+        """Affiche la première erreur d'un type (les suivantes sont seulement comptées)"""
+        print(f"[EventBus] ❌ Erreur dans un handler de {self.names[event_id]}:", file=sys.stderr)
+        traceback.print_exc()
 
+    def clear(self):
+        """Oublie les événements en file (sans les distribuer)"""
+        for event in self._queue:
+            event.a = event.b = event.c = event.d = None
+            self._pool.append(event)
+        self._queue = []
@@ -0,0 +1,32 @@
+"""
+Types d'événements de jeu publiés sur l'EventBus du GameManager.
+
+Les ids sont des constantes entières (index d'enregistrement) ; chaque type
+nomme au plus quatre champs, rangés dans les emplacements a, b, c, d de
+l'événement, dans cet ordre.
+"""
+
+TRAP_PLACED = 0       # kind, x, y
+TRAP_TRIGGERED = 1    # kind, x, y
+HERO_HIT = 2          # cause, percentage
+HERO_DEATH = 3        # cause, percentage, roll
+COINS_CHANGE = 4      # delta, total, reason
+A_STAR_PATH_HASH = 5  # hash, length
+HERO_ACTION = 6       # action, x, y
+
+GAME_EVENTS = (
+    (TRAP_PLACED, "trap_placed", ("kind", "x", "y")),
+    (TRAP_TRIGGERED, "trap_triggered", ("kind", "x", "y")),
+    (HERO_HIT, "hero_hit", ("cause", "percentage")),
+    (HERO_DEATH, "hero_death", ("cause", "percentage", "roll")),
+    (COINS_CHANGE, "coins_change", ("delta", "total", "reason")),
+    (A_STAR_PATH_HASH, "a_star_path_hash", ("hash", "length")),
+    (HERO_ACTION, "hero_action", ("action", "x", "y")),
+)
+
+
+def register_game_events(event_bus):
+    """Déclare les événements de jeu sur un bus neuf (les ids doivent correspondre)"""
+    for event_id, name, fields in GAME_EVENTS:
+        if event_bus.register(name, fields) != event_id:
+            raise ValueError(f"Id inattendu pour l'événement {name}")
@@ -2,8 +2,10 @@ import math
 from Allierbot.subordinate_bot import SubordinateBot
 
 class FormationManager:
-    def __init__(self, leader):
+    def __init__(self, leader, rng_service=None, count=10):
         self.leader = leader
+        self.count = count  # Nombre de subordonnés créés
+        self.rng_service = rng_service  # Fournit un flux aléatoire à chaque subordonné
         self.subordinates = []
         self.formation_radius = 60  # Distance du leader
         self.formation_type = 'circle'  # Type de formation
@@ -17,7 +19,7 @@ class FormationManager:
             return
         
         leader_pos = self.leader.get_position()
-        num_subordinates = 10
+        num_subordinates = self.count
         
         # Calculer les angles pour une répartition équilibrée en cercle
         angle_step = (2 * math.pi) / num_subordinates
@@ -30,8 +32,9 @@ class FormationManager:
             x = leader_pos[0] + math.cos(angle) * self.formation_radius
             y = leader_pos[1] + math.sin(angle) * self.formation_radius
             
-            # Créer le subordonné
-            subordinate = SubordinateBot(x, y, self.leader, angle, self.formation_radius)
+            # Créer le subordonné (avec son propre flux aléatoire)
+            rng = self.rng_service.stream(f"subordinate:{i}") if self.rng_service else None
+            subordinate = SubordinateBot(x, y, self.leader, angle, self.formation_radius, rng=rng)
             self.subordinates.append(subordinate)
     
     def update_formation(self, fireballs_group=None, group=None):
@@ -75,9 +78,27 @@ class FormationManager:
         return sprite_group
     
     def update(self, fireballs_group=None, group=None):
-        """Met à jour le gestionnaire de formation"""
+        """Met à jour le gestionnaire de formation (toutes les phases d'un coup)"""
         self.adapt_to_leader_movement()
         self.update_formation(fireballs_group, group)
+
+    def update_ai(self, fireballs_group=None, group=None):
+        """Phase IA : ajuste la formation et laisse chaque subordonné choisir une action"""
+        self.adapt_to_leader_movement()
+        if fireballs_group is None or group is None:
+            return
+        for subordinate in self.subordinates:
+            subordinate.handle_random_action(fireballs_group, group)
+
+    def update_physics(self):
+        """Phase physique : déplace les subordonnés en formation (avec séparation)"""
+        for subordinate in self.subordinates:
+            subordinate.update_formation_movement(self.subordinates)
+
+    def update_animation(self):
+        """Phase animation : synchronise les sprites des subordonnés"""
+        for subordinate in self.subordinates:
+            subordinate.update_animation()
     
     def change_formation_type(self, formation_type):
         """Change le type de formation (pour extensions futures)"""
@@ -0,0 +1,104 @@
+"""
+Horloge de simulation à pas fixe.
+
+La simulation avance par ticks de durée constante (TICK_MS), indépendamment
+de la cadence d'affichage : chaque image ajoute son temps réel à un
+accumulateur, et autant de ticks que l'accumulateur en contient sont exécutés.
+Le reste (alpha, entre 0 et 1) sert à interpoler l'affichage entre les deux
+derniers états simulés. Le jeu tourne donc à la même vitesse, et l'IA coûte
+la même chose, que l'écran soit rafraîchi à 30 ou à 144 Hz.
+
+Tous les minuteurs du jeu (cadence de tir, durée de vie des pièges, délai de
+fin de niveau...) lisent now_ms, le temps simulé : ils s'arrêtent quand la
+simulation est en pause (dialogue) et restent reproductibles.
+"""
+
+TICK_RATE = 60                  # Ticks de simulation par seconde
+TICK_MS = 1000.0 / TICK_RATE    # Durée d'un tick (ms)
+MAX_STEPS_PER_FRAME = 5         # Au-delà, le retard est abandonné (évite la spirale de la mort)
+SNAP_DISTANCE = 64              # Déplacement (px) en un tick au-delà duquel on n'interpole pas (téléportation)
+
+
+class GameClock:
+    """Accumulateur de temps réel et compteur de ticks, possédé par le GameManager"""
+
+    def __init__(self, tick_rate=TICK_RATE, max_steps=MAX_STEPS_PER_FRAME):
+        self.tick_rate = tick_rate
+        self.tick_ms = 1000.0 / tick_rate
+        self.max_steps = max_steps
+        self.ticks = 0
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0  # Temps réel abandonné quand la simulation prend trop de retard
+
+    @property
+    def now_ms(self):
+        """Temps simulé écoulé depuis le début (ms)"""
+        return int(self.ticks * self.tick_ms)
+
+    @property
+    def alpha(self):
+        """Fraction du tick suivant déjà écoulée, pour l'interpolation du rendu"""
+        return min(1.0, self.accumulator / self.tick_ms)
+
+    def advance(self, frame_ms):
+        """Ajoute le temps réel d'une image ; retourne le nombre de ticks à simuler"""
+        self.accumulator += frame_ms
+        steps = int(self.accumulator // self.tick_ms)
+        if steps > self.max_steps:
+            self.dropped_ms += (steps - self.max_steps) * self.tick_ms
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.tick_ms
+        return steps
+
+    def step(self):
+        """Compte un tick simulé (appelé une fois par mise à jour du jeu)"""
+        self.ticks += 1
+
+    def pause(self):
+        """Oublie le temps accumulé (simulation suspendue, ex : dialogue)"""
+        self.accumulator = 0.0
+
+
+class RenderInterpolator:
+    """Positions d'affichage interpolées entre les deux derniers ticks.
+
+    snapshot() est appelé avant chaque tick pour mémoriser l'état précédent ;
+    apply(alpha) place les rects des sprites entre cet état et l'état courant
+    le temps du rendu, puis restore() remet les positions simulées.
+    """
+
+    def __init__(self, sprites=()):
+        self.sprites = list(sprites)
+        self._previous = {}
+        self._current = {}
+
+    def track(self, sprite):
+        """Ajoute un sprite à interpoler"""
+        self.sprites.append(sprite)
+
+    def snapshot(self):
+        """Mémorise la position des sprites avant un tick"""
+        self._previous = {sprite: sprite.rect.topleft for sprite in self.sprites}
+
+    def apply(self, alpha):
+        """Place chaque sprite à sa position interpolée (à appeler juste avant le rendu)"""
+        self._current = {}
+        for sprite in self.sprites:
+            previous = self._previous.get(sprite)
+            if previous is None:
+                continue
+            x, y = sprite.rect.topleft
+            self._current[sprite] = (x, y)
+            dx = x - previous[0]
+            dy = y - previous[1]
+            if abs(dx) > SNAP_DISTANCE or abs(dy) > SNAP_DISTANCE:
+                continue
+            sprite.rect.topleft = (round(previous[0] + dx * alpha), round(previous[1] + dy * alpha))
+
+    def restore(self):
+        """Remet les positions simulées après le rendu"""
+        for sprite, topleft in self._current.items():
+            sprite.rect.topleft = topleft
+        self._current = {}
@@ -8,12 +8,27 @@ import pygame
 import os
 import pytmx
 import pyscroll
-import random
 
-from actions.actions import TAB_ACTION
 from actions.bomb import Bomb
 from actions.trap import Trap
 from game.dialogue_manager import DialogueManager
+from game.event_bus import EventBus
+from game import events
+from game.game_clock import GameClock, RenderInterpolator
+from game.rng import RandomService
+from game.replay import (
+    KeyMask, input_mask,
+    TRAP_PLACED, FIREBALL_FIRED, HERO_HIT, TELEPORT, TRAP_KIND, BOMB_KIND, FIREBALL_KIND,
+)
+from game.collision_index import CollisionIndex
+from game.trap_manager import TrapManager
+from game.projectile_pool import ProjectilePool
+from game.status_effects import SLOW, STUN
+from game.scheduler import SystemScheduler, INPUT, AI, PHYSICS, COLLISIONS, ANIMATION, RENDER
+from game.walkability import WalkabilityGrid
+from game.map_chunks import MapChunks, ChunkedRenderer
+from hero_bot.pathfinding import GridPathfinder, IncrementalPlanner
+from hero_bot.danger_map import DangerMap
 from actions.fire_ball import FireBall
 from player.player import Player
 from hero_bot.bot import Bot
@@ -23,19 +38,47 @@ from game.formation_manager import FormationManager
 from interface.UIManager import UIManager
 from game.music_game import MusicGame
 from interface.movement_zone_renderer import MovementZoneRenderer
+from interface.profiler_overlay import ProfilerOverlay
+from interface.presenter import Presenter
+from utils.profiler import Profiler
+from utils.text_cache import render_text
 
 
 class GameManager:
     """Gestionnaire principal du jeu"""
     
-    def __init__(self, screen):
-        """Initialisation du gestionnaire de jeu"""
+    def __init__(self, screen, headless=False, seed=None):
+        """Initialisation du gestionnaire de jeu
+
+        headless : simulation seule (pilotes SDL factices) ; ni rendu, ni minimap,
+        ni son, ni systèmes d'affichage dans le scheduler.
+        seed : graine maîtresse des flux aléatoires (tirée au hasard si absente) ;
+        même graine et mêmes entrées donnent la même partie.
+        """
         self.screen = screen
+        self.headless = headless
         self.width, self.height = screen.get_size()
         
+        # Horloge de simulation à pas fixe : tous les minuteurs du jeu lisent son temps
+        self.clock = GameClock()
+        
+        # Flux aléatoires déterministes, un par entité, dérivés d'une seule graine
+        self.rng = RandomService(seed)
+        self.seed = self.rng.seed
+        self.game_rng = self.rng.stream("game")
+        
+        # Bus d'événements de jeu (télémétrie, effets) : file distribuée une fois par tick
+        self.event_bus = EventBus(self.clock)
+        events.register_game_events(self.event_bus)
+        
+        # Replays : enregistrement des entrées/événements, ou rejeu d'un fichier
+        self.replay_recorder = None
+        self.replay_player = None
+        
         # Variables pour le chargement de map
         self.map_loaded = False
         self.group = None
+        self.map_layer = None
         self.tmx_data = None
         self.error_message = None
 
@@ -44,12 +87,14 @@ class GameManager:
 
         # Initialisation du niveau
         self._init_level()
-        self.group.draw(self.screen)
+        if not headless:
+            self.group.draw(self.screen)
         player_position = self.spawn_position
         self.player = Player(player_position.x, player_position.y)
 
         self.player = Player(player_position.x, player_position.y)
-        self.player.set_audio(self.music)
+        if not headless:
+            self.player.set_audio(self.music)
 
         self.group.add(self.player)
         self.dialogue_manager = DialogueManager()
@@ -63,7 +108,7 @@ class GameManager:
         # Créer le bot allié avec position initiale spécifique
         ally_spawn_x = 786.67
         ally_spawn_y = 5900.67
-        self.ally_bot = AllyBot(ally_spawn_x, ally_spawn_y, self.player)
+        self.ally_bot = AllyBot(ally_spawn_x, ally_spawn_y, self.player, rng=self.rng.stream("ally"))
         self.group.add(self.ally_bot)
         self.percentage = 50.0  # Pourcentage initial de 50%
         self.score = 0
@@ -90,6 +135,17 @@ class GameManager:
             'player': (651.67, 284.67)  # Position centrale entre les deux bots
         }
         
+        # Objectif du héros : le centre de la zone de téléportation (sortie du niveau)
+        self.hero_goal = (
+            (self.teleport_zone['x1'] + self.teleport_zone['x2']) / 2,
+            (self.teleport_zone['y1'] + self.teleport_zone['y2']) / 2,
+        )
+
+        # Planificateur incrémental (D* Lite) du héros : la recherche part de la sortie
+        # et n'est mise à jour que sur les cellules dont le danger a changé
+        goal_cell = self.pathfinder.nearest_walkable(*self.pathfinder.cell_of(*self.hero_goal))
+        self.hero_planner = IncrementalPlanner(self.pathfinder, goal_cell) if goal_cell else None
+        
         # Flag pour éviter les téléportations multiples
         self.teleported = False
         
@@ -99,7 +155,7 @@ class GameManager:
         self.player.set_ally_bot(self.ally_bot)
         
         # Créer le gestionnaire de formation avec 5 subordonnés
-        self.formation_manager = FormationManager(self.ally_bot)
+        self.formation_manager = FormationManager(self.ally_bot, self.rng)
         
         # Ajouter tous les subordonnés au groupe de sprites
         for subordinate in self.formation_manager.get_subordinates():
@@ -108,7 +164,7 @@ class GameManager:
         # Créer le bot qui suit le joueur - spawn en bas à gauche de la carte
         bot_spawn_x = 100  # Position proche du bord gauche
         bot_spawn_y = (self.tmx_data.height * self.tmx_data.tileheight) - 100  # Position proche du bord bas
-        self.bot = Bot(bot_spawn_x, bot_spawn_y, self.ally_bot, self)  # Le bot suit maintenant l'ally_bot
+        self.bot = Bot(bot_spawn_x, bot_spawn_y, self.ally_bot, self, rng=self.rng.stream("hero"))  # Le bot suit maintenant l'ally_bot
         self.group.add(self.bot)
         
         # Établir la référence bidirectionnelle entre ally_bot et bot pour la détection de proximité
@@ -118,15 +174,46 @@ class GameManager:
         self.ally_bot.set_hero_bot_reference(self.bot)
         
         # Configurer les objets de collision pour tous les bots
-        self.ally_bot.set_collision_objects(self.collisions)
-        self.bot.set_collision_objects(self.collisions)
+        self.ally_bot.set_collision_objects(self.collisions, self.collision_index)
+        self.bot.set_collision_objects(self.collisions, self.collision_index)
         
         # Configurer les objets de collision pour tous les subordonnés
         for subordinate in self.formation_manager.get_subordinates():
-            subordinate.set_collision_objects(self.collisions)
+            subordinate.set_collision_objects(self.collisions, self.collision_index)
+        
+        # Registre des pièges partagé par le joueur et les bots alliés
+        self.trap_manager = TrapManager(self.tmx_data.tilewidth, self.tmx_data.tileheight, self.event_bus)
+        self.ally_bot.set_trap_manager(self.trap_manager)
+        for subordinate in self.formation_manager.get_subordinates():
+            subordinate.set_trap_manager(self.trap_manager)
+        
+        # Pool de boules de feu recyclées, bornées par la taille de la carte
+        self.projectile_pool = ProjectilePool(
+            512,
+            self.collision_index,
+            self.tmx_data.width * self.tmx_data.tilewidth,
+            self.tmx_data.height * self.tmx_data.tileheight,
+            self.fireballs,
+            self.group,
+            rng=self.rng.stream("projectiles"),
+        )
+        self.ally_bot.set_projectile_pool(self.projectile_pool)
+        for subordinate in self.formation_manager.get_subordinates():
+            subordinate.set_projectile_pool(self.projectile_pool)
+        
+        # Les bots alliés cadencent leurs actions sur le temps simulé
+        self.ally_bot.set_game_clock(self.clock)
+        for subordinate in self.formation_manager.get_subordinates():
+            subordinate.set_game_clock(self.clock)
+        
+        # Personnages affichés entre les deux derniers ticks (interpolation du rendu)
+        self.interpolator = RenderInterpolator(
+            [self.player, self.bot, self.ally_bot] + self.formation_manager.get_subordinates()
+        )
         
         # Créer la minimap
-        self.minimap = Minimap(self.screen, self.tmx_data, x=10, y=10, width=200, height=150)
+        self.minimap = None if headless else Minimap(self.screen, self.tmx_data, x=10, y=10, width=200, height=150,
+                                                       collisions=self.collisions)
 
         # Créer l'UI Manager et initialiser les variables d'état
         self.ui = UIManager(screen.get_size())
@@ -134,8 +221,22 @@ class GameManager:
         
         # Créer le renderer de zone de mouvement
         self.movement_zone_renderer = MovementZoneRenderer()
+        self.movement_zone_renderer.set_camera(self.map_layer)
+        
+        # Profileur (F3) : chronomètre chaque système du scheduler quand il est actif
+        self.profiler = Profiler()
+        self.profiler_overlay = None if headless else ProfilerOverlay(self.profiler)
+        
+        # Présentation : flip complet en jeu, rectangles modifiés dans les états figés
+        self.presenter = Presenter(self.screen)
+        self.end_screen_overlay = None
+        
+        # Ordonnanceur : chaque entité est mise à jour une seule fois par tick
+        self.scheduler = SystemScheduler(self.profiler)
+        self._register_systems()
 
-        pygame.display.flip()
+        if not headless:
+            pygame.display.flip()
     
     def _init_level(self):
         """Initialisation du niveau avec chargement TMX"""
@@ -167,6 +268,36 @@ class GameManager:
                     if obj.name == "collision":
                         self.collisions.append(obj)
 
+                # Index spatial partagé par tous les objets mobiles (bots et joueur)
+                self.collision_index = CollisionIndex(
+                    self.collisions, tmx_data.tilewidth, tmx_data.tileheight
+                )
+
+                # Grille de marche en demi-tuiles (cache binaire à côté de la carte)
+                self.walkability = WalkabilityGrid.load_or_build(
+                    tmx_path,
+                    self.collisions,
+                    tmx_data.width * tmx_data.tilewidth,
+                    tmx_data.height * tmx_data.tileheight,
+                    cell_size=tmx_data.tilewidth // 2,
+                )
+                self.collision_index.set_walkability(self.walkability)
+
+                # Pathfinder A* du héros, à la résolution d'une tuile
+                self.pathfinder = GridPathfinder(
+                    self.walkability.walkable_mask(factor=2), tmx_data.tilewidth
+                )
+
+                # Précharger les sprites des projectiles et des pièges (aucun décodage PNG en jeu)
+                FireBall.load_assets()
+                Trap.load_assets()
+                Bomb.load_assets()
+
+                # Danger map du héros (pièges déclenchés, projectiles reçus), même grille que le pathfinder
+                self.danger_map = DangerMap(
+                    self.pathfinder.width, self.pathfinder.height, tmx_data.tilewidth
+                )
+
                 print(f"TMX chargé - Dimensions: {self.tmx_data.width}x{self.tmx_data.height}")
                 print(f"Taille des tuiles: {self.tmx_data.tilewidth}x{self.tmx_data.tileheight}")
                 print(f"Nombre de couches: {len(self.tmx_data.layers)}")
@@ -180,14 +311,16 @@ class GameManager:
                         if not os.path.exists(tileset.image):
                             print(f"    ERREUR: Image introuvable - {tileset.image}")
                 
-                # Création des données pyscroll
-                map_data = pyscroll.data.TiledMapData(self.tmx_data)
-                print("Données pyscroll créées")
+                # Couches de tuiles précomposées en chunks (sous les sprites / au-dessus),
+                # relues depuis le cache tant que le TMX ne change pas
+                map_chunks = MapChunks.load_or_build(tmx_path, tmx_data, sprite_layer=3)
+                print(f"Chunks de la carte prêts ({len(map_chunks.lower)} + {len(map_chunks.overhead)})")
                 
                 # Création du renderer
-                map_layer = pyscroll.orthographic.BufferedRenderer(map_data, self.screen.get_size())
+                map_layer = ChunkedRenderer(map_chunks, self.screen.get_size())
                 print("Renderer créé")
                 map_layer.zoom = 2.0
+                self.map_layer = map_layer
                 # Création du groupe
                 self.group = pyscroll.PyscrollGroup(map_layer=map_layer, default_layer=3)
                 print("Groupe pyscroll créé")
@@ -216,14 +349,15 @@ class GameManager:
         if not self.game_ended:
             self.game_ended = True
             # Random entre victoire et défaite (50/50)
-            self.end_screen_result = random.choice(['victory', 'defeat'])
-            self.end_screen_timer = pygame.time.get_ticks()
+            self.end_screen_result = self.game_rng.choice(['victory', 'defeat'])
+            self.end_screen_timer = self.get_now()
             
             # Activer les barres cinématiques
             self.ui.show('cinematic_bars')
             
             # Messages selon le résultat
             if self.end_screen_result == 'victory':
+                self.event_bus.emit(events.HERO_DEATH, "random", self.percentage)
                 print("🎉 VICTOIRE DU MÉCHANT! Le héros a été vaincu!")
                 message = "VICTOIRE! Le méchant triomphe!"
             else:
@@ -237,17 +371,18 @@ class GameManager:
         """Declenche l'ecran de fin en utilisant le pourcentage actuel comme chance de victoire"""
         if not self.game_ended:
             self.game_ended = True
-            self.end_screen_timer = pygame.time.get_ticks()
+            self.end_screen_timer = self.get_now()
 
             # Conserver le pourcentage accumule et l'utiliser comme probabilite
             win_chance = max(0.0, min(self.percentage, 100.0))
-            roll = random.random() * 100.0
+            roll = self.game_rng.random() * 100.0
 
             # Activer les barres cinematiques
             self.ui.show('cinematic_bars')
 
             if roll < win_chance:
                 self.end_screen_result = 'victory'
+                self.event_bus.emit(events.HERO_DEATH, "percentage", win_chance, roll)
                 print(f"Victoire du mechant ! Chance: {win_chance:.1f}% (tirage {roll:.1f}%) - Score: {self.score}")
                 message = (
                     f"VICTOIRE! Le mechant triomphe!\n"
@@ -273,65 +408,99 @@ class GameManager:
         return self.score
 
     def update(self):
-        """Mise à jour des entités du jeu"""
+        """Mise à jour des entités du jeu (un tick de simulation à pas fixe)"""
+        self.clock.step()
         if self.game_ended:
-            current_time = pygame.time.get_ticks()
+            current_time = self.get_now()
             if current_time - self.end_screen_timer >= self.end_screen_duration:
                 print("🚪 Fermeture automatique du jeu après l'écran de fin...")
                 self.should_quit = True
                 return
+            # Pendant l'écran de fin, seules les entrées (ESPACE pour relancer) sont traitées
+            self.handle_input()
+            self.event_bus.dispatch()
+        else:
+            if not self.headless:
+                self.interpolator.snapshot()
+            self.scheduler.update()
         
-        if not self.game_ended:
-            self.group.update()
-            self.group.center(self.player.rect.center)
-            self.fireballs.update()
-            
-            # Vérifier les collisions projectile-héros
-            self.check_projectile_hero_collision()
-            
-            # Vérifier la zone de téléportation
-            self.check_teleport_zone()
-            
-            # Vérifier si le délai après téléportation est écoulé
-            if self.teleported and self.teleport_time is not None:
-                current_time = pygame.time.get_ticks()
-                self.dialogue_manager.start_scene("scene_boss")
-                if current_time - self.teleport_time >= self.end_screen_delay:
-                    print("⏰ Délai écoulé, déclenchement de l'écran de fin!")
-                    self.trigger_end_screen_with_percentage()
-                    self.teleport_time = None  # Réinitialiser pour éviter les appels multiples
-            
-            # Mettre à jour le gestionnaire de formation avec les groupes de projectiles
-            if hasattr(self, 'formation_manager'):
-                self.formation_manager.update(self.fireballs, self.group)
-            
-            # Appeler la méthode update pour rafraîchir l'affichage
-            self.minimap.update()
-            # Mise à jour de l'UI (timers, animations UI)
-            self.ui.percentage_value = self.percentage  
-
-            # Mettre à jour l'ally bot avec les groupes de projectiles pour le tir sur le hero bot
-            if hasattr(self, 'ally_bot'):
-                self.ally_bot.update(self.fireballs, self.group)
-            
-            # Mettre à jour la minimap avec les positions des entités
-            if hasattr(self, 'minimap') and self.minimap:
-                self.minimap.update_player_position(self.player.position[0], self.player.position[1])
-                self.minimap.update_ally_position(self.ally_bot.position[0], self.ally_bot.position[1])
-                
-                # Mettre à jour la position du bot
-                if hasattr(self, 'bot') and self.bot:
-                    self.minimap.update_bot_position(self.bot.position[0], self.bot.position[1])
-                
-                # Mettre à jour les positions des subordonnés
-                if hasattr(self, 'formation_manager'):
-                    self.minimap.update_subordinates_positions(self.formation_manager.get_subordinates())
-                
-                # Appeler la méthode update pour rafraîchir l'affichage
-                self.minimap.update()
-            
-            # Mise à jour de l'UI (timers, animations UI)
-        self.ui.update()
+        # Mise à jour de l'UI (timers, animations UI)
+        if not self.headless:
+            self.ui.update()
+
+    def _register_systems(self):
+        """Inscrit chaque système dans sa phase, dans l'ordre d'exécution"""
+        scheduler = self.scheduler
+        
+        # Entrées : déplacement du joueur (avec collision murale) et actions
+        scheduler.add(INPUT, "input", self.handle_input)
+        
+        # IA
+        scheduler.add(AI, "hero_status", self.bot.update_status)
+        scheduler.add(AI, "hero_ai", self.bot.update_ai)
+        scheduler.add(AI, "ally_ai", self.ally_bot.update_ai)
+        scheduler.add(AI, "ally_combat", lambda: self.ally_bot.update_combat(self.fireballs, self.group))
+        scheduler.add(AI, "formation_ai", lambda: self.formation_manager.update_ai(self.fireballs, self.group))
+        
+        # Physique
+        scheduler.add(PHYSICS, "player_attraction", self.player.update_attraction_system)
+        scheduler.add(PHYSICS, "hero_movement", self.bot.update_movement)
+        scheduler.add(PHYSICS, "ally_movement", self.ally_bot.update_movement)
+        scheduler.add(PHYSICS, "formation_movement", self.formation_manager.update_physics)
+        scheduler.add(PHYSICS, "projectiles", self.projectile_pool.update)
+        scheduler.add(PHYSICS, "traps", lambda: self.trap_manager.update(self.get_now()))
+        
+        # Collisions et règles du niveau
+        scheduler.add(COLLISIONS, "hero_traps", self.bot.update_collisions)
+        scheduler.add(COLLISIONS, "projectile_hits", self.check_projectile_hero_collision)
+        scheduler.add(COLLISIONS, "teleport", self.check_teleport_zone)
+        scheduler.add(COLLISIONS, "level_end", self.check_level_end)
+        
+        # Événements émis pendant le tick (entrées, IA, physique, collisions), distribués en bloc
+        scheduler.add(ANIMATION, "events", self.event_bus.dispatch)
+        
+        # Animation et état affiché
+        scheduler.add(ANIMATION, "player_animation", self.player.update_animation)
+        scheduler.add(ANIMATION, "hero_animation", self.bot.update_animation)
+        scheduler.add(ANIMATION, "ally_animation", self.ally_bot.update_animation)
+        scheduler.add(ANIMATION, "formation_animation", self.formation_manager.update_animation)
+        
+        # Le reste ne sert qu'à l'affichage
+        if self.headless:
+            return
+        scheduler.add(ANIMATION, "camera", lambda: self.group.center(self.player.rect.center))
+        scheduler.add(ANIMATION, "projectile_sprites", lambda: self.projectile_pool.sync_sprites(self.group.view))
+        scheduler.add(ANIMATION, "minimap", self.update_minimap)
+        scheduler.add(ANIMATION, "hud", self.update_hud)
+        
+        # Rendu (le dialogue est dessiné à part, toujours par-dessus)
+        scheduler.add(RENDER, "world", lambda: self.group.draw(self.screen))
+        scheduler.add(RENDER, "minimap", self.minimap.render)
+        scheduler.add(RENDER, "ui", lambda: self.ui.render(self.screen))
+        scheduler.add(RENDER, "movement_zone", self.render_movement_zone)
+
+    def check_level_end(self):
+        """Déclenche l'écran de fin une fois le délai après la téléportation écoulé"""
+        if self.teleported and self.teleport_time is not None:
+            current_time = self.get_now()
+            if current_time - self.teleport_time >= self.end_screen_delay:
+                print("⏰ Délai écoulé, déclenchement de l'écran de fin!")
+                self.trigger_end_screen_with_percentage()
+                self.teleport_time = None  # Réinitialiser pour éviter les appels multiples
+
+    def update_minimap(self):
+        """Met à jour la minimap avec les positions des entités (une fois par tick)"""
+        self.minimap.update_player_position(self.player.position[0], self.player.position[1])
+        self.minimap.update_ally_position(self.ally_bot.position[0], self.ally_bot.position[1])
+        self.minimap.update_bot_position(self.bot.position[0], self.bot.position[1])
+        self.minimap.update_subordinates_positions(self.formation_manager.get_subordinates())
+        self.minimap.update()
+
+    def update_hud(self):
+        """Transmet à l'UI les valeurs affichées"""
+        self.ui.percentage_value = self.percentage
+        self.ui.stun_progress = self.bot.status.progress(STUN)
+
     def check_projectile_hero_collision(self):
             """Vérifie les collisions entre les projectiles et le héros (bot)"""
             if not hasattr(self, 'bot') or not self.bot:
@@ -340,35 +509,35 @@ class GameManager:
             if not hasattr(self, 'fireballs') or not self.fireballs:
                 return
             
-            # Collision avec le bot principal (héros) - détruit le projectile automatiquement
-            collisions = pygame.sprite.spritecollide(self.bot, self.fireballs, True)
+            # Collision avec le bot principal (héros) - test vectorisé, le projectile retourne au pool
+            collisions = self.projectile_pool.collide_rect(self.bot.rect)
             
             for fireball in collisions:
+                self.record_event(HERO_HIT, FIREBALL_KIND, fireball.rect.centerx, fireball.rect.centery)
                 # Augmenter le pourcentage de 0.5%
                 self.percentage += fireball.damage
+                self.bot.status.apply(SLOW, fireball.slow_duration, fireball.slow)
+                # Le héros retient l'endroit où il a été touché
+                self.danger_map.add_danger(fireball.rect.centerx, fireball.rect.centery, fireball.danger)
                 # Plafonner le pourcentage à 100% si nécessaire
                 if self.percentage > 100.0:
                     self.percentage = 100.0
                 
                 # Augmenter le score
-                self.score += fireball.score
-                
-                # Message de debug
-                print(f"💥 Héros touché! Pourcentage: {self.percentage:.1f}% - Score: {self.score}")
+                self.add_score(fireball.score, "fireball_hit")
                 
                 # Effet visuel/sonore optionnel (peut être ajouté plus tard)
-                self.on_hero_hit()
+                self.on_hero_hit("fireball")
 
-    def on_hero_hit(self):
+    def on_hero_hit(self, cause):
         """Appelé quand le héros est touché - pour effets supplémentaires"""
-        # Ici on peut ajouter des effets visuels, sons, etc.
-        # Pour l'instant, juste un feedback console
-        if self.percentage >= 100.0:
-            print("🎉 POURCENTAGE MAXIMUM ATTEINT! (100%)")
-        elif self.percentage >= 75.0:
-            print("⭐ Excellent! Pourcentage élevé!")
-        elif self.percentage >= 60.0:
-            print("👍 Bon travail!")
+        # Le retour se fait par le bus d'événements (télémétrie), plus par des print dans la boucle
+        self.event_bus.emit(events.HERO_HIT, cause, self.percentage)
+
+    def add_score(self, amount, reason):
+        """Ajoute des points au score et le signale (coins_change)"""
+        self.score += amount
+        self.event_bus.emit(events.COINS_CHANGE, amount, self.score, reason)
     
     def reset_percentage(self):
         """Remet le pourcentage à 50% (méthode utilitaire)"""
@@ -417,6 +586,7 @@ class GameManager:
             self.bot.position[0] = bot_pos[0]
             self.bot.position[1] = bot_pos[1]
             self.bot.rect.center = (int(bot_pos[0]), int(bot_pos[1]))
+            self.bot.plan_path()
             
             # Téléporter le joueur
             player_pos = self.teleport_positions['player']
@@ -426,9 +596,13 @@ class GameManager:
             
             # Marquer comme téléporté pour éviter les téléportations multiples
             self.teleported = True
+            self.record_event(TELEPORT)
             
             # Enregistrer le temps de téléportation pour le délai
-            self.teleport_time = pygame.time.get_ticks()
+            self.teleport_time = self.get_now()
+            
+            # Scène du boss, lancée une seule fois (la simulation est en pause pendant le dialogue)
+            self.dialogue_manager.start_scene("scene_boss")
             
             print(f"✅ Ally bot téléporté à: ({ally_pos[0]}, {ally_pos[1]})")
             print(f"✅ Bot téléporté à: ({bot_pos[0]}, {bot_pos[1]})")
@@ -436,99 +610,107 @@ class GameManager:
             print("⏳ Attente de 3 secondes avant l'écran de fin...")
 
 
-    def render(self):
-        """Rendu avec gestion de l'écran de fin - VERSION CORRIGÉE"""
+    def render(self, alpha=1.0):
+        """Rendu avec gestion de l'écran de fin - VERSION CORRIGÉE
+
+        alpha : fraction du tick suivant déjà écoulée ; les personnages sont
+        affichés entre leur position au tick précédent et au tick courant.
+
+        Pendant les dialogues et l'écran de fin le monde est figé : le fond est
+        dessiné une fois, puis seules la réplique, le timer et le profileur sont
+        redessinés et envoyés à l'écran (voir interface.presenter).
+        """
+        presenter = self.presenter
         if self.game_ended:
-            # Rendu normal du jeu en arrière-plan (optionnel)
-            self.group.draw(self.screen)
-            self.fireballs.draw(self.screen)
-            
-            # Rendre la minimap par-dessus le jeu
-            if hasattr(self, 'minimap'):
-                self.minimap.render()
-            
-            # Fond sombre pour l'écran de fin
-            overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
-            
-            # Afficher le texte de fin
-            font_large = pygame.font.Font(None, 72)
-            font_medium = pygame.font.Font(None, 48)
-            
-            if self.end_screen_result == 'victory':
-                title_color = (255, 215, 0)  # Or pour victoire
-                title_text = "VICTOIRE!"
-                subtitle_text = "Le méchant triomphe!"
-            else:
-                title_color = (220, 20, 60)  # Rouge pour défaite
-                title_text = "DÉFAITE!"
-                subtitle_text = "Le héros a gagné..."
-            
-            # Titre principal
-            title_surface = font_large.render(title_text, True, title_color)
-            title_rect = title_surface.get_rect(center=(self.width//2, self.height//2 - 50))
-            self.screen.blit(title_surface, title_rect)
-            
-            # Sous-titre
-            subtitle_surface = font_medium.render(subtitle_text, True, (255, 255, 255))
-            subtitle_rect = subtitle_surface.get_rect(center=(self.width//2, self.height//2 + 20))
-            self.screen.blit(subtitle_surface, subtitle_rect)
-            
-            # Score final
-            score_text = f"Score final: {self.score}"
-            percentage_text = f"Pourcentage de chance que la Terreur du Crous gagne: {self.percentage:.1f}%"
-            
-            font_small = pygame.font.Font(None, 36)
-            score_surface = font_small.render(score_text, True, (200, 200, 200))
-            percentage_surface = font_small.render(percentage_text, True, (200, 200, 200))
-            
-            score_rect = score_surface.get_rect(center=(self.width//2, self.height//2 + 80))
-            percentage_rect = percentage_surface.get_rect(center=(self.width//2, self.height//2 + 120))
-            
-            self.screen.blit(score_surface, score_rect)
-            self.screen.blit(percentage_surface, percentage_rect)
+            presenter.set_mode(('end', self.end_screen_result))
+            if presenter.needs_background():
+                self.render_end_screen_background()
+                presenter.freeze()
             
             # Timer de fin
-            remaining_time = max(0, (self.end_screen_duration - (pygame.time.get_ticks() - self.end_screen_timer)) // 1000)
+            remaining_time = max(0, (self.end_screen_duration - (self.get_now() - self.end_screen_timer)) // 1000)
             timer_text = f"Redémarrage dans {remaining_time + 1}s..."
-            timer_surface = font_small.render(timer_text, True, (150, 150, 150))
-            timer_rect = timer_surface.get_rect(center=(self.width//2, self.height//2 + 180))
-            self.screen.blit(timer_surface, timer_rect)
+            presenter.layer('end_timer', timer_text, lambda: self.blit_centered(
+                render_text(timer_text, 36, (150, 150, 150)), (self.width//2, self.height//2 + 180)))
             
-            # Instructions
-            instruction_text = "Appuyez sur ESPACE pour redémarrer immédiatement"
-            instruction_surface = pygame.font.Font(None, 24).render(instruction_text, True, (120, 120, 120))
-            instruction_rect = instruction_surface.get_rect(center=(self.width//2, self.height//2 + 220))
-            self.screen.blit(instruction_surface, instruction_rect)
+        elif self.dialogue_manager.is_active():
+            # Simulation en pause : le monde n'est dessiné qu'à l'ouverture du dialogue
+            presenter.set_mode(('dialogue', self.dialogue_manager.active_scene))
+            if presenter.needs_background():
+                self.render_world(alpha)
+                presenter.freeze()
             
+            # TOUJOURS dessiner les dialogues en dernier (par-dessus tout)
+            with self.profiler.scope("render/dialogue"):
+                presenter.layer('dialogue', self.dialogue_manager.draw_state(),
+                                lambda: self.dialogue_manager.draw(self.screen))
         else:
             # Rendu normal du jeu
-            if not self.dialogue_manager.is_active():
-                self.group.draw(self.screen)
-                self.fireballs.draw(self.screen)
-                # Rendre la minimap par-dessus le jeu
-                if hasattr(self, 'minimap'):
-                    self.minimap.render()
-                self.ui.render(self.screen)
-                # Rendre la zone de mouvement du joueur autour de l'ally bot
-                self.movement_zone_renderer.render_movement_zone(
-                    self.screen, 
-                    self.player, 
-                    self.ally_bot
-                )
-                
-                # Rendre les informations de distance
-                self.movement_zone_renderer.render_distance_info(
-                    self.screen, 
-                    self.player
-                )
-            
-            # TOUJOURS dessiner les dialogues en dernier (par-dessus tout)
-            self.dialogue_manager.draw(self.screen)
+            presenter.set_mode('game')
+            self.render_world(alpha)
+            presenter.invalidate()
 
-        # IMPORTANT : Toujours faire le flip à la fin
-        pygame.display.flip()
+        # Panneau du profileur, par-dessus tout le reste (redessiné à chaque image)
+        if self.profiler.enabled:
+            presenter.layer('profiler', object(), lambda: self.profiler_overlay.render(self.screen))
+        else:
+            presenter.layer('profiler', None, None)
+
+        with self.profiler.scope("render/flip"):
+            presenter.present()
+
+    def render_world(self, alpha):
+        """Monde, minimap, UI et zone de mouvement (phase RENDER), positions interpolées"""
+        self.interpolator.apply(alpha)
+        self.projectile_pool.interpolate_sprites(alpha)
+        self.group.center(self.player.rect.center)
+        self.scheduler.run(RENDER)
+        self.interpolator.restore()
+
+    def blit_centered(self, surface, center):
+        """Blit de surface centrée sur center ; retourne le rectangle couvert"""
+        rect = surface.get_rect(center=center)
+        self.screen.blit(surface, rect)
+        return rect
+
+    def render_end_screen_background(self):
+        """Partie fixe de l'écran de fin : monde assombri, minimap et textes (hors timer)"""
+        # Rendu normal du jeu en arrière-plan (optionnel)
+        self.group.draw(self.screen)
+        
+        # Rendre la minimap par-dessus le jeu
+        if self.minimap is not None:
+            self.minimap.render()
+        
+        # Fond sombre pour l'écran de fin
+        if self.end_screen_overlay is None:
+            self.end_screen_overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            self.end_screen_overlay.fill((0, 0, 0, 180))
+        self.screen.blit(self.end_screen_overlay, (0, 0))
+        
+        # Afficher le texte de fin (libellés mis en cache par utils.text_cache)
+        if self.end_screen_result == 'victory':
+            title_color = (255, 215, 0)  # Or pour victoire
+            title_text = "VICTOIRE!"
+            subtitle_text = "Le méchant triomphe!"
+        else:
+            title_color = (220, 20, 60)  # Rouge pour défaite
+            title_text = "DÉFAITE!"
+            subtitle_text = "Le héros a gagné..."
+        
+        # Titre principal et sous-titre
+        self.blit_centered(render_text(title_text, 72, title_color), (self.width//2, self.height//2 - 50))
+        self.blit_centered(render_text(subtitle_text, 48, (255, 255, 255)), (self.width//2, self.height//2 + 20))
+        
+        # Score final
+        score_text = f"Score final: {self.score}"
+        percentage_text = f"Pourcentage de chance que la Terreur du Crous gagne: {self.percentage:.1f}%"
+        self.blit_centered(render_text(score_text, 36, (200, 200, 200)), (self.width//2, self.height//2 + 80))
+        self.blit_centered(render_text(percentage_text, 36, (200, 200, 200)), (self.width//2, self.height//2 + 120))
+        
+        # Instructions
+        instruction_text = "Appuyez sur ESPACE pour redémarrer immédiatement"
+        self.blit_centered(render_text(instruction_text, 24, (120, 120, 120)), (self.width//2, self.height//2 + 220))
 
     def reset_game(self):
         """Remet le jeu à zéro après l'écran de fin"""
@@ -545,6 +727,14 @@ class GameManager:
         self.ui.hide('cinematic_bars')
         self.ui.hide('dialog')
         
+        # Retirer les pièges encore posés
+        if hasattr(self, 'trap_manager'):
+            self.trap_manager.clear()
+        
+        # Oublier le danger appris pendant la partie précédente
+        if hasattr(self, 'danger_map'):
+            self.danger_map.clear()
+        
         # Repositionner les entités
         if hasattr(self, 'player'):
             self.player.position = [self.spawn_position.x, self.spawn_position.y]
@@ -556,13 +746,34 @@ class GameManager:
             bot_spawn_x = 100
             bot_spawn_y = (self.tmx_data.height * self.tmx_data.tileheight) - 100
             self.bot.position = [bot_spawn_x, bot_spawn_y]
+            self.bot.status.clear()
+            self.bot.plan_path()
         
-        # Vider les projectiles
-        if hasattr(self, 'fireballs'):
-            self.fireballs.empty()
+        # Recycler les projectiles en vol
+        if hasattr(self, 'projectile_pool'):
+            self.projectile_pool.clear()
         
         print("🔄 Jeu redémarré!")
 
+    def toggle_profiler(self):
+        """Affiche ou masque le profileur (et active ou coupe les mesures)"""
+        enabled = self.profiler.toggle()
+        print(f"⏱️ Profileur {'activé' if enabled else 'désactivé'}")
+
+    def render_movement_zone(self):
+        """Rendre la zone de mouvement du joueur autour de l'ally bot et la distance"""
+        self.movement_zone_renderer.render_movement_zone(
+            self.screen, 
+            self.player, 
+            self.ally_bot
+        )
+        
+        # Rendre les informations de distance
+        self.movement_zone_renderer.render_distance_info(
+            self.screen, 
+            self.player
+        )
+
     def handle_movent(self, pressed):
         self.player.save_location()
         is_moving = False
@@ -605,19 +816,9 @@ class GameManager:
 
 
     def handle_collision(self):
-        for obj in self.collisions:
-            top_left = (obj.x, obj.y)
-            bottom_left = (obj.x, obj.y + obj.height)
-            top_right = (obj.x + obj.width, obj.y)
-            bottom_right = (obj.x + obj.width, obj.y + obj.height)
-            player_position = self.player.position
-            # print(top_left, bottom_left, top_right, bottom_right)
-
-            if (player_position[0] >= top_left[0] and player_position[1] >= top_left[1]) and (
-                    player_position[0] >= bottom_left[0] and player_position[1] <= bottom_left[1]) and (
-                    player_position[0] <= top_right[0] and player_position[1] >= top_right[1]) and (
-                    player_position[0] <= bottom_right[0] and player_position[1] <= bottom_right[1]):
-                self.player.move_player_back()
+        player_position = self.player.position
+        if self.collision_index.collides_point(player_position[0], player_position[1]):
+            self.player.move_player_back()
 
 
     def can_place_action(self, now, last, countdown):
@@ -628,42 +829,44 @@ class GameManager:
         return False
 
     def get_now(self):
-        return pygame.time.get_ticks()
+        """Temps simulé (ms) : avance d'un tick à chaque mise à jour, s'arrête en pause"""
+        return self.clock.now_ms
 
     def handle_fireballs(self):
         now = self.get_now()
-        fireball = FireBall(
-            self.player.position[0] + 16,  # centre du sprite joueur
-            self.player.position[1] + 16,
-            self.player.last_direction
-        )
-        if self.can_place_action(now, self.last_shot_time, fireball.countdown):
-            self.ui.activate_hotbar_slot(0, fireball.countdown/1000)
-
-            self.fireballs.add(fireball)
-            self.group.add(fireball)  # pyscroll la gère
+        if self.can_place_action(now, self.last_shot_time, FireBall.countdown):
+            fireball = self.projectile_pool.spawn(
+                self.player.position[0] + 16,  # centre du sprite joueur
+                self.player.position[1] + 16,
+                self.player.last_direction
+            )
+            if fireball is None:
+                return
+            self.record_event(FIREBALL_FIRED, fireball.pos[0], fireball.pos[1])
+            self.ui.activate_hotbar_slot(0, FireBall.countdown/1000)
             self.last_shot_time = self.get_now()
 
     def handle_trap(self, x, y):
         now = self.get_now()
         trap = Trap(x, y)
         if self.can_place_action(now, self.last_placed_trap, trap.countdown):
-            TAB_ACTION.append(trap)
+            self.trap_manager.add(trap, now)
+            self.record_event(TRAP_PLACED, TRAP_KIND, x, y)
             self.ui.activate_hotbar_slot(1, trap.countdown/1000)
             self.group.add(trap)
             self.last_placed_trap = self.get_now()
-            self.score += 10
-            self.score += trap.score
+            self.add_score(10 + trap.score, "trap_placed")
 
     def handle_bomb(self, x, y):
         now = self.get_now()
         bomb = Bomb(x, y)
         if self.can_place_action(now, self.last_placed_bomb, bomb.countdown):
-            TAB_ACTION.append(bomb)
+            self.trap_manager.add(bomb, now)
+            self.record_event(TRAP_PLACED, BOMB_KIND, x, y)
             self.ui.activate_hotbar_slot(2, bomb.countdown / 1000)
             self.group.add(bomb)
             self.last_placed_bomb = self.get_now()
-            self.score += bomb.score
+            self.add_score(bomb.score, "bomb_placed")
 
     def handle_action(self, pressed):
         #Ajouter les autres actions
@@ -683,11 +886,35 @@ class GameManager:
             # Déléguer la gestion du dialogue au GameManager
             self.handle_dialogue()
 
+    def set_replay_recorder(self, recorder):
+        """Enregistre les entrées et événements de la partie dans recorder"""
+        self.replay_recorder = recorder
+
+    def set_replay_player(self, player):
+        """Rejoue les entrées d'un replay au lieu de lire le clavier"""
+        self.replay_player = player
+
+    def record_event(self, kind, *args):
+        """Transmet un événement de jeu au replay en cours (enregistrement ou vérification)"""
+        if self.replay_recorder is not None:
+            self.replay_recorder.record_event(kind, args)
+        if self.replay_player is not None:
+            self.replay_player.check_event(kind, args)
+
+    def read_input(self):
+        """Masque des touches de jeu pour ce tick (clavier ou replay), enregistré si besoin"""
+        if self.replay_player is not None:
+            mask = self.replay_player.next_input()
+        else:
+            mask = input_mask(pygame.key.get_pressed())
+        if self.replay_recorder is not None:
+            self.replay_recorder.record_input(mask)
+        return KeyMask(mask)
+
     def handle_input(self):
-        pressed = pygame.key.get_pressed()
+        pressed = self.read_input()
         if self.game_ended:
             # Pendant l'écran de fin, on peut permettre d'accélérer avec ESPACE
-            pressed = pygame.key.get_pressed()
             if pressed[pygame.K_SPACE]:
                 self.reset_game()
             return
@@ -711,7 +938,7 @@ class GameManager:
                     # Forcer une victoire si le pourcentage est au max
                     self.game_ended = True
                     self.end_screen_result = 'victory'
-                    self.end_screen_timer = pygame.time.get_ticks()
+                    self.end_screen_timer = self.get_now()
                     self.ui.show('cinematic_bars')
                     self.ui.show('dialog', "VICTOIRE PARFAITE! 100% atteint!")
             
@@ -724,6 +951,6 @@ class GameManager:
                     if not self.game_ended:
                         self.game_ended = True
                         self.end_screen_result = 'defeat'
-                        self.end_screen_timer = pygame.time.get_ticks()
+                        self.end_screen_timer = self.get_now()
                         self.ui.show('cinematic_bars')
                         self.ui.show('dialog', "Le héros vous a rattrapé!")
@@ -0,0 +1,335 @@
+"""
+Rendu de la carte par gros chunks précomposés.
+
+Au chargement, les couches de tuiles sont composées une fois pour toutes en
+surfaces de CHUNK_SIZE x CHUNK_SIZE px, en deux jeux :
+- lower    : couches jusqu'à la couche des sprites incluse (sol, murs, maison...)
+- overhead : couches au-dessus des sprites (arbres, passages couverts)
+
+Composer la carte du jeu (~14 000 tuiles) prend 50 à 70 ms, moins que la
+lecture d'un cache compressé des mêmes pixels (zlib : ~68 ms pour 3,8 Mo ;
+non compressé : 51 Mo sur le disque). Les chunks ne sont donc sauvegardés à
+côté de la carte que si elle empile assez de tuiles par case pour que la
+composition coûte plus cher que la décompression (CACHE_MIN_TILES_PER_CELL).
+Le cache est indexé par le hash du TMX et de ses tilesets
+(utils.map_cache.map_digest) et contient les pixels de chaque chunk compressés
+par zlib ; si le format des pixels de l'écran a changé depuis l'écriture, les
+chunks lus sont convertis au lieu d'être recomposés. Les chunks overhead sont
+rognés à leurs pixels non transparents (moins de pixels mélangés à
+l'affichage).
+
+À l'affichage, une image coûte les 2 à 4 chunks visibles de chaque jeu, les
+sprites entre les deux, puis la mise à l'échelle du zoom ; aucune tuile n'est
+redessinée.
+
+ChunkedRenderer reprend l'interface de pyscroll.BufferedRenderer utilisée par
+PyscrollGroup et le jeu (center, view_rect, get_center_offset, draw, zoom,
+translate_point) et s'utilise donc à sa place.
+"""
+
+import os
+import struct
+import zlib
+
+import pygame
+import pytmx
+
+from utils.map_cache import cache_path, map_digest
+
+CHUNK_SIZE = 512
+
+CACHE_SUFFIX = ".chunks"
+CACHE_MAGIC = b"CHNK"
+CACHE_VERSION = 3
+# magic, version, taille des chunks, couche des sprites, colonnes, lignes,
+# sha256 du TMX et des tilesets, masques RGBA des chunks lower puis overhead
+# au moment de l'écriture
+CACHE_HEADER = struct.Struct("<4sHHHHH32s8I")
+# jeu (0 = lower, 1 = overhead), colonne, ligne, position (x, y) dans le monde,
+# largeur, hauteur, taille compressée ; suivi des pixels du chunk (zlib)
+CHUNK_HEADER = struct.Struct("<BHHHHHHI")
+# Mesuré sur la carte du jeu (8 000 cases) en empilant ses couches : composer
+# coûte ~23 ms + ~14 ms par tuile par case, lire le cache ~68 ms quelle que soit
+# la pile. L'équilibre est vers 3,3 tuiles par case (la carte en a 1,7) ; le
+# seuil garde une marge, en dessous recomposer est au moins aussi rapide.
+CACHE_MIN_TILES_PER_CELL = 4.0
+
+LOWER = 0
+OVERHEAD = 1
+
+
+def new_chunk_surface(group, size):
+    """Surface vierge d'un chunk : au format de l'écran pour le sol opaque,
+    ARGB 32 bits (celui de convert_alpha) pour le surplomb"""
+    if group == OVERHEAD:
+        return pygame.Surface(size, pygame.SRCALPHA, 32)
+    display = pygame.display.get_surface()
+    if display is not None and display.get_bitsize() == 32:
+        return pygame.Surface(size, 0, display)
+    return pygame.Surface(size, 0, 32)
+
+
+class MapChunks:
+    """Les deux jeux de chunks d'une carte : {(colonne, ligne): (Surface, (x, y) dans le monde)}"""
+
+    def __init__(self, map_size, chunk_size, sprite_layer, lower, overhead):
+        self.map_width, self.map_height = map_size
+        self.chunk_size = chunk_size
+        self.sprite_layer = sprite_layer
+        self.columns = -(-self.map_width // chunk_size)
+        self.rows = -(-self.map_height // chunk_size)
+        self.lower = lower
+        self.overhead = overhead  # Les chunks sans tuile de surplomb sont absents
+
+    @classmethod
+    def load_or_build(cls, tmx_path, tmx_data, sprite_layer, chunk_size=CHUNK_SIZE):
+        """Charge les chunks depuis le cache si la carte n'a pas changé, sinon les compose.
+
+        Une carte trop peu chargée en tuiles pour que le cache soit rentable est
+        composée directement, sans fichier.
+        """
+        if cls.tiles_per_cell(tmx_data) < CACHE_MIN_TILES_PER_CELL:
+            return cls.bake(tmx_data, sprite_layer, chunk_size)
+
+        digest = map_digest(tmx_path)
+        path = cache_path(tmx_path, CACHE_SUFFIX)
+        map_size = (tmx_data.width * tmx_data.tilewidth, tmx_data.height * tmx_data.tileheight)
+
+        chunks = cls.load(path, digest, map_size, chunk_size, sprite_layer)
+        if chunks is not None:
+            return chunks
+
+        chunks = cls.bake(tmx_data, sprite_layer, chunk_size)
+        try:
+            chunks.save(path, digest)
+        except OSError as e:
+            print(f"[MapChunks] Impossible d'écrire le cache {path}: {e}")
+        return chunks
+
+    @staticmethod
+    def tiles_per_cell(tmx_data):
+        """Nombre moyen de tuiles à composer par case de la carte (couches visibles)"""
+        tiles = sum(1 for layer in tmx_data.layers
+                    if isinstance(layer, pytmx.TiledTileLayer) and layer.visible
+                    for row in layer.data for gid in row if gid)
+        return tiles / max(1, tmx_data.width * tmx_data.height)
+
+    @classmethod
+    def bake(cls, tmx_data, sprite_layer, chunk_size=CHUNK_SIZE):
+        """Compose les couches de tuiles visibles dans les chunks des deux jeux"""
+        tw, th = tmx_data.tilewidth, tmx_data.tileheight
+        map_size = (tmx_data.width * tw, tmx_data.height * th)
+        chunks = cls(map_size, chunk_size, sprite_layer, {}, {})
+
+        lower = {}
+        overhead = {}
+        # Sol : toujours complet et opaque, fond noir comme pyscroll
+        for cx in range(chunks.columns):
+            for cy in range(chunks.rows):
+                surface = new_chunk_surface(LOWER, chunks.chunk_extent(cx, cy))
+                surface.fill((0, 0, 0))
+                lower[(cx, cy)] = surface
+
+        for index, layer in enumerate(tmx_data.layers):
+            if not isinstance(layer, pytmx.TiledTileLayer) or not layer.visible:
+                continue
+            group = LOWER if index <= sprite_layer else OVERHEAD
+            target = lower if group == LOWER else overhead
+            for x, y, image in layer.tiles():
+                px, py = x * tw, y * th
+                # Une tuile peut déborder sur les chunks voisins
+                for cx in range(px // chunk_size, min(chunks.columns - 1, (px + image.get_width() - 1) // chunk_size) + 1):
+                    for cy in range(py // chunk_size, min(chunks.rows - 1, (py + image.get_height() - 1) // chunk_size) + 1):
+                        surface = target.get((cx, cy))
+                        if surface is None:
+                            surface = new_chunk_surface(group, chunks.chunk_extent(cx, cy))
+                            target[(cx, cy)] = surface
+                        surface.blit(image, (px - cx * chunk_size, py - cy * chunk_size))
+
+        for (cx, cy), surface in lower.items():
+            chunks.lower[(cx, cy)] = (surface, (cx * chunk_size, cy * chunk_size))
+        # Surplomb rogné à ses pixels visibles (copie : même format de pixels)
+        for (cx, cy), surface in overhead.items():
+            bounds = surface.get_bounding_rect()
+            if bounds.width and bounds.height:
+                chunks.overhead[(cx, cy)] = (surface.subsurface(bounds).copy(),
+                                             (cx * chunk_size + bounds.x, cy * chunk_size + bounds.y))
+        return chunks
+
+    @staticmethod
+    def pixel_masks():
+        """Masques RGBA des chunks lower et overhead dans l'environnement actuel"""
+        return (new_chunk_surface(LOWER, (1, 1)).get_masks()
+                + new_chunk_surface(OVERHEAD, (1, 1)).get_masks())
+
+    @classmethod
+    def load(cls, path, digest, map_size, chunk_size, sprite_layer):
+        """Lit un fichier de cache ; retourne None s'il est absent, invalide ou périmé"""
+        if not os.path.exists(path):
+            return None
+        chunks = cls(map_size, chunk_size, sprite_layer, {}, {})
+        try:
+            with open(path, "rb") as f:
+                header = f.read(CACHE_HEADER.size)
+                if len(header) < CACHE_HEADER.size:
+                    return None
+                magic, version, size, layer, columns, rows, cached_digest, *masks = (
+                    CACHE_HEADER.unpack(header))
+                if (magic != CACHE_MAGIC or version != CACHE_VERSION or size != chunk_size
+                        or layer != sprite_layer or cached_digest != digest
+                        or (columns, rows) != (chunks.columns, chunks.rows)):
+                    return None
+                current_masks = cls.pixel_masks()
+
+                while True:
+                    record = f.read(CHUNK_HEADER.size)
+                    if not record:
+                        break
+                    if len(record) < CHUNK_HEADER.size:
+                        return None
+                    group, cx, cy, x, y, width, height, length = CHUNK_HEADER.unpack(record)
+                    if group not in (LOWER, OVERHEAD) or cx >= columns or cy >= rows:
+                        return None
+                    extent = chunks.chunk_extent(cx, cy)
+                    if not (0 < width <= extent[0] and 0 < height <= extent[1]):
+                        return None
+                    blob = f.read(length)
+                    if len(blob) < length:
+                        return None
+                    try:
+                        pixels = zlib.decompress(blob)
+                    except zlib.error:
+                        return None
+                    if len(pixels) != width * height * 4:
+                        return None
+                    group_masks = masks[4 * group:4 * group + 4]
+                    if tuple(group_masks) == current_masks[4 * group:4 * group + 4]:
+                        surface = new_chunk_surface(group, (width, height))
+                        surface.get_view("0").write(pixels)
+                    else:
+                        # Écran d'un autre format : conversion plutôt que recomposition
+                        flags = pygame.SRCALPHA if group == OVERHEAD else 0
+                        stored = pygame.Surface((width, height), flags, 32, group_masks)
+                        stored.get_view("0").write(pixels)
+                        surface = stored.convert(new_chunk_surface(group, (1, 1)))
+                    target = chunks.lower if group == LOWER else chunks.overhead
+                    target[(cx, cy)] = (surface, (x, y))
+        except OSError as e:
+            print(f"[MapChunks] Impossible de lire le cache {path}: {e}")
+            return None
+        if len(chunks.lower) != columns * rows:
+            return None
+        return chunks
+
+    def save(self, path, digest):
+        """Écrit l'en-tête puis les pixels compressés de chaque chunk"""
+        header = CACHE_HEADER.pack(
+            CACHE_MAGIC, CACHE_VERSION, self.chunk_size, self.sprite_layer,
+            self.columns, self.rows, digest, *self.pixel_masks()
+        )
+        with open(path, "wb") as f:
+            f.write(header)
+            for group, surfaces in ((LOWER, self.lower), (OVERHEAD, self.overhead)):
+                for (cx, cy), (surface, (x, y)) in sorted(surfaces.items()):
+                    blob = zlib.compress(surface.get_view("0").raw)
+                    f.write(CHUNK_HEADER.pack(group, cx, cy, x, y, *surface.get_size(), len(blob)))
+                    f.write(blob)
+
+    def chunk_extent(self, cx, cy):
+        """Taille du chunk (cx, cy) ; ceux du bord droit et du bas sont rognés à la carte"""
+        return (min(self.chunk_size, self.map_width - cx * self.chunk_size),
+                min(self.chunk_size, self.map_height - cy * self.chunk_size))
+
+    def visible(self, surfaces, view_rect):
+        """(surface, position du coin haut-gauche dans le monde) des chunks de la grille touchés
+        par view_rect ; un chunk overhead rogné peut être entièrement hors de la vue"""
+        size = self.chunk_size
+        first_x = max(0, view_rect.left // size)
+        first_y = max(0, view_rect.top // size)
+        last_x = min(self.columns - 1, (view_rect.right - 1) // size)
+        last_y = min(self.rows - 1, (view_rect.bottom - 1) // size)
+        for cy in range(first_y, last_y + 1):
+            for cx in range(first_x, last_x + 1):
+                chunk = surfaces.get((cx, cy))
+                if chunk is not None:
+                    yield chunk
+
+
+class ChunkedRenderer:
+    """Caméra et rendu de la carte à partir de MapChunks, à la place de BufferedRenderer.
+
+    Les sprites passés à draw() sont dessinés entre les chunks lower et
+    overhead : tous les sprites du jeu sont sur la couche par défaut du groupe,
+    qui est aussi la dernière couche composée dans lower.
+    """
+
+    def __init__(self, chunks, size, zoom=1.0, clamp_camera=True):
+        self.chunks = chunks
+        self.clamp_camera = clamp_camera
+        self.map_rect = pygame.Rect(0, 0, chunks.map_width, chunks.map_height)
+        self._size = tuple(size)
+        self.view_rect = pygame.Rect(0, 0, *self._size)
+        self._zoom_buffer = None
+        self.zoom = zoom
+
+    @property
+    def zoom(self):
+        return self._zoom_level
+
+    @zoom.setter
+    def zoom(self, value):
+        """Le monde est dessiné en taille réelle dans un tampon de size / zoom, puis agrandi"""
+        self._zoom_level = value
+        width, height = self._size
+        buffer_size = (int(width / value), int(height / value))
+        center = self.view_rect.center
+        self.view_rect.size = buffer_size
+        self._half_width = buffer_size[0] // 2
+        self._half_height = buffer_size[1] // 2
+        self._real_ratio_x = width / buffer_size[0]
+        self._real_ratio_y = height / buffer_size[1]
+        self._zoom_buffer = pygame.Surface(buffer_size) if value != 1.0 else None
+        self.center(center)
+
+    def center(self, coords):
+        """Centre la caméra sur un pixel du monde (arrondi), sans sortir de la carte"""
+        self.view_rect.center = round(coords[0]), round(coords[1])
+        if self.clamp_camera:
+            self.view_rect.clamp_ip(self.map_rect)
+
+    def get_center_offset(self):
+        """Décalage (x, y) qui transforme les coordonnées du monde en coordonnées du tampon"""
+        return (-self.view_rect.centerx + self._half_width,
+                -self.view_rect.centery + self._half_height)
+
+    def translate_point(self, point):
+        """Coordonnées écran d'un point du monde (zoom compris)"""
+        mx, my = self.get_center_offset()
+        if self._zoom_level == 1.0:
+            return int(point[0] + mx), int(point[1] + my)
+        return (int(round(point[0] + mx) * self._real_ratio_x),
+                int(round((point[1] + my) * self._real_ratio_y)))
+
+    def draw(self, surface, rect, surfaces=None):
+        """Dessine chunks lower, sprites puis chunks overhead ; surfaces au format de PyscrollGroup"""
+        rect = pygame.Rect(rect)
+        if rect != surface.get_rect():
+            surface = surface.subsurface(rect)
+        target = self._zoom_buffer if self._zoom_buffer is not None else surface
+        view = self.view_rect
+        ox, oy = -view.left, -view.top
+
+        if not self.map_rect.contains(view):
+            target.fill((0, 0, 0))
+        blit = target.blit
+        for chunk, (x, y) in self.chunks.visible(self.chunks.lower, view):
+            blit(chunk, (x + ox, y + oy))
+        if surfaces:
+            for item in surfaces:
+                blit(item[0], item[1], None, item[3] if len(item) > 3 else 0)
+        for chunk, (x, y) in self.chunks.visible(self.chunks.overhead, view):
+            blit(chunk, (x + ox, y + oy))
+
+        if self._zoom_buffer is not None:
+            pygame.transform.scale(self._zoom_buffer, rect.size, surface)
+        return rect
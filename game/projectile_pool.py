@@ -0,0 +1,210 @@
+"""
+Pool de projectiles (boules de feu).
+
+Toutes les boules de feu sont créées au chargement du niveau puis recyclées :
+un projectile qui touche le héros, heurte un mur, sort de la carte ou dépasse
+sa durée de vie retourne dans la liste libre au lieu d'être détruit. Le nombre
+d'objets et le coût de mise à jour restent donc bornés, quelle que soit la
+durée de la partie.
+
+L'état des projectiles est stocké en colonnes NumPy (positions, vitesses, âge,
+phase d'animation, masque des actifs) : le déplacement, les tests contre la
+grille de marche et contre le rectangle du héros sont faits en une opération
+vectorisée pour tout le pool. Les sprites FireBall ne servent qu'à l'affichage ;
+seuls ceux qui sont à l'écran sont dans le groupe de rendu et synchronisés.
+"""
+
+import numpy as np
+
+from actions.fire_ball import FireBall
+from game.walkability import BLOCKED, MIXED
+
+FIREBALL_SIZE = 16
+
+
+class ProjectilePool:
+    """Boules de feu préallouées, possédé par le GameManager"""
+
+    def __init__(self, capacity, collision_index, map_width, map_height, fireballs_group, render_group, rng=None):
+        self.capacity = capacity
+        self.rng = rng  # Flux aléatoire de la dispersion des tirs
+        self.collision_index = collision_index
+        self.map_width = map_width
+        self.map_height = map_height
+        # Groupes : fireballs_group contient les projectiles actifs,
+        # render_group (pyscroll) seulement ceux qui sont visibles
+        self.fireballs_group = fireballs_group
+        self.render_group = render_group
+
+        self.sprites = [FireBall(0, 0, 'down') for _ in range(capacity)]
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev_pos = np.zeros((capacity, 2), dtype=np.float64)  # Positions au tick précédent (interpolation)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.phase = np.zeros(capacity, dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.visible = np.zeros(capacity, dtype=bool)
+
+        # Constantes communes à toutes les boules de feu
+        template = self.sprites[0]
+        self.max_age = template.max_age
+        self.animation_speed = template.animation_speed
+        self.frame_count = len(template.animations[template.current_direction])
+
+        self._free = list(range(capacity - 1, -1, -1))
+        self._count = 0
+        self.dropped = 0  # Tirs ignorés faute de place dans le pool
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def active_count(self):
+        return self._count
+
+    @property
+    def occupancy(self):
+        """Fraction du pool utilisée (0.0 à 1.0)"""
+        return self._count / self.capacity if self.capacity else 0.0
+
+    def spawn(self, x, y, direction, speed=6, spread_angle=30):
+        """Active une boule de feu ; retourne son sprite, ou None si le pool est plein"""
+        if not self._free:
+            self.dropped += 1
+            return None
+        slot = self._free.pop()
+        fireball = self.sprites[slot]
+        fireball.reset(x, y, direction, speed, spread_angle, self.rng)
+        self.pos[slot] = x, y
+        self.prev_pos[slot] = x, y
+        self.vel[slot] = fireball.velocity
+        self.age[slot] = 0
+        self.phase[slot] = 0.0
+        self.active[slot] = True
+        self._count += 1
+        self.fireballs_group.add(fireball)
+        return fireball
+
+    def _release_slot(self, slot):
+        if not self.active[slot]:
+            return
+        self.active[slot] = False
+        self.visible[slot] = False
+        self.vel[slot] = 0.0
+        fireball = self.sprites[slot]
+        fireball.active = False
+        fireball.kill()
+        self._free.append(slot)
+        self._count -= 1
+
+    def release(self, fireball):
+        """Rend une boule de feu au pool (la retire de tous les groupes)"""
+        self._release_slot(self.sprites.index(fireball))
+
+    def update(self):
+        """Avance tous les projectiles d'un tick et recycle ceux qui ont fini leur course"""
+        if self._count == 0:
+            return
+        active = self.active
+        pos = self.pos
+        self.prev_pos[:] = pos
+
+        # Intégration (les emplacements libres ont une vitesse nulle)
+        pos += self.vel
+        self.age += active
+        self.phase += self.animation_speed * active
+        self.phase[self.phase >= self.frame_count] = 0.0
+
+        # Fin de course : âge, sortie de la carte, mur
+        half = FIREBALL_SIZE // 2
+        corner = np.floor(pos).astype(np.int64)
+        cx = corner[:, 0] + half
+        cy = corner[:, 1] + half
+        finished = (self.age >= self.max_age) | (cx < 0) | (cy < 0) | (cx >= self.map_width) | (cy >= self.map_height)
+        finished &= active
+
+        inside = active & ~finished
+        candidates = inside
+        walkability = self.collision_index.walkability
+        if walkability is not None:
+            size = walkability.cell_size
+            gx = np.clip(cx // size, 0, walkability.width - 1)
+            gy = np.clip(cy // size, 0, walkability.height - 1)
+            state = walkability.cells[gy, gx]
+            finished |= inside & (state == BLOCKED)
+            # Seules les cellules partiellement couvertes demandent un test exact
+            candidates = inside & (state == MIXED)
+        for slot in np.flatnonzero(candidates):
+            if self.collision_index.collides_point(int(cx[slot]), int(cy[slot])):
+                finished[slot] = True
+
+        for slot in np.flatnonzero(finished):
+            self._release_slot(slot)
+
+    def sync_sprites(self, view_rect=None):
+        """Met à jour le groupe de rendu et les sprites des projectiles visibles.
+
+        view_rect : partie visible de la carte (pixels) ; seuls les sprites qui
+        la recoupent sont placés dans le groupe de rendu.
+        """
+        active = self.active
+        corner = np.floor(self.pos).astype(np.int64)
+        if view_rect is None:
+            visible = active.copy()
+        else:
+            x = corner[:, 0]
+            y = corner[:, 1]
+            visible = (active & (x + FIREBALL_SIZE > view_rect.left) & (x < view_rect.right)
+                       & (y + FIREBALL_SIZE > view_rect.top) & (y < view_rect.bottom))
+
+        sprites = self.sprites
+        for slot in np.flatnonzero(visible & ~self.visible):
+            self.render_group.add(sprites[slot])
+        for slot in np.flatnonzero(self.visible & ~visible):
+            self.render_group.remove(sprites[slot])
+        self.visible = visible
+
+        phase = self.phase
+        for slot in np.flatnonzero(visible):
+            fireball = sprites[slot]
+            fireball.pos[0] = float(self.pos[slot, 0])
+            fireball.pos[1] = float(self.pos[slot, 1])
+            fireball.rect.topleft = (int(corner[slot, 0]), int(corner[slot, 1]))
+            fireball.frame_index = float(phase[slot])
+            fireball.image = fireball.animations[fireball.current_direction][int(phase[slot])]
+
+    def interpolate_sprites(self, alpha):
+        """Place les sprites visibles entre leur position au tick précédent et au tick courant"""
+        visible = np.flatnonzero(self.visible)
+        if len(visible) == 0:
+            return
+        prev = self.prev_pos[visible]
+        corner = np.floor(prev + (self.pos[visible] - prev) * alpha).astype(np.int64)
+        sprites = self.sprites
+        for i, slot in enumerate(visible):
+            sprites[slot].rect.topleft = (int(corner[i, 0]), int(corner[i, 1]))
+
+    def collide_rect(self, rect):
+        """Recycle et retourne les boules de feu actives qui chevauchent le rectangle (ex : le héros)"""
+        if self._count == 0:
+            return []
+        corner = np.floor(self.pos)
+        x = corner[:, 0]
+        y = corner[:, 1]
+        hit = (self.active & (x < rect.right) & (x + FIREBALL_SIZE > rect.left)
+               & (y < rect.bottom) & (y + FIREBALL_SIZE > rect.top))
+        hits = []
+        for slot in np.flatnonzero(hit):
+            # Position simulée (le rect d'un sprite peut dater du dernier rendu, ou n'être jamais synchronisé)
+            fireball = self.sprites[slot]
+            fireball.pos[0] = float(self.pos[slot, 0])
+            fireball.pos[1] = float(self.pos[slot, 1])
+            fireball.rect.topleft = (int(x[slot]), int(y[slot]))
+            hits.append(fireball)
+            self._release_slot(slot)
+        return hits
+
+    def clear(self):
+        """Recycle tous les projectiles actifs"""
+        for slot in np.flatnonzero(self.active):
+            self._release_slot(slot)
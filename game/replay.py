@@ -0,0 +1,229 @@
+"""
+Replays : graine + entrées du joueur + événements de jeu, en binaire compact.
+
+La simulation étant déterministe (pas fixe, flux aléatoires dérivés d'une
+graine), une partie se rejoue entièrement à partir de :
+
+- la graine maîtresse des flux aléatoires ;
+- le masque des touches lu à chaque tick par GameManager.handle_input ;
+- les événements de jeu (piège posé, tir, héros touché, téléportation), qui
+  servent au rejeu à vérifier que la partie recalculée ne diverge pas.
+
+Format du fichier (entiers en varint LEB128, signés en zigzag) :
+
+    MAGIC  version  graine  ticks_par_seconde
+    nombre_de_plages  (masque, longueur)*          plages de masques identiques
+    nombre_d_evenements  (delta_tick, type, nb_args, arg*)*
+
+Un masque ne change que lorsque le joueur appuie ou relâche une touche, et les
+ticks des événements sont stockés en écart avec l'événement précédent : une
+session de 10 minutes tient en quelques dizaines de kilo-octets.
+"""
+
+import pygame
+
+MAGIC = b"TNPH"
+VERSION = 1
+
+# Bits du masque d'entrées (une touche par bit)
+INPUT_KEYS = (
+    pygame.K_z,      # Haut
+    pygame.K_s,      # Bas
+    pygame.K_q,      # Gauche
+    pygame.K_d,      # Droite
+    pygame.K_SPACE,  # Boule de feu / relancer la partie
+    pygame.K_g,      # Piège
+    pygame.K_h,      # Bombe
+)
+KEY_BITS = {key: 1 << bit for bit, key in enumerate(INPUT_KEYS)}
+
+# Types d'événements
+TRAP_PLACED = 0     # args : type (TRAP_KIND / BOMB_KIND), x, y
+FIREBALL_FIRED = 1  # args : x, y
+HERO_HIT = 2        # args : cause (TRAP_KIND / BOMB_KIND / FIREBALL_KIND), x, y
+TELEPORT = 3        # args : aucun
+
+TRAP_KIND = 0
+BOMB_KIND = 1
+FIREBALL_KIND = 2
+
+
+def input_mask(pressed):
+    """Masque des touches de jeu enfoncées (à partir de pygame.key.get_pressed())"""
+    mask = 0
+    for key, bit in KEY_BITS.items():
+        if pressed[key]:
+            mask |= bit
+    return mask
+
+
+class KeyMask:
+    """Masque d'entrées consultable comme pygame.key.get_pressed() (pressed[pygame.K_z])"""
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+
+# --- Encodage varint ---
+
+def write_varint(out, value):
+    """Ajoute un entier positif en LEB128 à un bytearray"""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, offset):
+    """Lit un entier LEB128 ; retourne (valeur, offset suivant)"""
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Replay tronqué")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def zigzag(value):
+    """Entier signé -> entier positif (les petites valeurs restent petites)"""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    return value >> 1 if value % 2 == 0 else -(value + 1) // 2
+
+
+class ReplayRecorder:
+    """Enregistre les entrées et événements d'une partie, un masque par tick"""
+
+    def __init__(self, seed, tick_rate):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.runs = []  # [masque, nombre de ticks]
+        self.events = []  # (tick, type, args)
+        self.ticks = 0
+
+    def record_input(self, mask):
+        """Enregistre le masque d'entrées du tick courant"""
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+        self.ticks += 1
+
+    def record_event(self, kind, args):
+        """Enregistre un événement pendant le tick courant"""
+        self.events.append((self.ticks, kind, tuple(int(round(a)) for a in args)))
+
+    def to_bytes(self):
+        out = bytearray(MAGIC)
+        write_varint(out, VERSION)
+        write_varint(out, self.seed)
+        write_varint(out, self.tick_rate)
+
+        write_varint(out, len(self.runs))
+        for mask, length in self.runs:
+            write_varint(out, mask)
+            write_varint(out, length)
+
+        write_varint(out, len(self.events))
+        last_tick = 0
+        for tick, kind, args in self.events:
+            write_varint(out, tick - last_tick)
+            write_varint(out, kind)
+            write_varint(out, len(args))
+            for arg in args:
+                write_varint(out, zigzag(arg))
+            last_tick = tick
+        return bytes(out)
+
+    def save(self, path):
+        """Écrit le replay ; retourne sa taille en octets"""
+        data = self.to_bytes()
+        with open(path, "wb") as f:
+            f.write(data)
+        return len(data)
+
+
+class ReplayPlayer:
+    """Rejoue un fichier de replay : fournit le masque de chaque tick et vérifie les événements"""
+
+    def __init__(self, data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Ce fichier n'est pas un replay")
+        offset = len(MAGIC)
+        version, offset = read_varint(data, offset)
+        if version != VERSION:
+            raise ValueError(f"Version de replay non supportée: {version}")
+        self.seed, offset = read_varint(data, offset)
+        self.tick_rate, offset = read_varint(data, offset)
+
+        count, offset = read_varint(data, offset)
+        self.runs = []
+        for _ in range(count):
+            mask, offset = read_varint(data, offset)
+            length, offset = read_varint(data, offset)
+            self.runs.append((mask, length))
+
+        count, offset = read_varint(data, offset)
+        self.events = []
+        tick = 0
+        for _ in range(count):
+            delta, offset = read_varint(data, offset)
+            kind, offset = read_varint(data, offset)
+            nargs, offset = read_varint(data, offset)
+            args = []
+            for _ in range(nargs):
+                arg, offset = read_varint(data, offset)
+                args.append(unzigzag(arg))
+            tick += delta
+            self.events.append((tick, kind, tuple(args)))
+
+        self.total_ticks = sum(length for _, length in self.runs)
+        self.ticks = 0
+        self._run = 0
+        self._run_left = self.runs[0][1] if self.runs else 0
+        self._next_event = 0
+        self.desyncs = 0  # Événements recalculés différents de ceux enregistrés
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    @property
+    def finished(self):
+        return self.ticks >= self.total_ticks
+
+    def next_input(self):
+        """Masque d'entrées du tick suivant (0 une fois le replay terminé)"""
+        if self.finished:
+            return 0
+        while self._run_left == 0:
+            self._run += 1
+            self._run_left = self.runs[self._run][1]
+        self._run_left -= 1
+        self.ticks += 1
+        return self.runs[self._run][0]
+
+    def check_event(self, kind, args):
+        """Compare un événement recalculé au prochain événement enregistré"""
+        expected = None
+        if self._next_event < len(self.events):
+            expected = self.events[self._next_event]
+            self._next_event += 1
+        actual = (self.ticks, kind, tuple(int(round(a)) for a in args))
+        if expected != actual:
+            self.desyncs += 1
+            if self.desyncs == 1:
+                print(f"[Replay] ⚠️ Désynchronisation au tick {self.ticks}: attendu {expected}, obtenu {actual}")
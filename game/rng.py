@@ -0,0 +1,76 @@
+"""
+Service de nombres aléatoires déterministe.
+
+Une graine maîtresse unique engendre un flux indépendant par entité (héros,
+allié, chaque subordonné, projectiles, règles de la partie). Chaque flux est
+dérivé de la graine et du nom de l'entité via numpy.random.SeedSequence : il ne
+dépend ni de l'ordre de création des entités ni des tirages des autres. Deux
+parties lancées avec la même graine et les mêmes entrées produisent donc
+exactement les mêmes trajectoires.
+
+Les tirages sont faits par blocs : le Generator NumPy remplit un tampon de
+nombres uniformes d'un coup, puis chaque appel consomme simplement la valeur
+suivante. Les flux offrent la même interface que le module random
+(random, uniform, randint, choice), ce qui permet aux entités d'utiliser
+l'un ou l'autre.
+"""
+
+import zlib
+
+import numpy as np
+
+BUFFER_SIZE = 256  # Tirages générés à chaque remplissage du tampon
+
+
+class RandomStream:
+    """Flux aléatoire d'une entité, tiré par blocs depuis un Generator NumPy"""
+
+    __slots__ = ("generator", "buffer_size", "_buffer", "_index")
+
+    def __init__(self, generator, buffer_size=BUFFER_SIZE):
+        self.generator = generator
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._index = 0
+
+    def random(self):
+        """Réel uniforme dans [0, 1)"""
+        if self._index >= len(self._buffer):
+            self._buffer = self.generator.random(self.buffer_size).tolist()
+            self._index = 0
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+    def uniform(self, a, b):
+        """Réel uniforme entre a et b"""
+        return a + (b - a) * self.random()
+
+    def randint(self, a, b):
+        """Entier uniforme entre a et b inclus"""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        """Élément uniforme d'une séquence non vide"""
+        return seq[int(self.random() * len(seq))]
+
+
+class RandomService:
+    """Graine maîtresse de la partie et flux nommés qui en dérivent, possédé par le GameManager"""
+
+    def __init__(self, seed=None):
+        if seed is None:
+            # Graine tirée au hasard, mais conservée pour pouvoir rejouer la partie
+            seed = int(np.random.SeedSequence().entropy % (2 ** 63))
+        self.seed = seed
+        self._streams = {}
+
+    def stream(self, name):
+        """Flux de l'entité name (toujours le même objet pour un nom donné)"""
+        stream = self._streams.get(name)
+        if stream is None:
+            key = zlib.crc32(name.encode("utf-8"))
+            sequence = np.random.SeedSequence(self.seed, spawn_key=(key,))
+            stream = RandomStream(np.random.Generator(np.random.PCG64(sequence)))
+            self._streams[name] = stream
+        return stream
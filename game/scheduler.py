@@ -0,0 +1,69 @@
+"""
+Ordonnanceur des systèmes du jeu.
+
+Chaque tick exécute les phases dans un ordre fixe :
+
+    entrées -> IA -> physique -> collisions -> animation
+
+puis la phase de rendu est lancée séparément à chaque image. Un système est
+une fonction sans argument enregistrée dans une phase sous un nom ; chaque
+entité est ainsi mise à jour exactement une fois par tick, par les systèmes
+où elle est inscrite (et non plus via son appartenance à un groupe de sprites).
+
+Si un profileur actif est fourni, chaque système est chronométré comme une
+étape « phase/nom » ; inactif, il ne coûte qu'un test par phase.
+"""
+
+import time
+
+INPUT = "input"
+AI = "ai"
+PHYSICS = "physics"
+COLLISIONS = "collisions"
+ANIMATION = "animation"
+RENDER = "render"
+
+UPDATE_PHASES = (INPUT, AI, PHYSICS, COLLISIONS, ANIMATION)
+PHASES = UPDATE_PHASES + (RENDER,)
+
+
+class SystemScheduler:
+    """Liste ordonnée de systèmes (nom, fonction) par phase"""
+
+    def __init__(self, profiler=None):
+        self.phases = {phase: [] for phase in PHASES}
+        self.profiler = profiler  # utils.profiler.Profiler (optionnel)
+
+    def add(self, phase, name, system):
+        """Ajoute un système à la fin d'une phase"""
+        if phase not in self.phases:
+            raise ValueError(f"Phase inconnue: {phase}")
+        self.phases[phase].append((name, system, f"{phase}/{name}"))
+
+    def remove(self, name):
+        """Retire un système (dans toutes les phases)"""
+        for phase, systems in self.phases.items():
+            self.phases[phase] = [entry for entry in systems if entry[0] != name]
+
+    def systems(self, phase):
+        """Noms des systèmes d'une phase, dans l'ordre d'exécution"""
+        return [entry[0] for entry in self.phases[phase]]
+
+    def run(self, phase):
+        """Exécute tous les systèmes d'une phase"""
+        profiler = self.profiler
+        if profiler is None or not profiler.enabled:
+            for _, system, _ in self.phases[phase]:
+                system()
+            return
+        clock = time.perf_counter_ns
+        record = profiler.record
+        for _, system, label in self.phases[phase]:
+            start = clock()
+            system()
+            record(label, clock() - start)
+
+    def update(self):
+        """Exécute un tick complet (toutes les phases sauf le rendu)"""
+        for phase in UPDATE_PHASES:
+            self.run(phase)
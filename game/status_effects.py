@@ -0,0 +1,85 @@
+"""
+Effets de statut (étourdissement, ralentissement, dégâts sur la durée).
+
+Les durées sont comptées en ticks de l'horloge de simulation (une mise à
+jour = un tick) : un effet expire pendant update() de l'entité, sans jamais
+bloquer la boucle principale. Chaque entité ne garde qu'un emplacement par type
+d'effet ; réappliquer un effet prolonge l'emplacement au lieu d'en empiler un
+nouveau.
+"""
+
+from game.game_clock import TICK_RATE
+
+TICKS_PER_SECOND = TICK_RATE
+
+# Types d'effets (index de l'emplacement)
+STUN = 0
+SLOW = 1
+DOT = 2
+EFFECT_COUNT = 3
+
+
+class StatusEffects:
+    """Emplacements d'effets actifs d'une entité (un par type)"""
+
+    __slots__ = ("remaining", "duration", "magnitude")
+
+    def __init__(self):
+        self.remaining = [0] * EFFECT_COUNT    # Ticks restants
+        self.duration = [0] * EFFECT_COUNT     # Durée totale de l'effet en cours (ticks)
+        self.magnitude = [0.0] * EFFECT_COUNT  # SLOW : fraction de vitesse retirée, DOT : dégâts par seconde
+
+    def apply(self, effect, seconds, magnitude=0.0):
+        """Applique un effet pendant seconds secondes (garde la durée et l'intensité les plus fortes)"""
+        ticks = int(round(seconds * TICKS_PER_SECOND))
+        if ticks <= 0:
+            return
+        if ticks > self.remaining[effect]:
+            self.remaining[effect] = ticks
+            self.duration[effect] = ticks
+        if magnitude > self.magnitude[effect]:
+            self.magnitude[effect] = magnitude
+
+    def update(self):
+        """Avance d'un tick ; retourne les dégâts sur la durée infligés pendant ce tick"""
+        damage = 0.0
+        remaining = self.remaining
+        for effect in range(EFFECT_COUNT):
+            if remaining[effect] <= 0:
+                continue
+            if effect == DOT:
+                damage = self.magnitude[DOT] / TICKS_PER_SECOND
+            remaining[effect] -= 1
+            if remaining[effect] == 0:
+                self.duration[effect] = 0
+                self.magnitude[effect] = 0.0
+        return damage
+
+    def clear(self):
+        """Retire tous les effets"""
+        for effect in range(EFFECT_COUNT):
+            self.remaining[effect] = 0
+            self.duration[effect] = 0
+            self.magnitude[effect] = 0.0
+
+    def is_active(self, effect):
+        return self.remaining[effect] > 0
+
+    @property
+    def is_stunned(self):
+        return self.remaining[STUN] > 0
+
+    @property
+    def speed_factor(self):
+        """Multiplicateur de vitesse : 0 si étourdi, réduit si ralenti, 1 sinon"""
+        if self.remaining[STUN] > 0:
+            return 0.0
+        if self.remaining[SLOW] > 0:
+            return max(0.0, 1.0 - self.magnitude[SLOW])
+        return 1.0
+
+    def progress(self, effect):
+        """Fraction restante de l'effet (1.0 au moment de l'application, 0.0 une fois expiré)"""
+        if self.duration[effect] <= 0:
+            return 0.0
+        return self.remaining[effect] / self.duration[effect]
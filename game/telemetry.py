@@ -0,0 +1,129 @@
+"""
+Télémétrie de partie (section 8 du README).
+
+Les événements de jeu passent par l'EventBus du GameManager. La télémétrie s'y
+abonne et, à chaque distribution, recopie les champs de chaque événement dans
+un tampon circulaire préalloué : côté boucle de jeu, aucune allocation de
+ligne ni entrée/sortie. Un thread d'écriture vide le tampon par lots dans un
+fichier JSONL (une ligne par événement) sous logs/.
+
+Si le thread prend trop de retard et que le tampon est plein, les nouveaux
+événements sont comptés dans dropped au lieu de bloquer le jeu.
+"""
+
+import json
+import os
+import threading
+import time
+
+from game.events import (
+    TRAP_PLACED, TRAP_TRIGGERED, HERO_HIT, HERO_DEATH, COINS_CHANGE, A_STAR_PATH_HASH, HERO_ACTION,
+)
+
+# Événements de la PRD, plus hero_hit (remplace les print() de la boucle de jeu)
+TELEMETRY_EVENTS = (
+    TRAP_PLACED,
+    TRAP_TRIGGERED,
+    HERO_HIT,
+    HERO_DEATH,
+    COINS_CHANGE,
+    A_STAR_PATH_HASH,
+    HERO_ACTION,
+)
+
+DEFAULT_CAPACITY = 8192
+FLUSH_INTERVAL = 0.5  # Secondes entre deux vidages du tampon
+
+
+def default_log_path(directory="logs"):
+    """Fichier de télémétrie horodaté dans logs/"""
+    return os.path.join(directory, time.strftime("telemetry-%Y%m%d-%H%M%S.jsonl"))
+
+
+class Telemetry:
+    """Tampon circulaire d'événements et thread d'écriture, branché sur un EventBus"""
+
+    def __init__(self, event_bus, path, capacity=DEFAULT_CAPACITY, flush_interval=FLUSH_INTERVAL):
+        self.event_bus = event_bus
+        self.path = path
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+
+        # Tampon circulaire en colonnes : tick, type et champs de l'événement
+        self._ticks = [0] * capacity
+        self._types = [0] * capacity
+        self._values = [[None] * capacity for _ in range(4)]
+        self._head = 0  # Prochain emplacement écrit (boucle de jeu uniquement)
+        self._tail = 0  # Prochain emplacement lu (thread d'écriture uniquement)
+        self.dropped = 0
+        self.written = 0
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """S'abonne aux événements et lance le thread d'écriture"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        for event_id in TELEMETRY_EVENTS:
+            self.event_bus.on(event_id, self.on_event)
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    def on_event(self, event):
+        """Handler de l'EventBus : recopie l'événement dans le tampon (l'enregistrement retourne au pool)"""
+        head = self._head
+        if head - self._tail >= self.capacity:
+            self.dropped += 1
+            return
+        slot = head % self.capacity
+        self._ticks[slot] = event.tick
+        self._types[slot] = event.type
+        a, b, c, d = self._values
+        a[slot] = event.a
+        b[slot] = event.b
+        c[slot] = event.c
+        d[slot] = event.d
+        self._head = head + 1
+
+    def _drain(self, out):
+        """Écrit tous les événements disponibles ; retourne leur nombre"""
+        head = self._head
+        tail = self._tail
+        if head == tail:
+            return 0
+        capacity = self.capacity
+        names = self.event_bus.names
+        fields = self.event_bus.fields
+        columns = self._values
+        lines = []
+        for index in range(tail, head):
+            slot = index % capacity
+            event_id = self._types[slot]
+            record = {"tick": self._ticks[slot], "event": names[event_id]}
+            for name, column in zip(fields[event_id], columns):
+                record[name] = column[slot]
+            lines.append(json.dumps(record, ensure_ascii=False))
+        out.write("\n".join(lines))
+        out.write("\n")
+        out.flush()
+        self._tail = head
+        self.written += head - tail
+        return head - tail
+
+    def _run(self):
+        with open(self.path, "a", encoding="utf-8") as out:
+            while not self._stop.wait(self.flush_interval):
+                self._drain(out)
+            self._drain(out)
+
+    def close(self):
+        """Distribue les derniers événements, se désabonne, vide le tampon et arrête le thread"""
+        self.event_bus.dispatch()
+        for event_id in TELEMETRY_EVENTS:
+            self.event_bus.off(event_id, self.on_event)
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
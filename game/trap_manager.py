@@ -0,0 +1,93 @@
+"""
+Registre des pièges posés sur la carte (pièges et bombes).
+
+Chaque piège armé est rangé dans les cellules de la grille que son rectangle
+recouvre. Une requête « quels pièges armés touchent ce rectangle » ne regarde
+que les quelques cellules sous le rectangle, quel que soit le nombre de pièges
+posés.
+
+Un piège quitte le registre (et les groupes de sprites) dès qu'il se déclenche
+ou quand sa durée de vie est écoulée.
+"""
+
+import heapq
+
+from game.events import TRAP_PLACED
+
+
+class TrapManager:
+    """Pièges armés indexés par cellule de grille, possédé par le GameManager"""
+
+    def __init__(self, cell_width=32, cell_height=32, event_bus=None):
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.event_bus = event_bus  # Reçoit trap_placed à chaque pose
+        # Cellule (cx, cy) -> liste des pièges armés qui la recouvrent
+        self.cells = {}
+        # Tas des échéances (expires_at, numéro de pose, piège) : pièges et bombes
+        # n'ont pas la même durée de vie, l'ordre de pose ne suffit pas
+        self._expiries = []
+        self._sequence = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _cells_of(self, rect):
+        """Cellules recouvertes par un rectangle"""
+        for cy in range(rect.top // self.cell_height, (rect.bottom - 1) // self.cell_height + 1):
+            for cx in range(rect.left // self.cell_width, (rect.right - 1) // self.cell_width + 1):
+                yield cx, cy
+
+    def add(self, trap, now):
+        """Arme un piège posé à l'instant now (ms)"""
+        trap.active = True
+        trap.expires_at = now + trap.lifetime
+        for cell in self._cells_of(trap.rect):
+            self.cells.setdefault(cell, []).append(trap)
+        heapq.heappush(self._expiries, (trap.expires_at, self._sequence, trap))
+        self._sequence += 1
+        self._count += 1
+        if self.event_bus is not None:
+            self.event_bus.emit(TRAP_PLACED, type(trap).__name__.lower(), trap.rect.centerx, trap.rect.centery)
+
+    def remove(self, trap):
+        """Retire un piège du registre et de tous les groupes de sprites"""
+        if not trap.active:
+            return
+        trap.active = False
+        for cell in self._cells_of(trap.rect):
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                continue
+            bucket.remove(trap)
+            if not bucket:
+                del self.cells[cell]
+        self._count -= 1
+        trap.kill()
+
+    def query_rect(self, rect):
+        """Retourne les pièges armés qui chevauchent le rectangle donné"""
+        found = []
+        seen = set()  # Un piège à cheval sur plusieurs cellules n'est retourné qu'une fois
+        for cell in self._cells_of(rect):
+            for trap in self.cells.get(cell, ()):
+                if id(trap) not in seen and trap.rect.colliderect(rect):
+                    seen.add(id(trap))
+                    found.append(trap)
+        return found
+
+    def update(self, now):
+        """Retire les pièges expirés (les pièges déjà déclenchés sont simplement oubliés)"""
+        expiries = self._expiries
+        while expiries and expiries[0][0] <= now:
+            expires_at, _, trap = heapq.heappop(expiries)
+            # Une entrée périmée (piège déclenché, ou réarmé depuis) est ignorée
+            if trap.expires_at == expires_at:
+                self.remove(trap)
+
+    def clear(self):
+        """Retire tous les pièges (remise à zéro de la partie)"""
+        for _, _, trap in self._expiries:
+            self.remove(trap)
+        self._expiries = []
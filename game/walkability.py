@@ -0,0 +1,151 @@
+"""
+Grille de marche précalculée à partir des objets de collision TMX.
+
+Chaque cellule (demi-tuile par défaut) vaut :
+- FREE    : aucun rectangle de collision ne la touche
+- BLOCKED : un rectangle la recouvre entièrement
+- MIXED   : elle est touchée partiellement (test exact via l'index spatial)
+
+La grille est sauvegardée à côté de la carte dans un fichier binaire compact,
+indexé par le hash du fichier TMX : elle n'est rastérisée que si la carte change.
+"""
+
+import math
+import os
+import struct
+
+import numpy as np
+
+from utils.map_cache import cache_path, file_digest
+
+FREE = 0
+BLOCKED = 1
+MIXED = 2
+
+CACHE_SUFFIX = ".walkgrid"
+CACHE_MAGIC = b"WALK"
+CACHE_VERSION = 1
+# magic, version, cell_size, width, height, sha256 du TMX
+CACHE_HEADER = struct.Struct("<4sHHHH32s")
+
+
+class WalkabilityGrid:
+    """Grille FREE/BLOCKED/MIXED stockée en tableau NumPy uint8 (lignes = y)"""
+
+    def __init__(self, cells, cell_size):
+        self.cells = np.ascontiguousarray(cells, dtype=np.uint8)
+        self.cell_size = cell_size
+        self.height, self.width = self.cells.shape
+        # Copie en bytes pour des lookups ponctuels sans passer par NumPy
+        self._flat = self.cells.tobytes()
+
+    @classmethod
+    def rasterize(cls, collision_objects, map_width, map_height, cell_size=16):
+        """Rastérise les rectangles de collision sur une grille de cellules de cell_size px"""
+        width = int(math.ceil(map_width / cell_size))
+        height = int(math.ceil(map_height / cell_size))
+        touched = np.zeros((height, width), dtype=bool)
+        covered = np.zeros((height, width), dtype=bool)
+
+        for obj in collision_objects:
+            x1, y1 = obj.x, obj.y
+            x2, y2 = obj.x + obj.width, obj.y + obj.height
+
+            # Cellules touchées (bords inclus, comme le test point-rectangle)
+            tx1 = max(0, int(x1 // cell_size))
+            ty1 = max(0, int(y1 // cell_size))
+            tx2 = min(width - 1, int(x2 // cell_size))
+            ty2 = min(height - 1, int(y2 // cell_size))
+            if tx1 <= tx2 and ty1 <= ty2:
+                touched[ty1:ty2 + 1, tx1:tx2 + 1] = True
+
+            # Cellules entièrement recouvertes
+            cx1 = max(0, int(math.ceil(x1 / cell_size)))
+            cy1 = max(0, int(math.ceil(y1 / cell_size)))
+            cx2 = min(width, int(x2 // cell_size))
+            cy2 = min(height, int(y2 // cell_size))
+            if cx1 < cx2 and cy1 < cy2:
+                covered[cy1:cy2, cx1:cx2] = True
+
+        cells = np.where(covered, BLOCKED, np.where(touched, MIXED, FREE))
+        return cls(cells, cell_size)
+
+    @classmethod
+    def load_or_build(cls, tmx_path, collision_objects, map_width, map_height, cell_size=16):
+        """Charge la grille depuis le cache si le TMX n'a pas changé, sinon la reconstruit"""
+        digest = file_digest(tmx_path)
+        path = cache_path(tmx_path, CACHE_SUFFIX)
+
+        grid = cls.load(path, digest, cell_size)
+        if grid is not None:
+            return grid
+
+        grid = cls.rasterize(collision_objects, map_width, map_height, cell_size)
+        try:
+            grid.save(path, digest)
+        except OSError as e:
+            print(f"[Walkability] Impossible d'écrire le cache {path}: {e}")
+        return grid
+
+    @classmethod
+    def load(cls, path, digest, cell_size):
+        """Lit un fichier de cache ; retourne None s'il est absent, invalide ou périmé"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            print(f"[Walkability] Impossible de lire le cache {path}: {e}")
+            return None
+        if len(data) < CACHE_HEADER.size:
+            return None
+        magic, version, size, width, height, cached_digest = CACHE_HEADER.unpack_from(data)
+        if (magic != CACHE_MAGIC or version != CACHE_VERSION or size != cell_size
+                or cached_digest != digest):
+            return None
+        payload = data[CACHE_HEADER.size:]
+        if len(payload) != width * height:
+            return None
+        cells = np.frombuffer(payload, dtype=np.uint8).reshape(height, width)
+        return cls(cells, cell_size)
+
+    def save(self, path, digest):
+        """Écrit la grille (en-tête + une cellule par octet)"""
+        header = CACHE_HEADER.pack(
+            CACHE_MAGIC, CACHE_VERSION, self.cell_size, self.width, self.height, digest
+        )
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(self._flat)
+
+    def state_at(self, x, y):
+        """État de la cellule contenant le point (x, y) ; MIXED hors de la carte"""
+        cx = int(x // self.cell_size)
+        cy = int(y // self.cell_size)
+        if 0 <= cx < self.width and 0 <= cy < self.height:
+            return self._flat[cy * self.width + cx]
+        return MIXED
+
+    def cell_of(self, x, y):
+        """Cellule (cx, cy) contenant le point (x, y)"""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def cell_center(self, cx, cy):
+        """Centre en pixels de la cellule (cx, cy)"""
+        half = self.cell_size / 2
+        return cx * self.cell_size + half, cy * self.cell_size + half
+
+    def walkable_mask(self, factor=1):
+        """Tableau booléen des cellules entièrement libres.
+
+        Avec factor > 1, les cellules sont regroupées par blocs factor x factor :
+        un bloc n'est praticable que si toutes ses cellules sont libres.
+        """
+        free = self.cells == FREE
+        if factor == 1:
+            return free
+        height = self.height // factor * factor
+        width = self.width // factor * factor
+        blocks = free[:height, :width].reshape(height // factor, factor, width // factor, factor)
+        return blocks.all(axis=(1, 3))
@@ -10,11 +10,15 @@ from utils.animation import (
 )
 
 from actions.actions import check_trap
+from game.events import A_STAR_PATH_HASH, HERO_ACTION
+from game.status_effects import StatusEffects
 
 
 class Bot(pygame.sprite.Sprite):
-    def __init__(self, x, y, ally_bot, game_manager):
+    def __init__(self, x, y, ally_bot, game_manager, rng=None):
         super().__init__()
+        # Flux aléatoire propre à l'entité (module random si aucun flux n'est fourni)
+        self.rng = rng if rng is not None else random
         # Utiliser le même sprite sheet que le joueur mais avec une couleur différente
         self.sprite_sheet = load_sprite_sheet('assets/sprites/player/Hero.png')
         self.rect = pygame.Rect(x, y, 32, 32)
@@ -29,98 +33,27 @@ class Bot(pygame.sprite.Sprite):
         # Référence au bot allié à suivre (au lieu du joueur)
         self.ally_bot = ally_bot
         
-        # Système de checkpoints - Nouvelle liste de positions du joueur
-        self.checkpoints = [
-            (624.67, 6317.67),
-            (789.67, 6317.67),
-            (921.67, 6317.67),
-            (954.67, 6317.67),
-            (954.67, 6035.67),
-            (873.67, 5999.67),
-            (873.67, 6041.67),
-            (813.67, 6071.67),
-            (687.67, 6071.67),
-            (606.67, 6071.67),
-            (606.67, 5999.67),
-            (552.67, 5999.67),
-            (507.67, 5942.67),
-            (360.67, 5942.67),
-            (270.67, 5870.67),
-            (225.67, 5756.67),
-            (258.67, 5636.67),
-            (336.67, 5567.67),
-            (432.67, 5489.67),
-            (552.67, 5456.67),
-            (663.67, 5456.67),
-            (804.67, 5456.67),
-            (927.67, 5456.67),
-            (972.67, 5381.67),
-            (1083.67, 5330.67),
-            (1083.67, 5165.67),
-            (993.67, 5033.67),
-            (915.67, 4958.67),
-            (762.67, 4934.67),
-            (672.67, 4889.67),
-            (621.67, 4811.67),
-            (522.67, 4745.67),
-            (411.67, 4616.67),
-            (333.67, 4532.67),
-            (333.67, 4361.67),
-            (333.67, 4190.67),
-            (291.67, 4067.67),
-            (291.67, 3983.67),
-            (291.67, 3914.67),
-            (408.67, 3914.67),
-            (510.67, 3863.67),
-            (609.67, 3863.67),
-            (702.67, 3863.67),
-            (702.67, 3911.67),
-            (846.67, 3911.67),
-            (990.67, 3911.67),
-            (1044.67, 3911.67),
-            (1092.67, 3761.67),
-            (984.67, 3629.67),
-            (882.67, 3566.67),
-            (795.67, 3536.67),
-            (669.67, 3536.67),
-            (483.67, 3536.67),
-            (363.67, 3500.67),
-            (297.67, 3440.67),
-            (258.67, 3311.67),
-            (339.67, 3197.67),
-            (468.67, 3101.67),
-            (606.67, 3023.67),
-            (681.67, 2915.67),
-            (681.67, 2777.67),
-            (639.67, 2585.67),
-            (603.67, 2408.67),
-            (603.67, 2234.67),
-            (561.67, 2069.67),
-            (363.67, 1994.67),
-            (264.67, 1859.67),
-            (264.67, 1748.67),
-            (354.67, 1748.67),
-            (432.67, 1631.67),
-            (561.67, 1565.67),
-            (624.67, 1481.67),
-            (624.67, 1367.67),
-            (624.67, 1220.67),
-            (876.67, 1028.67),
-            (933.67, 908.67),
-            (858.67, 824.67),
-            (612.67, 791.67),
-            (612.67, 650.67),
-            (612.67, 440.67),
-            (612.67, 323.67)
-        ]
-        self.current_checkpoint_index = 0
-        self.checkpoint_reached_distance = 50  # Distance pour considérer qu'un checkpoint est atteint
-        self.state = "checkpoint_following"  # Nouvel état pour suivre les checkpoints
+        # Suivi de chemin A* vers la sortie (le pathfinder et l'objectif viennent du GameManager)
+        self.pathfinder = getattr(game_manager, 'pathfinder', None)
+        self.goal = getattr(game_manager, 'hero_goal', None)
+        # Planificateur incrémental et danger map : le chemin évite les zones piégées
+        self.planner = getattr(game_manager, 'hero_planner', None)
+        self.danger_map = getattr(game_manager, 'danger_map', None)
+        # Bus d'événements : changements d'état et chemins calculés (télémétrie)
+        self.event_bus = getattr(game_manager, 'event_bus', None)
+        self.path = []
+        self.path_index = 0
+        self.waypoint_reached_distance = 24  # Distance pour considérer qu'un point du chemin est atteint
+        self.replan_cooldown = 0  # Frames à attendre avant de retenter un calcul de chemin échoué
+        self.state = "path_following"
+        
+        # Effets de statut (étourdissement, ralentissement, brûlure) décomptés à chaque update
+        self.status = StatusEffects()
         
         # Variables pour l'IA de suivi et rotation (gardées pour compatibilité)
         self.follow_distance = 80  # Distance à maintenir avec le bot allié
         self.orbit_radius = 45     # Rayon de l'orbite autour du bot allié (réduit pour plus de proximité)
-        self.orbit_angle = random.uniform(0, 2 * math.pi)  # Angle initial aléatoire
+        self.orbit_angle = self.rng.uniform(0, 2 * math.pi)  # Angle initial aléatoire
         self.orbit_speed = 0.04    # Vitesse de rotation autour du bot allié (augmentée pour plus de dynamisme)
         self.state_timer = 0
         self.state_change_interval = 180  # Changer d'état toutes les 3 secondes (60 FPS)
@@ -150,6 +83,7 @@ class Bot(pygame.sprite.Sprite):
         
         # Système de collision avec les objets TMX
         self.collision_objects = []
+        self.collision_index = None  # Index spatial partagé (construit par le GameManager)
         
         # Récupérer toutes les frames (même système que le joueur)
         self.animations = load_directional_animations(
@@ -171,9 +105,10 @@ class Bot(pygame.sprite.Sprite):
         self.image = self.animations['down'][0]
         self.is_moving = False
 
-    def set_collision_objects(self, collision_objects):
-        """Définir les objets de collision TMX"""
+    def set_collision_objects(self, collision_objects, collision_index=None):
+        """Définir les objets de collision TMX (et l'index spatial partagé s'il existe)"""
         self.collision_objects = collision_objects
+        self.collision_index = collision_index
 
     def save_position(self):
         """Sauvegarder la position actuelle pour pouvoir revenir en arrière en cas de collision"""
@@ -191,6 +126,8 @@ class Bot(pygame.sprite.Sprite):
 
     def check_collision_at_position(self, x, y):
         """Vérifier s'il y a collision à une position donnée"""
+        if self.collision_index is not None:
+            return self.collision_index.collides_point(x, y)
         for obj in self.collision_objects:
             if (x >= obj.x and y >= obj.y and
                 x <= obj.x + obj.width and y <= obj.y + obj.height):
@@ -218,14 +155,38 @@ class Bot(pygame.sprite.Sprite):
             direction,
             self.frame_index,
         )
-    def get_distance_to_checkpoint(self):
-        """Calcule la distance au checkpoint actuel"""
-        if self.current_checkpoint_index >= len(self.checkpoints):
-            return 0  # Tous les checkpoints ont été atteints
+    def plan_path(self):
+        """Calcule le chemin de la position actuelle jusqu'à l'objectif (en tenant compte du danger)"""
+        self.path = []
+        self.path_index = 0
+        if self.pathfinder is None or self.goal is None:
+            return
+        if self.planner is not None:
+            # Ne transmettre au planificateur que les cellules dont le danger a changé
+            if self.danger_map is not None and self.danger_map.has_changes():
+                self.planner.update_costs(self.danger_map.consume_changes())
+            self.path = self.planner.find_path(self.position)
+        else:
+            self.path = self.pathfinder.find_path(self.position, self.goal)
+        if not self.path:
+            self.replan_cooldown = 60  # Ne pas relancer A* à chaque frame si la sortie est inaccessible
+        elif self.event_bus is not None:
+            self.event_bus.emit(A_STAR_PATH_HASH, hash(tuple(self.path)) & 0xFFFFFFFF, len(self.path))
+
+    def set_state(self, state):
+        """Change l'état de l'IA (suivi de chemin, orbite, attente) et le signale (hero_action)"""
+        self.state = state
+        if self.event_bus is not None:
+            self.event_bus.emit(HERO_ACTION, state, round(self.position[0]), round(self.position[1]))
+
+    def get_distance_to_waypoint(self):
+        """Calcule la distance au prochain point du chemin"""
+        if self.path_index >= len(self.path):
+            return 0  # Chemin terminé
         
-        checkpoint = self.checkpoints[self.current_checkpoint_index]
-        dx = self.position[0] - checkpoint[0]
-        dy = self.position[1] - checkpoint[1]
+        waypoint = self.path[self.path_index]
+        dx = self.position[0] - waypoint[0]
+        dy = self.position[1] - waypoint[1]
         return math.sqrt(dx*dx + dy*dy)
 
     def get_distance_to_ally(self):
@@ -246,42 +207,55 @@ class Bot(pygame.sprite.Sprite):
         dy = ally_pos[1] - self.position[1]
         return math.atan2(dy, dx)
 
+    def update_status(self):
+        """Décompte les effets de statut ; la brûlure fait monter le pourcentage à chaque tick"""
+        burn_damage = self.status.update()
+        if burn_damage:
+            self.game_manager.percentage = min(100.0, self.game_manager.percentage + burn_damage)
+
     def update_ai(self):
         """Mise à jour de l'intelligence artificielle du bot"""
+        if self.status.is_stunned:
+            return
+        
         # Vérifier d'abord la proximité avec l'ally bot
         distance_to_ally = self.get_distance_to_ally()
         
         # Si l'ally bot est proche (moins de 100 pixels), passer en mode orbite
         if distance_to_ally < 100 and self.ally_bot:
             if self.state != "orbiting" and self.state != "waiting":
-                self.state = "orbiting"
+                self.set_state("orbiting")
                 self.orbit_angle = self.get_angle_to_ally()
                 self.orbit_timer = 0  # Réinitialiser le timer d'orbite
-        # Si l'ally bot est loin (plus de 150 pixels), retourner au suivi des checkpoints
+        # Si l'ally bot est loin (plus de 150 pixels), reprendre le chemin vers la sortie
         elif distance_to_ally > 150 or not self.ally_bot:
-            if self.state != "checkpoint_following":
-                self.state = "checkpoint_following"
+            if self.state != "path_following":
+                self.set_state("path_following")
                 self.orbit_timer = 0
                 self.wait_timer = 0
+                self.plan_path()
         
-        if self.state == "checkpoint_following":
-            # Vérifier si tous les checkpoints ont été atteints
-            if self.current_checkpoint_index >= len(self.checkpoints):
-                # Recommencer depuis le premier checkpoint
-                self.current_checkpoint_index = 0
-            
-            # Obtenir le checkpoint actuel
-            current_checkpoint = self.checkpoints[self.current_checkpoint_index]
-            distance_to_checkpoint = self.get_distance_to_checkpoint()
+        if self.state == "path_following":
+            # Replanifier si des pièges ou des projectiles ont modifié la danger map
+            if self.danger_map is not None and self.danger_map.has_changes():
+                self.plan_path()
+            # Calculer le chemin s'il n'y en a pas encore
+            if not self.path:
+                if self.replan_cooldown > 0:
+                    self.replan_cooldown -= 1
+                else:
+                    self.plan_path()
             
-            # Vérifier si le checkpoint actuel est atteint
-            if distance_to_checkpoint <= self.checkpoint_reached_distance:
-                self.current_checkpoint_index += 1
+            # Avancer au point suivant dès que le point actuel est atteint
+            while (self.path_index < len(self.path) - 1 and
+                   self.get_distance_to_waypoint() <= self.waypoint_reached_distance):
+                self.path_index += 1
             
-            # Définir la cible comme le checkpoint actuel
-            if self.current_checkpoint_index < len(self.checkpoints):
-                self.target_x = current_checkpoint[0]
-                self.target_y = current_checkpoint[1]
+            # Définir la cible comme le point actuel du chemin (ou rester sur place si aucun chemin)
+            if self.path_index < len(self.path):
+                self.target_x, self.target_y = self.path[self.path_index]
+            else:
+                self.target_x, self.target_y = self.position
         
         elif self.state == "orbiting":
             # Comportement d'orbite autour du bot allié avec timer
@@ -289,7 +263,7 @@ class Bot(pygame.sprite.Sprite):
             
             # Si on a orbitté pendant 10 secondes, passer en mode attente
             if self.orbit_timer >= self.orbit_duration:
-                self.state = "waiting"
+                self.set_state("waiting")
                 self.wait_timer = 0
                 # Arrêter le mouvement pendant l'attente
                 self.target_x = self.rect.centerx
@@ -312,14 +286,12 @@ class Bot(pygame.sprite.Sprite):
             self.target_x = self.rect.centerx
             self.target_y = self.rect.centery
             
-            # Si on a attendu 10 secondes, retourner au suivi des checkpoints
+            # Si on a attendu 10 secondes, reprendre le chemin depuis la position actuelle
             if self.wait_timer >= self.wait_duration:
-                self.state = "checkpoint_following"
+                self.set_state("path_following")
                 self.orbit_timer = 0
                 self.wait_timer = 0
-                
-                # Retourner à deux checkpoints en arrière
-                self.current_checkpoint_index = max(0, self.current_checkpoint_index - 2)
+                self.plan_path()
         
         else:
             # Ancien comportement de suivi de l'ally bot (gardé pour compatibilité si nécessaire)
@@ -327,18 +299,25 @@ class Bot(pygame.sprite.Sprite):
 
     def update_movement(self):
         """Mise à jour du mouvement fluide vers la cible avec des comportements naturels"""
+        if self.status.is_stunned:
+            # Étourdi : pas de déplacement, l'élan est perdu
+            self.velocity_x = 0
+            self.velocity_y = 0
+            self.is_moving = False
+            return
+        
         # Sauvegarder la position actuelle
         self.save_position()
         
         # Micro-mouvements pour simuler l'imprécision naturelle
         self.micro_movement_timer += 1
-        if self.micro_movement_timer >= random.randint(4, 10):  # Variation dans le timing
+        if self.micro_movement_timer >= self.rng.randint(4, 10):  # Variation dans le timing
             self.micro_movement_timer = 0
-            self.micro_movement_x = random.uniform(-0.12, 0.12)
-            self.micro_movement_y = random.uniform(-0.12, 0.12)
+            self.micro_movement_x = self.rng.uniform(-0.12, 0.12)
+            self.micro_movement_y = self.rng.uniform(-0.12, 0.12)
         
         # Effet de "respiration" subtil
-        self.breathing_timer += 0.06 + random.uniform(-0.01, 0.01)
+        self.breathing_timer += 0.06 + self.rng.uniform(-0.01, 0.01)
         breathing_effect_x = math.sin(self.breathing_timer) * 0.06
         breathing_effect_y = math.cos(self.breathing_timer * 0.8) * 0.04
         
@@ -354,9 +333,9 @@ class Bot(pygame.sprite.Sprite):
         if distance_to_target > 3:
             current_direction = math.atan2(dy, dx)
             if abs(current_direction - self.last_direction_change) > 0.4:
-                if random.random() < 0.15 and not self.is_hesitating:  # 15% de chance
+                if self.rng.random() < 0.15 and not self.is_hesitating:  # 15% de chance
                     self.is_hesitating = True
-                    self.hesitation_timer = random.randint(6, 15)
+                    self.hesitation_timer = self.rng.randint(6, 15)
                     self.last_direction_change = current_direction
         
         # Gérer l'hésitation
@@ -365,10 +344,10 @@ class Bot(pygame.sprite.Sprite):
             if self.hesitation_timer <= 0:
                 self.is_hesitating = False
             # Réduire le mouvement pendant l'hésitation
-            self.natural_speed_variation = 0.4 + random.uniform(0, 0.3)
+            self.natural_speed_variation = 0.4 + self.rng.uniform(0, 0.3)
         else:
             # Variation naturelle de la vitesse
-            base_variation = 1.0 + random.uniform(0, 0.2)  # Augmenté de 0.8-1.2 à 1.0-1.2
+            base_variation = 1.0 + self.rng.uniform(0, 0.2)  # Augmenté de 0.8-1.2 à 1.0-1.2
             # Ajuster selon la distance (plus loin = plus rapide)
             distance_factor = min(1.3, 1.0 + distance_to_target * 0.008)  # Augmenté les facteurs
             self.natural_speed_variation = base_variation * distance_factor
@@ -384,20 +363,21 @@ class Bot(pygame.sprite.Sprite):
         self.velocity_y += (target_velocity_y - self.velocity_y) * transition_speed
         
         # Limiter la vitesse maximale avec variation naturelle
-        current_max_speed = self.speed * (1.0 + random.uniform(0, 0.2))  # Augmenté de 0.85-1.15 à 1.0-1.2
+        current_max_speed = self.speed * (1.0 + self.rng.uniform(0, 0.2))  # Augmenté de 0.85-1.15 à 1.0-1.2
         speed = math.sqrt(self.velocity_x * self.velocity_x + self.velocity_y * self.velocity_y)
         if speed > current_max_speed:
             self.velocity_x = (self.velocity_x / speed) * current_max_speed
             self.velocity_y = (self.velocity_y / speed) * current_max_speed
         
         # Appliquer une friction variable
-        friction_factor = self.friction + random.uniform(-0.02, 0.02)
+        friction_factor = self.friction + self.rng.uniform(-0.02, 0.02)
         self.velocity_x *= friction_factor
         self.velocity_y *= friction_factor
         
-        # Calculer la nouvelle position
-        new_x = self.position[0] + self.velocity_x
-        new_y = self.position[1] + self.velocity_y
+        # Calculer la nouvelle position (réduite si le héros est ralenti)
+        speed_factor = self.status.speed_factor
+        new_x = self.position[0] + self.velocity_x * speed_factor
+        new_y = self.position[1] + self.velocity_y * speed_factor
         
         # Vérifier les collisions avant de mettre à jour la position
         if self.can_move_to(new_x, new_y):
@@ -438,18 +418,20 @@ class Bot(pygame.sprite.Sprite):
                 self.is_moving = False
 
     def update(self):
-        """Mise à jour principale du bot"""
-        # Mise à jour de l'IA
+        """Enchaîne les phases du bot (le jeu passe par le SystemScheduler)"""
+        self.update_status()
         self.update_ai()
-        
-        # Mise à jour du mouvement
         self.update_movement()
-        check_trap(self)
-        
-        # Mise à jour de la position du rect
+        self.update_collisions()
+        self.update_animation()
+
+    def update_collisions(self):
+        """Place le rect à la nouvelle position et déclenche les pièges touchés"""
         self.rect.topleft = (int(self.position[0]), int(self.position[1]))
-        
-        # Mise à jour de l'animation
+        check_trap(self)
+
+    def update_animation(self):
+        """Avance l'animation du bot"""
         frames = self.animations[self.current_direction]
         self.frame_index, self.image = advance_animation(
             self.frame_index,
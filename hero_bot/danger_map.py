@@ -0,0 +1,67 @@
+"""
+Danger map du héros (adaptation IA, Tier 1).
+
+Chaque piège qui se déclenche et chaque projectile qui touche le héros ajoute
+du danger aux cellules autour de l'impact :
+
+    danger_map[cell] += weight
+    cell_cost = base_cost + danger_map[cell] * penalty_factor
+
+Les cellules modifiées sont mémorisées pour que le planificateur du héros ne
+mette à jour que les arêtes concernées (replanification incrémentale).
+"""
+
+import numpy as np
+
+
+class DangerMap:
+    """Grille de danger (float32) à la résolution du pathfinder"""
+
+    def __init__(self, width, height, cell_size, base_cost=1.0, penalty_factor=1.0):
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.base_cost = base_cost
+        self.penalty_factor = penalty_factor
+        self.danger = np.zeros((height, width), dtype=np.float32)
+        self._dirty = set()
+
+    def add_danger(self, x, y, weight, radius=1):
+        """Ajoute du danger autour du point (x, y) en pixels.
+
+        La cellule d'impact reçoit tout le poids, les cellules voisines (jusqu'à
+        radius cellules) une fraction décroissante avec la distance.
+        """
+        cx = int(x // self.cell_size)
+        cy = int(y // self.cell_size)
+        for dy in range(-radius, radius + 1):
+            ny = cy + dy
+            if ny < 0 or ny >= self.height:
+                continue
+            for dx in range(-radius, radius + 1):
+                nx = cx + dx
+                if nx < 0 or nx >= self.width:
+                    continue
+                falloff = 1.0 / (1 + max(abs(dx), abs(dy)))
+                self.danger[ny, nx] += weight * falloff
+                self._dirty.add((nx, ny))
+
+    def cell_cost(self, cx, cy):
+        """Coût de passage d'une cellule pour le pathfinding"""
+        return self.base_cost + float(self.danger[cy, cx]) * self.penalty_factor
+
+    def has_changes(self):
+        """Indique si des cellules ont changé depuis le dernier consume_changes()"""
+        return bool(self._dirty)
+
+    def consume_changes(self):
+        """Retourne [(cx, cy, nouveau_coût)] des cellules modifiées et vide la liste"""
+        changes = [(cx, cy, self.cell_cost(cx, cy)) for cx, cy in self._dirty]
+        self._dirty.clear()
+        return changes
+
+    def clear(self):
+        """Remet toute la carte à zéro (les cellules non nulles sont signalées comme modifiées)"""
+        ys, xs = np.nonzero(self.danger)
+        self._dirty.update(zip(xs.tolist(), ys.tolist()))
+        self.danger.fill(0.0)
@@ -0,0 +1,538 @@
+"""
+Pathfinding sur la grille de marche de la carte.
+
+GridPathfinder : A* ponctuel. IncrementalPlanner : D* Lite, qui réutilise sa
+recherche précédente quand des coûts de cellules changent (danger map) ou que
+le départ se déplace.
+
+- tas binaire (heapq) ; heuristique ALT : distances précalculées depuis
+  quelques cellules repères (inégalité triangulaire), bien plus informative que
+  l'octile dans les couloirs de la carte, combinée à l'octile
+- listes d'adjacence précalculées (voisins praticables et longueur du pas)
+- tableaux g / parent / heuristique / marqueurs préalloués une fois et
+  réutilisés entre les recherches (un numéro de recherche évite de les remettre
+  à zéro)
+- pas de coupe de coin : un déplacement diagonal exige les deux cellules
+  orthogonales libres
+- la grille interne est bordée d'une rangée de cellules bloquées, ce qui évite
+  tout test de bornes dans les boucles
+- coût d'un déplacement = longueur (1 ou √2) x coût de la cellule d'arrivée
+  (>= 1) : les distances repères, calculées à coût 1, restent des minorants et
+  l'heuristique reste admissible quel que soit le danger
+"""
+
+import heapq
+import math
+
+import numpy as np
+
+SQRT2 = math.sqrt(2)
+
+
+class GridPathfinder:
+    """A* sur une grille booléenne (True = cellule praticable)"""
+
+    def __init__(self, walkable, cell_size, landmark_count=4):
+        self.cell_size = cell_size
+        self.height, self.width = walkable.shape
+
+        # Grille bordée et aplatie en liste Python : plus rapide que NumPy pour des accès unitaires
+        self.stride = self.width + 2
+        padded = np.zeros((self.height + 2, self.stride), dtype=bool)
+        padded[1:-1, 1:-1] = walkable
+        self.walkable = padded.ravel().tolist()
+        size = len(self.walkable)
+
+        # Coût de passage de chaque cellule (1.0 = terrain normal), à modifier par set_cell_cost
+        self.costs = [1.0] * size
+        # Cellules praticables et sans danger (lignes de vue du lissage)
+        self._clear = list(self.walkable)
+
+        # Tableaux préalloués, réutilisés à chaque recherche
+        self._g = [0.0] * size
+        self._parent = [-1] * size
+        self._seen = [0] * size     # numéro de recherche où la cellule a été atteinte
+        self._closed = [0] * size   # numéro de recherche où la cellule a été fermée
+        self._search_id = 0
+
+        # Voisins : (décalage d'index, décalage horizontal, décalage vertical, coût)
+        w = self.stride
+        self._neighbors = [
+            (1, 0, 0, 1.0), (-1, 0, 0, 1.0), (w, 0, 0, 1.0), (-w, 0, 0, 1.0),
+            (w + 1, 1, w, SQRT2), (w - 1, -1, w, SQRT2),
+            (-w + 1, 1, -w, SQRT2), (-w - 1, -1, -w, SQRT2),
+        ]
+
+        # Listes d'adjacence précalculées : [(voisin, longueur du déplacement)]
+        walkable = self.walkable
+        self.adjacent = [()] * size
+        for index in range(size):
+            if not walkable[index]:
+                continue
+            self.adjacent[index] = tuple(
+                (index + offset, length)
+                for offset, side_x, side_y, length in self._neighbors
+                if walkable[index + offset]
+                and not (side_x and not (walkable[index + side_x] and walkable[index + side_y]))
+            )
+
+        # Zone connexe de chaque cellule praticable (0 = bloquée) : les recherches
+        # sans issue sont rejetées sans explorer toute la zone du départ
+        self.component = self._label_components()
+
+        self._h = [0.0] * size
+        self._landmarks = self._select_landmarks(landmark_count)
+
+    # ------------------------------------------------------------------
+    # Conversions pixels <-> cellules
+    # ------------------------------------------------------------------
+    def cell_of(self, x, y):
+        """Cellule (cx, cy) contenant le point en pixels"""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def cell_center(self, cx, cy):
+        """Centre en pixels de la cellule (cx, cy)"""
+        half = self.cell_size / 2
+        return (cx * self.cell_size + half, cy * self.cell_size + half)
+
+    def is_walkable(self, cx, cy):
+        """Vérifie si la cellule est dans la grille et praticable"""
+        return (0 <= cx < self.width and 0 <= cy < self.height
+                and self.walkable[self.index_of(cx, cy)])
+
+    def index_of(self, cx, cy):
+        """Index dans la grille interne (bordée) de la cellule (cx, cy)"""
+        return (cy + 1) * self.stride + cx + 1
+
+    def cell_at(self, index):
+        """Cellule (cx, cy) correspondant à un index de la grille interne"""
+        return index % self.stride - 1, index // self.stride - 1
+
+    def set_cell_cost(self, cx, cy, cost):
+        """Modifie le coût de passage d'une cellule (doit rester >= 1)"""
+        index = self.index_of(cx, cy)
+        self.costs[index] = max(1.0, cost)
+        self._clear[index] = self.walkable[index] and self.costs[index] == 1.0
+
+    def octile(self, a, b):
+        """Heuristique octile entre deux index de la grille interne"""
+        stride = self.stride
+        hx = abs(a % stride - b % stride)
+        hy = abs(a // stride - b // stride)
+        return hx + hy + (SQRT2 - 2.0) * (hx if hx < hy else hy)
+
+    def nearest_walkable(self, cx, cy, max_radius=8):
+        """Cellule praticable la plus proche de (cx, cy) par anneaux successifs, ou None"""
+        if self.is_walkable(cx, cy):
+            return cx, cy
+        for radius in range(1, max_radius + 1):
+            best = None
+            best_dist = None
+            for dy in range(-radius, radius + 1):
+                for dx in range(-radius, radius + 1):
+                    if max(abs(dx), abs(dy)) != radius:
+                        continue
+                    if self.is_walkable(cx + dx, cy + dy):
+                        dist = dx * dx + dy * dy
+                        if best is None or dist < best_dist:
+                            best = (cx + dx, cy + dy)
+                            best_dist = dist
+            if best is not None:
+                return best
+        return None
+
+    # ------------------------------------------------------------------
+    # Repères de l'heuristique ALT
+    # ------------------------------------------------------------------
+    def _label_components(self):
+        """Numéro de zone connexe (>= 1) de chaque cellule praticable, 0 pour les cellules bloquées"""
+        adjacent = self.adjacent
+        component = [0] * len(self.walkable)
+        label = 0
+        for index, walkable in enumerate(self.walkable):
+            if not walkable or component[index]:
+                continue
+            label += 1
+            component[index] = label
+            stack = [index]
+            while stack:
+                for n_index, _ in adjacent[stack.pop()]:
+                    if not component[n_index]:
+                        component[n_index] = label
+                        stack.append(n_index)
+        return component
+
+    def _unit_distances(self, source):
+        """Distances (coût 1) de source à chaque cellule, Dijkstra sur les listes d'adjacence"""
+        adjacent = self.adjacent
+        dist = [math.inf] * len(self.walkable)
+        dist[source] = 0.0
+        open_heap = [(0.0, source)]
+        push = heapq.heappush
+        pop = heapq.heappop
+        while open_heap:
+            d, index = pop(open_heap)
+            if d > dist[index]:
+                continue
+            for n_index, length in adjacent[index]:
+                new_d = d + length
+                if new_d < dist[n_index]:
+                    dist[n_index] = new_d
+                    push(open_heap, (new_d, n_index))
+        return dist
+
+    def _select_landmarks(self, count):
+        """Repères choisis par point le plus éloigné : chacun maximise sa distance aux précédents.
+
+        Retourne une table de distances par repère (calculées une fois, à coût 1).
+        """
+        try:
+            first = self.walkable.index(True)
+        except ValueError:
+            return []
+        reach = self._unit_distances(first)
+        nearest = [math.inf] * len(reach)
+        candidate = max(range(len(reach)), key=lambda i: reach[i] if reach[i] < math.inf else -1.0)
+        tables = []
+        for _ in range(count):
+            table = self._unit_distances(candidate)
+            tables.append(table)
+            nearest = [a if a < b else b for a, b in zip(nearest, table)]
+            candidate = max(range(len(nearest)),
+                            key=lambda i: nearest[i] if nearest[i] < math.inf else -1.0)
+        return tables
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+    def find_cell_path(self, start, goal):
+        """A* entre deux cellules praticables ; retourne la liste des cellules ou []"""
+        stride = self.stride
+        costs = self.costs
+        adjacent = self.adjacent
+        g = self._g
+        h_cache = self._h
+        parent = self._parent
+        seen = self._seen
+        closed = self._closed
+
+        self._search_id += 1
+        search_id = self._search_id
+
+        start_index = self.index_of(*start)
+        goal_index = self.index_of(*goal)
+        if self.component[start_index] != self.component[goal_index]:
+            return []  # Zones disjointes : inutile d'explorer toute celle du départ
+        goal_x = goal_index % stride
+        goal_y = goal_index // stride
+        # (table du repère, distance repère -> objectif) : |d(L, n) - d(L, objectif)| <= d(n, objectif)
+        landmarks = [(table, table[goal_index]) for table in self._landmarks]
+
+        g[start_index] = 0.0
+        parent[start_index] = -1
+        seen[start_index] = search_id
+
+        # Légère pondération de h pour départager les égalités (moins d'expansions)
+        tie_break = 1.0 + 1.0 / (self.width + self.height)
+        octile_extra = SQRT2 - 2.0
+
+        open_heap = [(0.0, start_index)]
+        push = heapq.heappush
+        pop = heapq.heappop
+
+        while open_heap:
+            _, index = pop(open_heap)
+            if closed[index] == search_id:
+                continue
+            if index == goal_index:
+                break
+            closed[index] = search_id
+            base_g = g[index]
+
+            for n_index, length in adjacent[index]:
+                if closed[n_index] == search_id:
+                    continue
+                new_g = base_g + length * costs[n_index]
+                if seen[n_index] == search_id:
+                    if new_g >= g[n_index]:
+                        continue
+                    h = h_cache[n_index]
+                else:
+                    # Heuristique (déjà pondérée) calculée une fois par cellule atteinte
+                    seen[n_index] = search_id
+                    hx = abs(n_index % stride - goal_x)
+                    hy = abs(n_index // stride - goal_y)
+                    h = hx + hy + octile_extra * (hx if hx < hy else hy)
+                    for table, to_goal in landmarks:
+                        d = table[n_index] - to_goal
+                        if d < 0.0:
+                            d = -d
+                        if d > h:
+                            h = d
+                    h *= tie_break
+                    h_cache[n_index] = h
+                g[n_index] = new_g
+                parent[n_index] = index
+                push(open_heap, (new_g + h, n_index))
+        else:
+            return []
+
+        # Reconstruction du chemin
+        cells = []
+        index = goal_index
+        while index != -1:
+            cells.append(self.cell_at(index))
+            index = parent[index]
+        cells.reverse()
+        return cells
+
+    def find_path(self, start, goal):
+        """Chemin en pixels entre deux positions (x, y) ; [] si aucun chemin.
+
+        Les extrémités sont ramenées sur la cellule praticable la plus proche, puis
+        le chemin est simplifié en ne gardant que les points nécessaires
+        (ligne de vue sur la grille).
+        """
+        start_cell = self.nearest_walkable(*self.cell_of(*start))
+        goal_cell = self.nearest_walkable(*self.cell_of(*goal))
+        if start_cell is None or goal_cell is None:
+            return []
+
+        cells = self.find_cell_path(start_cell, goal_cell)
+        if not cells:
+            return []
+        return [self.cell_center(cx, cy) for cx, cy in self.smooth(cells)]
+
+    # ------------------------------------------------------------------
+    # Lissage
+    # ------------------------------------------------------------------
+    def has_line_of_sight(self, a, b):
+        """Vérifie qu'un segment entre deux cellules ne traverse que des cellules praticables.
+
+        Les cellules intermédiaires doivent en plus être sans danger ; les extrémités
+        appartiennent déjà au chemin, leur coût n'est pas pris en compte.
+        """
+        if not (self.is_walkable(*a) and self.is_walkable(*b)):
+            return False
+        return self._clear_line(a, b)
+
+    def _clear_line(self, a, b):
+        """has_line_of_sight entre deux cellules déjà connues praticables"""
+        # Parcours de Bresenham directement sur les index de la grille bordée :
+        # le segment reste entre deux cellules de la grille, donc dans ses bornes
+        walkable = self.walkable
+        clear = self._clear
+        x0, y0 = a
+        x1, y1 = b
+        dx = x1 - x0 if x1 > x0 else x0 - x1
+        dy = y1 - y0 if y1 > y0 else y0 - y1
+        step_x = 1 if x1 > x0 else -1
+        step_y = self.stride if y1 > y0 else -self.stride
+        err = dx - dy
+        index = (y0 + 1) * self.stride + x0 + 1
+        end = (y1 + 1) * self.stride + x1 + 1
+        if index == end:
+            return True
+        while True:
+            e2 = 2 * err
+            if e2 > -dy:
+                if e2 < dx:
+                    # Pas diagonal : les deux cellules adjacentes doivent aussi être libres
+                    if not (walkable[index + step_x] and walkable[index + step_y]):
+                        return False
+                    err += dx - dy
+                    index += step_x + step_y
+                else:
+                    err -= dy
+                    index += step_x
+            else:
+                err += dx
+                index += step_y
+            if index == end:
+                return True
+            if not clear[index]:
+                return False
+
+    def smooth(self, cells):
+        """Supprime les cellules intermédiaires tant que la ligne de vue est conservée"""
+        if len(cells) <= 2:
+            return list(cells)
+        clear_line = self._clear_line
+        smoothed = [cells[0]]
+        anchor = cells[0]
+        for i in range(2, len(cells)):
+            if not clear_line(anchor, cells[i]):
+                anchor = cells[i - 1]
+                smoothed.append(anchor)
+        smoothed.append(cells[-1])
+        return smoothed
+
+
+class IncrementalPlanner:
+    """D* Lite (version optimisée de Koenig & Likhachev) sur la grille d'un GridPathfinder.
+
+    La recherche part de l'objectif : les valeurs g sont des distances jusqu'à la
+    sortie. Quand des coûts changent, seuls les sommets touchés sont remis dans
+    la file et la recherche reprend là où elle s'était arrêtée.
+    """
+
+    def __init__(self, pathfinder, goal_cell):
+        self.pathfinder = pathfinder
+        size = len(pathfinder.walkable)
+        inf = math.inf
+        self._g = [inf] * size
+        self._rhs = [inf] * size
+        # Clé actuellement valide de chaque sommet dans la file (None = absent)
+        self._queued = [None] * size
+        self._queue = []
+        self._km = 0.0
+        self.goal = pathfinder.index_of(*goal_cell)
+        # Tant qu'aucun départ n'est connu, on part de l'objectif (km compense au premier plan)
+        self.start = self.goal
+        self._last_start = self.goal
+        self._start_x = self.goal % pathfinder.stride
+        self._start_y = self.goal // pathfinder.stride
+        self.expansions = 0
+
+        # Listes d'adjacence partagées avec le pathfinder : [(voisin, longueur du déplacement)]
+        self._adjacent = pathfinder.adjacent
+
+        self._rhs[self.goal] = 0.0
+        self._push(self.goal, self._key(self.goal))
+
+    # ------------------------------------------------------------------
+    # File de priorité (suppression paresseuse)
+    # ------------------------------------------------------------------
+    def _push(self, index, key):
+        self._queued[index] = key
+        heapq.heappush(self._queue, (key[0], key[1], index))
+
+    def _key(self, index):
+        g = self._g[index]
+        rhs = self._rhs[index]
+        best = g if g < rhs else rhs
+        stride = self.pathfinder.stride
+        hx = abs(index % stride - self._start_x)
+        hy = abs(index // stride - self._start_y)
+        h = hx + hy + (SQRT2 - 2.0) * (hx if hx < hy else hy)
+        return (best + h + self._km, best)
+
+    def _top_key(self):
+        queue = self._queue
+        queued = self._queued
+        while queue:
+            k1, k2, index = queue[0]
+            if queued[index] == (k1, k2):
+                return k1, k2
+            heapq.heappop(queue)
+        return math.inf, math.inf
+
+    # ------------------------------------------------------------------
+    # Graphe
+    # ------------------------------------------------------------------
+    def _update_vertex(self, index):
+        g = self._g
+        rhs = self._rhs
+        if index != self.goal:
+            costs = self.pathfinder.costs
+            best = math.inf
+            for n_index, length in self._adjacent[index]:
+                value = length * costs[n_index] + g[n_index]
+                if value < best:
+                    best = value
+            rhs[index] = best
+        if g[index] != rhs[index]:
+            self._push(index, self._key(index))
+        else:
+            self._queued[index] = None
+
+    def _compute_shortest_path(self):
+        g = self._g
+        rhs = self._rhs
+        queued = self._queued
+        queue = self._queue
+        adjacent = self._adjacent
+        update_vertex = self._update_vertex
+        key = self._key
+        start = self.start
+
+        while True:
+            top = self._top_key()
+            if top >= key(start) and rhs[start] == g[start]:
+                break
+            _, _, index = heapq.heappop(queue)
+            queued[index] = None
+            self.expansions += 1
+
+            new_key = key(index)
+            if top < new_key:
+                self._push(index, new_key)
+            elif g[index] > rhs[index]:
+                g[index] = rhs[index]
+                for n_index, _ in adjacent[index]:
+                    update_vertex(n_index)
+            else:
+                g[index] = math.inf
+                update_vertex(index)
+                for n_index, _ in adjacent[index]:
+                    update_vertex(n_index)
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+    def update_costs(self, changes):
+        """Applique des changements de coût [(cx, cy, coût)] et met à jour les sommets concernés"""
+        pathfinder = self.pathfinder
+        for cx, cy, cost in changes:
+            if not pathfinder.is_walkable(cx, cy):
+                continue
+            pathfinder.set_cell_cost(cx, cy, cost)
+            # Les arêtes entrant dans la cellule changent : mettre à jour ses voisins
+            for n_index, _ in self._adjacent[pathfinder.index_of(cx, cy)]:
+                self._update_vertex(n_index)
+
+    def plan(self, start_cell):
+        """Met à jour la recherche pour un départ donné ; retourne la liste des cellules jusqu'à la sortie"""
+        pathfinder = self.pathfinder
+        self.start = pathfinder.index_of(*start_cell)
+        if self._last_start != self.start:
+            self._km += pathfinder.octile(self._last_start, self.start)
+            self._last_start = self.start
+            self._start_x = self.start % pathfinder.stride
+            self._start_y = self.start // pathfinder.stride
+
+        self._compute_shortest_path()
+        g = self._g
+        if g[self.start] == math.inf:
+            return []
+
+        # Descente de gradient sur g depuis le départ
+        costs = pathfinder.costs
+        cells = [pathfinder.cell_at(self.start)]
+        index = self.start
+        for _ in range(len(g)):
+            if index == self.goal:
+                return cells
+            best = None
+            best_value = math.inf
+            for n_index, length in self._adjacent[index]:
+                value = length * costs[n_index] + g[n_index]
+                if value < best_value:
+                    best = n_index
+                    best_value = value
+            if best is None:
+                return []
+            index = best
+            cells.append(pathfinder.cell_at(index))
+        return []
+
+    def find_path(self, start):
+        """Chemin lissé en pixels depuis la position start jusqu'à la sortie ; [] si aucun chemin"""
+        pathfinder = self.pathfinder
+        start_cell = pathfinder.nearest_walkable(*pathfinder.cell_of(*start))
+        if start_cell is None:
+            return []
+        cells = self.plan(start_cell)
+        if not cells:
+            return []
+        return [pathfinder.cell_center(cx, cy) for cx, cy in pathfinder.smooth(cells)]
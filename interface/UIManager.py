@@ -1,5 +1,11 @@
 import pygame
 
+from utils.text_cache import get_font, render_text
+
+# Pas des secteurs de timers (120 pas = 3°)
+TIMER_STEPS = 120
+
+
 class UIManager:
     def __init__(self, screen_size):
         """Gère tout l'affichage de l'UI (HUD, dialogues, timers, barres, hotbar).
@@ -14,8 +20,14 @@ class UIManager:
         }
         # Pré-créer un overlay semi-transparent (utile pour des effets de fond)
         self.overlay = pygame.Surface(screen_size, pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 160))
 
-        self.font = pygame.font.Font(None, 28)
+        # UI retenue : surface composée de chaque widget et état qui l'a produite
+        # (le widget n'est recomposé que lorsque cet état change)
+        self.widget_cache = {}
+
+        self.font_size = 28
+        self.font = get_font(None, self.font_size)
         self.dialog_text = ""
 
         # =========================
@@ -79,6 +91,12 @@ class UIManager:
             elif i == 2:
                 icon = bomb_icon
                 icon_grey = bomb_icon_grey
+            # Échelle de rendu propre au slot, appliquée une fois ici
+            scale = self.hotbar_slot_render_scale.get(i, 1.0)
+            if icon is not None and scale != 1.0:
+                size = (max(1, int((self.hotbar_slot_size - 16) * scale)),) * 2
+                icon = pygame.transform.smoothscale(icon, size)
+                icon_grey = pygame.transform.smoothscale(icon_grey, size) if icon_grey is not None else None
             self.hotbar.append({
                 'icon': icon,
                 'icon_grey': icon_grey,
@@ -125,6 +143,20 @@ class UIManager:
             self.stun_base_frame = None
             self.stun_overlay_frames = []
 
+        # Étourdissement du héros restant (1.0 -> 0.0), mis à jour par le GameManager
+        self.stun_progress = 0.0
+        # Frames redimensionnées une seule fois à la taille d'affichage
+        # (la première frame overlay est le cadre vide, les suivantes les niveaux de remplissage)
+        self.stun_bar_size = (int(self.screen_width * self.stun_bar_width_ratio), self.stun_bar_height_px)
+        self.stun_bar_base_scaled = None
+        self.stun_bar_fill_scaled = []
+        if self.stun_base_frame is not None:
+            self.stun_bar_base_scaled = pygame.transform.scale(self.stun_base_frame, self.stun_bar_size)
+            self.stun_bar_fill_scaled = [
+                pygame.transform.scale(frame, self.stun_bar_size)
+                for frame in self.stun_overlay_frames[1:]
+            ]
+
     def show(self, layer, payload=None):
         """Affiche une couche d'UI (ex: 'dialog')."""
         self.layers_visible[layer] = True
@@ -183,86 +215,115 @@ class UIManager:
                     slot['cooldown_remaining'] = 0
 
 
+    def _widget(self, name, state, build):
+        """Surface composée du widget name, reconstruite par build() seulement si state a changé"""
+        cached = self.widget_cache.get(name)
+        if cached is None or cached[0] != state:
+            cached = self.widget_cache[name] = (state, build())
+        return cached[1]
+
     def render(self, screen):
-        """Dessine toutes les couches d'UI. À appeler après le rendu du monde."""
+        """Dessine toutes les couches d'UI. À appeler après le rendu du monde.
+
+        Chaque widget est une surface en cache : une image sans changement d'état
+        se résume à quelques blits.
+        """
         if self.layers_visible['cinematic_bars']:
             bar_h = int(self.screen_height * 0.12)
-            pygame.draw.rect(screen, (0, 0, 0), (0, 0, self.screen_width, bar_h))
-            pygame.draw.rect(screen, (0, 0, 0), (0, self.screen_height - bar_h, self.screen_width, bar_h))
+            screen.fill((0, 0, 0), (0, 0, self.screen_width, bar_h))
+            screen.fill((0, 0, 0), (0, self.screen_height - bar_h, self.screen_width, bar_h))
 
         # HUD par défaut retiré (exemple minimal)
 
         if self.layers_visible['dialog']:
-            self.overlay.fill((0, 0, 0, 160))
             screen.blit(self.overlay, (0, 0))
-            box_h = 120
-            pygame.draw.rect(screen, (24, 24, 24), (40, self.screen_height - box_h - 40, self.screen_width - 80, box_h), border_radius=10)
-            pygame.draw.rect(screen, (200, 200, 200), (40, self.screen_height - box_h - 40, self.screen_width - 80, box_h), 2, border_radius=10)
-            text = self.font.render(self.dialog_text, True, (255, 255, 255))
-            screen.blit(text, (60, self.screen_height - box_h - 20))
+            box = self._widget('dialog', self.dialog_text, self._build_dialog_box)
+            screen.blit(box, (40, self.screen_height - box.get_height() - 40))
         if hasattr(self, "percentage_value"):  # On affiche seulement si défini
-            # Texte principal
-            title = "Chance pour la Terreur du CROUS de gagner :"
             value = f"{self.percentage_value:.2f} %"
-
-            # Choisir une police plus grande
-            big_font = pygame.font.Font(None, 40)   # plus gros pour la valeur
-            small_font = pygame.font.Font(None, 25) # plus petit pour le titre
-
-            title_surf = small_font.render(title, True, (255, 255, 255))
-            value_surf = big_font.render(value, True, (255, 215, 0))  # or doré pour attirer l’œil
-
-            # Ajouter un contour noir (ombre portée)
-            def render_with_outline(font, text, text_color, outline_color=(0, 0, 0)):
-                base = font.render(text, True, text_color)
-                outline = []
-                for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:  # 4 directions
-                    outline.append(font.render(text, True, outline_color))
-                surf = pygame.Surface((base.get_width()+4, base.get_height()+4), pygame.SRCALPHA)
-                for o in outline:
-                    surf.blit(o, (2,2))
-                surf.blit(base, (2,2))
-                return surf
-
-            title_surf = render_with_outline(small_font, title, (255,255,255))
-            value_surf = render_with_outline(big_font, value, (255,215,0))
-
-            # Position en haut à droite avec un fond rectangulaire semi-transparent
-            padding = 10
-            bg_width = max(title_surf.get_width(), value_surf.get_width()) + padding*2
-            bg_height = title_surf.get_height() + value_surf.get_height() + padding*3
-
-            bg_surface = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
-            bg_surface.fill((0, 0, 0, 150))  # noir transparent
-
-            # Blit du texte sur le fond
-            bg_surface.blit(title_surf, (padding, padding))
-            bg_surface.blit(value_surf, (padding, padding + title_surf.get_height() + 5))
-
+            panel = self._widget('percentage', value, lambda: self._build_percentage_panel(value))
             # Position finale en haut à droite
-            rect = bg_surface.get_rect()
-            rect.topright = (self.screen_width - 20, 20)
-            screen.blit(bg_surface, rect)
+            screen.blit(panel, panel.get_rect(topright=(self.screen_width - 20, 20)))
         # Timer circulaire
         if self.countdown_active:
             self._render_countdown(screen)
 
+        # Barre d'étourdissement du héros
+        if self.stun_progress > 0:
+            self._render_stun_bar(screen)
+
         # Hotbar
         self._render_hotbar(screen)
 
+    def _build_dialog_box(self):
+        """Boîte du message de la couche 'dialog'"""
+        box_h = 120
+        box = pygame.Surface((self.screen_width - 80, box_h), pygame.SRCALPHA)
+        pygame.draw.rect(box, (24, 24, 24), box.get_rect(), border_radius=10)
+        pygame.draw.rect(box, (200, 200, 200), box.get_rect(), 2, border_radius=10)
+        box.blit(render_text(self.dialog_text, self.font_size, (255, 255, 255)), (20, 20))
+        return box
+
+    def _build_percentage_panel(self, value):
+        """Panneau du pourcentage : titre et valeur avec un contour noir sur un fond semi-transparent"""
+        title = "Chance pour la Terreur du CROUS de gagner :"
+        title_surf = render_text(title, 25, (255, 255, 255), outline=((0, 0, 0), 2))
+        value_surf = render_text(value, 40, (255, 215, 0), outline=((0, 0, 0), 2))  # or doré pour attirer l’œil
+
+        padding = 10
+        bg_width = max(title_surf.get_width(), value_surf.get_width()) + padding*2
+        bg_height = title_surf.get_height() + value_surf.get_height() + padding*3
+
+        bg_surface = pygame.Surface((bg_width, bg_height), pygame.SRCALPHA)
+        bg_surface.fill((0, 0, 0, 150))  # noir transparent
+        bg_surface.blit(title_surf, (padding, padding))
+        bg_surface.blit(value_surf, (padding, padding + title_surf.get_height() + 5))
+        return bg_surface
+
+    def _render_stun_bar(self, screen):
+        """Dessine la barre d'étourdissement du héros en haut au centre de l'écran."""
+        rect = pygame.Rect((0, 0), self.stun_bar_size)
+        rect.midtop = (self.screen_width // 2, 20)
+        if self.stun_bar_base_scaled is None:
+            # Fallback sans sprite : simple jauge rectangulaire
+            pygame.draw.rect(screen, (30, 30, 30), rect)
+            fill = rect.copy()
+            fill.width = int(rect.width * self.stun_progress)
+            pygame.draw.rect(screen, (255, 200, 0), fill)
+            return
+        screen.blit(self.stun_bar_base_scaled, rect)
+        if self.stun_bar_fill_scaled:
+            count = len(self.stun_bar_fill_scaled)
+            index = min(count - 1, int(self.stun_progress * count))
+            screen.blit(self.stun_bar_fill_scaled[index], rect)
+
     def _render_countdown(self, screen):
         """Dessin du compte à rebours circulaire (fond + portion + texte)."""
         cx, cy = self.countdown_position
-        r = self.countdown_radius
-        pygame.draw.circle(screen, (0, 0, 0), (int(cx), int(cy)), r)
-        pygame.draw.circle(screen, (220, 220, 220), (int(cx), int(cy)), r, width=2)
         ratio = max(0.0, min(1.0, self.countdown_remaining / self.countdown_total if self.countdown_total > 0 else 0))
-        if ratio > 0:
-            self._draw_filled_sector(screen, (cx, cy), r - 3, -90, -90 + 360 * ratio, self.countdown_fg_color)
         seconds_left = max(0, int(self.countdown_remaining + 0.999))
-        label = self.font.render(str(seconds_left), True, (255, 255, 255))
-        rect = label.get_rect(center=(cx, cy))
-        screen.blit(label, rect)
+        dial = self._timer_widget('countdown', self.countdown_radius, 3, ratio, seconds_left, self.countdown_fg_color)
+        screen.blit(dial, dial.get_rect(center=(int(cx), int(cy))))
+
+    def _timer_widget(self, name, radius, gap, ratio, seconds_left, color):
+        """Cadran (disque, secteur restant, secondes) en cache.
+
+        Le secteur est arrondi à 3° : le cadran n'est recomposé que lorsqu'il change à l'écran.
+        """
+        steps = int(ratio * TIMER_STEPS + 0.5)
+        return self._widget(name, (radius, steps, seconds_left), lambda: self._build_timer(
+            radius, gap, steps / TIMER_STEPS, seconds_left, color))
+
+    def _build_timer(self, radius, gap, ratio, seconds_left, color):
+        dial = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        center = (radius, radius)
+        pygame.draw.circle(dial, (0, 0, 0), center, radius)
+        pygame.draw.circle(dial, (220, 220, 220), center, radius, width=2)
+        if ratio > 0:
+            self._draw_filled_sector(dial, center, radius - gap, -90, -90 + 360 * ratio, color)
+        label = render_text(str(seconds_left), self.font_size, (255, 255, 255))
+        dial.blit(label, label.get_rect(center=center))
+        return dial
 
     def _draw_filled_sector(self, screen, center, radius, start_angle_deg, end_angle_deg, color):
         """Dessine un secteur circulaire en polygone (approximation)."""
@@ -280,58 +341,59 @@ class UIManager:
             points.append((x, y))
         pygame.draw.polygon(screen, color, points)
 
-    def _render_hotbar(self, screen):
-        """Dessine la hotbar (cadre, slots, icônes, timers de cooldown)."""
+    def _hotbar_geometry(self):
+        """Rectangle du cadre de la hotbar et rectangles des slots (coordonnées écran)"""
         total_w = self.hotbar_slots_count * self.hotbar_slot_size + (self.hotbar_slots_count - 1) * self.hotbar_padding
         total_h = self.hotbar_slot_size
         x0 = self.hotbar_left_offset
         y0 = self.screen_height - self.hotbar_bottom_offset - total_h
-        pygame.draw.rect(screen, (0, 0, 0, 160), (x0 - 6, y0 - 6, total_w + 12, total_h + 12), border_radius=10)
-        pygame.draw.rect(screen, (220, 220, 220), (x0 - 6, y0 - 6, total_w + 12, total_h + 12), width=2, border_radius=10)
-        for i in range(self.hotbar_slots_count):
-            sx = x0 + i * (self.hotbar_slot_size + self.hotbar_padding)
-            sy = y0
-            rect = pygame.Rect(sx, sy, self.hotbar_slot_size, self.hotbar_slot_size)
-            pygame.draw.rect(screen, (30, 30, 30), rect, border_radius=8)
-            pygame.draw.rect(screen, (180, 180, 180), rect, width=2, border_radius=8)
-            icon = self.hotbar[i]['icon']
-            icon_grey = self.hotbar[i]['icon_grey']
+        frame = pygame.Rect(x0 - 6, y0 - 6, total_w + 12, total_h + 12)
+        slots = [pygame.Rect(x0 + i * (self.hotbar_slot_size + self.hotbar_padding), y0,
+                             self.hotbar_slot_size, self.hotbar_slot_size)
+                 for i in range(self.hotbar_slots_count)]
+        return frame, slots
+
+    def _render_hotbar(self, screen):
+        """Dessine la hotbar (cadre, slots, icônes, timers de cooldown)."""
+        frame, slots = self._hotbar_geometry()
+        # Le cadre et les icônes ne changent que lorsqu'un slot entre ou sort de cooldown
+        cooling = tuple(slot['cooldown_remaining'] > 0 for slot in self.hotbar)
+        bar = self._widget('hotbar', cooling, lambda: self._build_hotbar(frame, slots, cooling))
+        screen.blit(bar, frame.topleft)
+
+        # Timer circulaire au-dessus du slot quand en cooldown
+        for i, rect in enumerate(slots):
             cooldown_total = self.hotbar[i]['cooldown_total']
             cooldown_remaining = self.hotbar[i]['cooldown_remaining']
-            if icon is not None:
-                # Appliquer un scale de rendu par slot si configuré
-                scale = self.hotbar_slot_render_scale.get(i, 1.0)
-                if scale != 1.0:
-                    w = max(1, int((self.hotbar_slot_size - 16) * scale))
-                    h = max(1, int((self.hotbar_slot_size - 16) * scale))
-                    icon_scaled = pygame.transform.smoothscale(icon, (w, h))
-                    icon_grey_scaled = pygame.transform.smoothscale(icon_grey, (w, h)) if icon_grey is not None else None
-                    target_rect = icon_scaled.get_rect(center=rect.center)
-                else:
-                    icon_scaled = icon
-                    icon_grey_scaled = icon_grey
-                    target_rect = icon.get_rect(center=rect.center)
-                if cooldown_remaining > 0:
-                    if icon_grey_scaled is not None:
-                        screen.blit(icon_grey_scaled, target_rect)
-                    s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                    s.fill((60, 60, 60, 120))
-                    screen.blit(s, rect.topleft)
-                else:
-                    screen.blit(icon_scaled, target_rect)
-            # Timer circulaire au-dessus du slot quand en cooldown
             if cooldown_remaining > 0 and cooldown_total > 0:
-                cx = rect.centerx
-                cy = rect.top - 18
-                radius = 14
-                ratio = cooldown_remaining / cooldown_total
-                pygame.draw.circle(screen, (0, 0, 0), (cx, cy), radius)
-                pygame.draw.circle(screen, (220, 220, 220), (cx, cy), radius, width=2)
-                self._draw_filled_sector(screen, (cx, cy), radius - 2, -90, -90 + 360 * ratio, (255, 200, 0))
                 seconds_left = max(0, int(cooldown_remaining + 0.999))
-                label = self.font.render(str(seconds_left), True, (255, 255, 255))
-                lrect = label.get_rect(center=(cx, cy))
-                screen.blit(label, lrect)
+                timer = self._timer_widget(('hotbar_timer', i), 14, 2, cooldown_remaining / cooldown_total,
+                                           seconds_left, (255, 200, 0))
+                screen.blit(timer, timer.get_rect(center=(rect.centerx, rect.top - 18)))
+
+    def _build_hotbar(self, frame, slots, cooling):
+        """Compose le cadre, les slots et les icônes (grisées pour les slots en cooldown)"""
+        bar = pygame.Surface(frame.size, pygame.SRCALPHA)
+        local = bar.get_rect()
+        pygame.draw.rect(bar, (0, 0, 0), local, border_radius=10)
+        pygame.draw.rect(bar, (220, 220, 220), local, width=2, border_radius=10)
+        for i, slot_rect in enumerate(slots):
+            rect = slot_rect.move(-frame.x, -frame.y)
+            pygame.draw.rect(bar, (30, 30, 30), rect, border_radius=8)
+            pygame.draw.rect(bar, (180, 180, 180), rect, width=2, border_radius=8)
+            icon = self.hotbar[i]['icon']
+            icon_grey = self.hotbar[i]['icon_grey']
+            if icon is None:
+                continue
+            if cooling[i]:
+                if icon_grey is not None:
+                    bar.blit(icon_grey, icon_grey.get_rect(center=rect.center))
+                shade = pygame.Surface(rect.size, pygame.SRCALPHA)
+                shade.fill((60, 60, 60, 120))
+                bar.blit(shade, rect.topleft)
+            else:
+                bar.blit(icon, icon.get_rect(center=rect.center))
+        return bar
 
     def activate_hotbar_slot(self, index, seconds):
         """Démarre le cooldown d'un slot de hotbar (grise l'icône et affiche un timer)."""
@@ -1,8 +1,24 @@
+import os
+import struct
+
+import numpy as np
 import pygame
-import math
+import pytmx
+
+from utils.map_cache import cache_path, map_digest
+from utils.text_cache import render_text
+
+# Cache disque de l'arrière-plan, à côté de la carte (map.tmx -> map.minimap)
+CACHE_SUFFIX = ".minimap"
+CACHE_MAGIC = b"MMAP"
+CACHE_VERSION = 1
+# magic, version, largeur, hauteur, sha256 du TMX et de ses tilesets ; suivi des pixels RGB
+CACHE_HEADER = struct.Struct("<4sHHH32s")
+
 
 class Minimap:
-    def __init__(self, screen, tmx_data, x=10, y=10, width=200, height=150):
+    def __init__(self, screen, tmx_data, x=10, y=10, width=200, height=150,
+                 collisions=None, refresh_interval=3):
         """
         Initialise la minimap
         
@@ -11,9 +27,12 @@ class Minimap:
             tmx_data: Données de la carte TMX
             x, y: Position de la minimap sur l'écran
             width, height: Dimensions de la minimap
+            collisions: Objets de collision TMX, assombris sur l'arrière-plan
+            refresh_interval: Nombre de ticks entre deux redessins des marqueurs
         """
         self.screen = screen
         self.tmx_data = tmx_data
+        self.collisions = collisions or []
         
         # Position et dimensions de la minimap
         self.x = x
@@ -32,37 +51,121 @@ class Minimap:
         # Surface de la minimap
         self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
+        # Marqueurs redessinés tous les refresh_interval ticks seulement
+        self.refresh_interval = max(1, refresh_interval)
+        self._ticks_until_refresh = 0
+        
         # Couleurs pour l'interface
-        self.bg_color = (30, 30, 40, 180)  # Fond semi-transparent
+        self.bg_color = (30, 30, 40, 50)  # Voile sombre appliqué une fois sur l'arrière-plan
         self.border_color = (100, 100, 120, 255)  # Bordure
         self.player_color = (0, 255, 0, 255)  # Vert pour le joueur
         self.bot_color = (255, 100, 100, 255)  # Rouge/rose pour le bot
         self.ally_color = (100, 255, 100, 255)  # Vert clair pour le bot allié
         self.subordinate_color = (150, 200, 255, 255)  # Bleu clair pour les subordonnés
-        self.map_color = (80, 80, 90, 255)  # Couleur de base de la carte
+        self.map_color = (80, 80, 90, 255)  # Couleur des cases sans tuile
+        self.collision_color = (20, 20, 25, 110)  # Murs et obstacles
         
-        # Générer une représentation simplifiée de la carte
+        # Arrière-plan réduit depuis les couches de tuiles (ou lu depuis le cache)
         self._generate_map_background()
         
-    def _generate_map_background(self):
-        """Génère un arrière-plan simplifié de la carte basé sur les couches TMX"""
-        # Créer une surface pour l'arrière-plan de la carte
-        self.map_background = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Titre (libellé partagé par le cache de texte)
+        self.title_text = None
+        if pygame.font.get_init():
+            self.title_text = render_text("Carte", 20, (255, 255, 255))
         
-        # Remplir avec une couleur de base
-        self.map_background.fill(self.map_color)
-        
-        # Ajouter quelques détails basés sur les couches de la carte
-        # Pour une version simplifiée, on peut dessiner des rectangles représentant les zones importantes
+    def _generate_map_background(self):
+        """Charge l'arrière-plan depuis le cache disque, ou le construit et l'y enregistre"""
+        tmx_path = getattr(self.tmx_data, 'filename', None)
+        digest = path = None
+        if tmx_path and os.path.exists(tmx_path):
+            digest = map_digest(tmx_path)
+            path = cache_path(tmx_path, CACHE_SUFFIX)
+            background = self._load_background(path, digest)
+            if background is not None:
+                self.map_background = background
+                return
         
-        # Dessiner une grille subtile pour représenter la structure de la carte
-        grid_spacing = max(5, min(self.width // 20, self.height // 15))
-        grid_color = (60, 60, 70, 100)
+        self.map_background = self._build_map_background()
+        if path is not None:
+            try:
+                self._save_background(path, digest)
+            except OSError as e:
+                print(f"[Minimap] Impossible d'écrire le cache {path}: {e}")
+    
+    def _build_map_background(self):
+        """Réduit la carte : une couleur moyenne par tuile, couches composées, collisions assombries"""
+        tmx_data = self.tmx_data
+        # Une case par tuile, indexée [x, y] comme surfarray
+        pixels = np.empty((tmx_data.width, tmx_data.height, 3), dtype=np.float32)
+        pixels[:] = self.map_color[:3]
         
-        for x in range(0, self.width, grid_spacing):
-            pygame.draw.line(self.map_background, grid_color, (x, 0), (x, self.height), 1)
-        for y in range(0, self.height, grid_spacing):
-            pygame.draw.line(self.map_background, grid_color, (0, y), (self.width, y), 1)
+        # Couleur moyenne (RGBA) de chaque tuile, indexée par gid et calculée une fois
+        palette = np.zeros((len(tmx_data.images), 4), dtype=np.float32)
+        known = np.zeros(len(tmx_data.images), dtype=bool)
+        known[0] = True  # gid 0 : case vide
+        for layer in tmx_data.visible_layers:
+            if not isinstance(layer, pytmx.TiledTileLayer):
+                continue
+            gids = np.array(layer.data, dtype=np.int64).T
+            for gid in np.unique(gids):
+                if not known[gid]:
+                    image = tmx_data.get_tile_image_by_gid(int(gid))
+                    if image:
+                        palette[gid] = pygame.transform.average_color(image)
+                        # Sans canal alpha, average_color rapporte une opacité nulle
+                        if not image.get_flags() & pygame.SRCALPHA:
+                            palette[gid, 3] = 255
+                    known[gid] = True
+            # Composition "over" de la couche sur les précédentes
+            colors = palette[gids]
+            alpha = colors[..., 3:] / 255 * getattr(layer, 'opacity', 1.0)
+            pixels += (colors[..., :3] - pixels) * alpha
+
+        tiles = pygame.surfarray.make_surface(pixels.astype(np.uint8))
+        background = pygame.transform.smoothscale(tiles, (self.width, self.height)).convert_alpha()
+
+        # Zones de collision (murs, arbres, maisons), assombries en un seul blit
+        shade = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        for obj in self.collisions:
+            rect = pygame.Rect(int(obj.x * self.scale_x), int(obj.y * self.scale_y),
+                               max(1, round(obj.width * self.scale_x)),
+                               max(1, round(obj.height * self.scale_y)))
+            shade.fill(self.collision_color, rect)
+        background.blit(shade, (0, 0))
+
+        # Voile sombre pour faire ressortir les marqueurs
+        veil = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        veil.fill(self.bg_color)
+        background.blit(veil, (0, 0))
+        return background
+    
+    def _load_background(self, path, digest):
+        """Lit l'arrière-plan en cache ; None s'il est absent, périmé ou d'une autre taille"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            print(f"[Minimap] Impossible de lire le cache {path}: {e}")
+            return None
+        if len(data) < CACHE_HEADER.size:
+            return None
+        magic, version, width, height, cached_digest = CACHE_HEADER.unpack_from(data)
+        if (magic != CACHE_MAGIC or version != CACHE_VERSION or cached_digest != digest
+                or (width, height) != (self.width, self.height)):
+            return None
+        payload = data[CACHE_HEADER.size:]
+        if len(payload) != width * height * 3:
+            return None
+        return pygame.image.frombytes(payload, (width, height), "RGB").convert_alpha()
+    
+    def _save_background(self, path, digest):
+        """Écrit l'arrière-plan (en-tête + pixels RGB, l'arrière-plan est opaque)"""
+        header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, self.width, self.height, digest)
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(pygame.image.tobytes(self.map_background, "RGB"))
     
     def world_to_minimap(self, world_x, world_y):
         """
@@ -137,22 +240,22 @@ class Minimap:
         """
         Met à jour la minimap avec les positions actuelles des entités
         
+        Appelée une fois par tick ; les marqueurs ne sont redessinés que tous
+        les refresh_interval ticks (l'arrière-plan est statique).
+        
         Args:
             player: Instance du joueur (optionnel)
             bot: Instance du bot (optionnel)
             ally_bot: Instance du bot allié (optionnel)
         """
-        # Effacer la surface de la minimap
-        self.surface.fill((0, 0, 0, 0))  # Transparent
+        self._ticks_until_refresh -= 1
+        if self._ticks_until_refresh > 0:
+            return
+        self._ticks_until_refresh = self.refresh_interval
         
-        # Dessiner l'arrière-plan de la carte
+        # L'arrière-plan est opaque : il remplace tout le contenu précédent
         self.surface.blit(self.map_background, (0, 0))
         
-        # Dessiner le fond semi-transparent
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill(self.bg_color)
-        self.surface.blit(overlay, (0, 0))
-        
         # Dessiner les entités en utilisant les positions stockées ou les objets passés
         # Dessiner le bot en premier
         if hasattr(self, 'bot_pos') or bot:
@@ -179,10 +282,7 @@ class Minimap:
                            self.player_color, size=5, shape='triangle')
     
     def render(self):
-        """Rend la minimap sur l'écran principal"""
-        # Mettre à jour l'affichage avant le rendu pour s'assurer que tout est à jour
-        self.update()
-        
+        """Rend la minimap sur l'écran principal (la surface est redessinée par update())"""
         # Dessiner la bordure
         border_rect = pygame.Rect(self.x - 2, self.y - 2, self.width + 4, self.height + 4)
         pygame.draw.rect(self.screen, self.border_color, border_rect)
@@ -191,24 +291,18 @@ class Minimap:
         # Dessiner la minimap
         self.screen.blit(self.surface, (self.x, self.y))
         
-        # Ajouter un titre
-        if hasattr(pygame, 'font') and pygame.font.get_init():
-            try:
-                font = pygame.font.Font(None, 20)
-                title_text = font.render("Carte", True, (255, 255, 255))
-                title_rect = title_text.get_rect()
-                title_rect.centerx = self.x + self.width // 2
-                title_rect.bottom = self.y - 5
-                
-                # Fond pour le titre
-                title_bg = pygame.Rect(title_rect.x - 5, title_rect.y - 2, 
-                                     title_rect.width + 10, title_rect.height + 4)
-                pygame.draw.rect(self.screen, (0, 0, 0, 150), title_bg)
-                
-                self.screen.blit(title_text, title_rect)
-            except:
-                # Si la police n'est pas disponible, ignorer le titre
-                pass
+        # Ajouter le titre (rendu une fois à l'initialisation)
+        if self.title_text is not None:
+            title_rect = self.title_text.get_rect()
+            title_rect.centerx = self.x + self.width // 2
+            title_rect.bottom = self.y - 5
+            
+            # Fond pour le titre
+            title_bg = pygame.Rect(title_rect.x - 5, title_rect.y - 2, 
+                                 title_rect.width + 10, title_rect.height + 4)
+            pygame.draw.rect(self.screen, (0, 0, 0, 150), title_bg)
+            
+            self.screen.blit(self.title_text, title_rect)
     
     def set_position(self, x, y):
         """Change la position de la minimap sur l'écran"""
@@ -225,5 +319,6 @@ class Minimap:
         self.scale_x = self.width / self.world_width
         self.scale_y = self.height / self.world_height
         
-        # Régénérer l'arrière-plan
-        self._generate_map_background()
\ No newline at end of file
+        # Régénérer l'arrière-plan et redessiner les marqueurs au prochain tick
+        self._generate_map_background()
+        self._ticks_until_refresh = 0
\ No newline at end of file
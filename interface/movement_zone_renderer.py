@@ -1,6 +1,8 @@
 import pygame
 import math
 
+from utils.text_cache import render_text
+
 class MovementZoneRenderer:
     """Classe pour rendre visuellement la zone de déplacement autorisée du joueur autour de l'ally bot"""
     
@@ -16,156 +18,135 @@ class MovementZoneRenderer:
         self.animation_speed = 0.05
         self.pulse_intensity = 0.3
         
-        # Surface pour le rendu avec alpha
-        self.zone_surface = None
-        self.last_screen_size = None
+        # Caméra pyscroll (BufferedRenderer) pour passer du monde à l'écran
+        self.camera = None
+
+        # Surfaces pré-rendues : anneau par (rayon, état), marqueurs par couleur
+        self.ring_cache = {}
+        self.marker_cache = {}
+        # Surface de travail pour la ligne de liaison (seule sa boîte englobante est effacée)
+        self.line_surface = None
+        self.info_bg_cache = {}
 
         # Distance max fixée à 300
         self.fixed_max_distance = 300
-        
-    def create_zone_surface(self, screen_size):
-        """Crée une surface avec canal alpha pour le rendu de la zone"""
-        if self.zone_surface is None or self.last_screen_size != screen_size:
-            self.zone_surface = pygame.Surface(screen_size, pygame.SRCALPHA).convert_alpha()
-            self.last_screen_size = screen_size
-        # Toujours reset au début de la frame
-        self.zone_surface.fill((0, 0, 0, 0))
-        return self.zone_surface
 
-    
-    def render_movement_zone(self, screen, player, ally_bot, camera_offset=(0, 0)):
+    def set_camera(self, camera):
+        """Renderer pyscroll utilisé pour convertir les positions monde en positions écran"""
+        self.camera = camera
+
+    def world_to_screen(self, point):
+        if self.camera is None:
+            return int(point[0]), int(point[1])
+        return self.camera.translate_point(point)
+
+    def get_zoom(self):
+        return self.camera.zoom if self.camera is not None else 1.0
+
+    def get_ring(self, radius, warning):
+        """Disque + bordure de la zone, rendu une fois par (rayon, état) dans une surface ajustée"""
+        key = (radius, warning)
+        ring = self.ring_cache.get(key)
+        if ring is None:
+            size = 2 * radius + 2
+            ring = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = (radius + 1, radius + 1)
+            if warning:
+                # Couleurs au maximum de la pulsation ; l'alpha de la surface module l'intensité
+                peak = 1.0 + self.pulse_intensity
+                zone_color = (*self.warning_color[:3], min(255, int(self.warning_color[3] * peak)))
+                border_color = (255, 100, 100, 200)
+            else:
+                zone_color = self.zone_color
+                border_color = self.border_color
+            pygame.draw.circle(ring, zone_color, center, radius, 0)
+            pygame.draw.circle(ring, border_color, center, radius, self.border_width)
+            self.ring_cache[key] = ring
+        return ring
+
+    def get_marker(self, fill_color, border_color, radius, border_width):
+        """Pastille (disque + contour) rendue une fois par couleur"""
+        key = (fill_color, border_color, radius, border_width)
+        marker = self.marker_cache.get(key)
+        if marker is None:
+            marker = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(marker, fill_color, (radius, radius), radius, 0)
+            pygame.draw.circle(marker, border_color, (radius, radius), radius, border_width)
+            self.marker_cache[key] = marker
+        return marker
+
+    def draw_connection(self, screen, start, end, color):
+        """Ligne semi-transparente : dessinée dans sa seule boîte englobante d'une surface réutilisée"""
+        bounds = pygame.Rect(min(start[0], end[0]) - 2, min(start[1], end[1]) - 2,
+                             abs(start[0] - end[0]) + 5, abs(start[1] - end[1]) + 5)
+        visible = bounds.clip(screen.get_rect())
+        if not visible.width or not visible.height:
+            return
+        if (self.line_surface is None or self.line_surface.get_width() < visible.width
+                or self.line_surface.get_height() < visible.height):
+            self.line_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        area = pygame.Rect(0, 0, visible.width, visible.height)
+        self.line_surface.fill((0, 0, 0, 0), area)
+        pygame.draw.line(self.line_surface, color,
+                         (start[0] - visible.x, start[1] - visible.y),
+                         (end[0] - visible.x, end[1] - visible.y), 2)
+        screen.blit(self.line_surface, visible.topleft, area)
+
+    def render_movement_zone(self, screen, player, ally_bot):
         """
         Rend la zone de déplacement autorisée autour de l'ally bot
+
+        Les positions passent par la caméra pyscroll (zoom compris) ; l'anneau est
+        une surface en cache, ignorée hors écran, et la pulsation ne change que son alpha.
         """
         if not ally_bot or not player.ally_bot:
             return
-        
-        # Obtenir les positions
-        ally_pos = ally_bot.get_position()
-        player_pos = player.position
+
         max_distance = self.fixed_max_distance  # forcé à 300
-        
-        # Calculer les positions à l'écran avec le décalage de la caméra
-        screen_ally_x = ally_pos[0] - camera_offset[0]
-        screen_ally_y = ally_pos[1] - camera_offset[1]
-        screen_player_x = player_pos[0] - camera_offset[0]
-        screen_player_y = player_pos[1] - camera_offset[1]
-        
-        # Créer la surface pour le rendu avec alpha
-        zone_surface = self.create_zone_surface(screen.get_size())
-        
+        # Centres des sprites tels qu'ils sont affichés (positions interpolées)
+        ally_x, ally_y = self.world_to_screen(ally_bot.rect.center)
+        player_x, player_y = self.world_to_screen(player.rect.center)
+        radius = int(max_distance * self.get_zoom())
+
         # Calculer la distance actuelle
         current_distance = player.get_distance_to_ally()
         distance_ratio = current_distance / max_distance if max_distance > 0 else 0
-        
+        warning = distance_ratio > self.warning_threshold
+
         # Mettre à jour l'animation
         self.animation_timer += self.animation_speed
-        pulse = math.sin(self.animation_timer) * self.pulse_intensity + 1.0
-        
-        # Déterminer les couleurs selon la distance
-        if distance_ratio > self.warning_threshold:
-            # Zone d'avertissement - rouge pulsant
-            zone_color = (
-                int(self.warning_color[0]),
-                int(self.warning_color[1]),
-                int(self.warning_color[2]),
-                int(self.warning_color[3] * pulse)
-            )
-            border_color = (
-                255,
-                int(100 * pulse),
-                int(100 * pulse),
-                200
-            )
-        else:
-            # Zone normale - bleu
-            zone_color = self.zone_color
-            border_color = self.border_color
-        
-        # Dessiner le cercle de la zone (rempli)
-        pygame.draw.circle(
-            zone_surface,
-            zone_color,
-            (int(screen_ally_x), int(screen_ally_y)),
-            int(max_distance),
-            0  # Rempli
-        )
-        
-        # Dessiner la bordure du cercle
-        pygame.draw.circle(
-            zone_surface,
-            border_color,
-            (int(screen_ally_x), int(screen_ally_y)),
-            int(max_distance),
-            self.border_width
-        )
-        
-        # Dessiner une ligne de connexion entre le joueur et l'ally bot
-        connection_color = (255, 255, 255, 100)
-        if distance_ratio > self.warning_threshold:
-            connection_color = (255, 150, 150, 150)
-        
-        pygame.draw.line(
-            zone_surface,
-            connection_color,
-            (int(screen_player_x), int(screen_player_y)),
-            (int(screen_ally_x), int(screen_ally_y)),
-            2
-        )
-        
+
+        # Anneau de la zone (culling si entièrement hors écran)
+        ring = self.get_ring(radius, warning)
+        ring_rect = ring.get_rect(center=(ally_x, ally_y))
+        if ring_rect.colliderect(screen.get_rect()):
+            if warning:
+                pulse = math.sin(self.animation_timer) * self.pulse_intensity + 1.0
+                ring.set_alpha(int(255 * pulse / (1.0 + self.pulse_intensity)))
+            screen.blit(ring, ring_rect)
+
+        # Ligne de connexion entre le joueur et l'ally bot
+        connection_color = (255, 150, 150, 150) if warning else (255, 255, 255, 100)
+        self.draw_connection(screen, (player_x, player_y), (ally_x, ally_y), connection_color)
+
         # Indicateur central (ally bot)
-        center_bg_color = (30, 30, 30, 200)
-        center_border_color = (180, 180, 180, 255)
-        
-        pygame.draw.circle(
-            zone_surface,
-            center_bg_color,
-            (int(screen_ally_x), int(screen_ally_y)),
-            10,
-            0
-        )
-        pygame.draw.circle(
-            zone_surface,
-            center_border_color,
-            (int(screen_ally_x), int(screen_ally_y)),
-            10,
-            2
-        )
-        
-        # Dessiner un indicateur de distance sur le joueur
+        ally_marker = self.get_marker((30, 30, 30, 200), (180, 180, 180, 255), 10, 2)
+        screen.blit(ally_marker, ally_marker.get_rect(center=(ally_x, ally_y)))
+
+        # Indicateur de distance sur le joueur
         player_indicator_color = (100, 255, 100, 200)
-        if distance_ratio > self.warning_threshold:
+        if warning:
             player_indicator_color = (255, 100, 100, 200)
         elif distance_ratio > 0.7:
             player_indicator_color = (255, 200, 100, 200)
-        
-        pygame.draw.circle(
-            zone_surface,
-            player_indicator_color,
-            (int(screen_player_x), int(screen_player_y)),
-            6,
-            0
-        )
-        pygame.draw.circle(
-            zone_surface,
-            (0, 0, 0, 255),
-            (int(screen_player_x), int(screen_player_y)),
-            6,
-            2
-        )
-        
-        # Blitter la surface sur l'écran
-        screen.blit(zone_surface, (0, 0))
-        
+        player_marker = self.get_marker(player_indicator_color, (0, 0, 0, 255), 6, 2)
+        screen.blit(player_marker, player_marker.get_rect(center=(player_x, player_y)))
 
     def render_distance_info(self, screen, player, font=None):
         """Affiche les infos de distance en haut à droite"""
         if not player.ally_bot:
             return
         
-        if font is None:
-            font = pygame.font.Font(None, 24)
-        
         current_distance = player.get_distance_to_ally()
         max_distance = self.fixed_max_distance
         distance_ratio = current_distance / max_distance if max_distance > 0 else 0
@@ -183,8 +164,13 @@ class MovementZoneRenderer:
             text_color = (100, 255, 100)  # Vert
         
         # Rendu du texte
-        distance_surface = font.render(distance_text, True, text_color)
-        percentage_surface = font.render(percentage_text, True, text_color)
+        # (police fournie, sinon libellés du cache de texte partagé)
+        if font is None:
+            distance_surface = render_text(distance_text, 24, text_color)
+            percentage_surface = render_text(percentage_text, 24, text_color)
+        else:
+            distance_surface = font.render(distance_text, True, text_color)
+            percentage_surface = font.render(percentage_text, True, text_color)
         
         # Position en haut à droite (+100 px vertical +20 px horizontal)
         screen_width = screen.get_width()
@@ -201,13 +187,13 @@ class MovementZoneRenderer:
         # Fond semi-transparent aligné avec le texte
         bg_rect = distance_rect.union(percentage_rect).inflate(20, 10)
         
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 120))
+        bg_surface = self.info_bg_cache.get(bg_rect.size)
+        if bg_surface is None:
+            bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+            bg_surface.fill((0, 0, 0, 120))
+            self.info_bg_cache[bg_rect.size] = bg_surface
         screen.blit(bg_surface, bg_rect.topleft)
         
         # Afficher le texte
         screen.blit(distance_surface, distance_rect)
         screen.blit(percentage_surface, percentage_rect)
-
-
-
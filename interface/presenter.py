@@ -0,0 +1,80 @@
+import pygame
+
+
+class Presenter:
+    """Présentation de l'image à l'écran : flip complet ou seulement les rectangles modifiés.
+
+    En jeu, le monde défile et chaque image est présentée en entier. Dans les
+    états figés (dialogue, écran de fin), le fond est dessiné une fois puis
+    gardé en copie ; seules les couches qui changent (réplique, timer, panneau
+    du profileur) sont redessinées, après restauration du fond sous leur
+    ancienne position, et envoyées avec pygame.display.update(rects). Une image
+    sans changement ne coûte alors ni dessin ni envoi.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.mode = None
+        self.background = None  # Copie du fond figé (None en jeu)
+        self.layers = {}  # nom -> (état, rectangle dessiné)
+        self.dirty = []
+        self.full = True
+
+        # Compteurs d'images : complètes, partielles, sans envoi
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.idle_frames = 0
+
+    def set_mode(self, mode):
+        """Change d'état d'affichage ; tout changement impose une image complète"""
+        if mode != self.mode:
+            self.mode = mode
+            self.background = None
+            self.layers = {}
+            self.full = True
+
+    def needs_background(self):
+        return self.background is None
+
+    def freeze(self):
+        """Mémorise l'écran actuel comme fond figé de l'état courant"""
+        self.background = self.screen.copy()
+        self.full = True
+
+    def invalidate(self):
+        """Image complète au prochain present() (monde redessiné, ou fenêtre découverte)"""
+        self.full = True
+
+    def layer(self, name, state, draw):
+        """Redessine la couche name si son état a changé.
+
+        draw() dessine la couche sur l'écran et retourne le rectangle couvert
+        (ou None) ; avec draw=None la couche est seulement effacée.
+        """
+        previous = self.layers.get(name)
+        if previous is not None and previous[0] == state and not self.full:
+            return
+        if previous is not None and previous[1] is not None:
+            self.restore(previous[1])
+        rect = draw() if draw is not None else None
+        if rect is not None:
+            self.dirty.append(rect)
+        self.layers[name] = (state, rect)
+
+    def restore(self, rect):
+        """Remet le fond figé sous rect"""
+        if self.background is not None:
+            self.screen.blit(self.background, rect, rect)
+            self.dirty.append(rect)
+
+    def present(self):
+        if self.full:
+            pygame.display.flip()
+            self.full_frames += 1
+        elif self.dirty:
+            pygame.display.update(self.dirty)
+            self.partial_frames += 1
+        else:
+            self.idle_frames += 1
+        self.full = self.background is None
+        self.dirty = []
@@ -0,0 +1,81 @@
+import pygame
+
+from utils.text_cache import get_font
+
+# Échelle verticale du graphe des temps d'image (ms) et repère des 60 FPS
+GRAPH_MAX_MS = 33.3
+TARGET_MS = 1000.0 / 60
+
+
+class ProfilerOverlay:
+    """Panneau du profileur (F3) : temps par étape (ms, p50, p99) et graphe des temps d'image.
+
+    Le panneau est redessiné dans une surface en cache toutes les refresh_every
+    images seulement ; les autres images se contentent d'un blit.
+    """
+
+    def __init__(self, profiler, max_rows=14, refresh_every=15):
+        self.profiler = profiler
+        self.max_rows = max_rows
+        self.refresh_every = refresh_every
+        self.font = get_font(None, 18)
+        self.width = 380
+        self.row_height = 15
+        self.graph_height = 60
+        self.panel = None
+        self._frames_until_refresh = 0
+
+    def render(self, screen):
+        """Dessine le panneau ; retourne le rectangle couvert (None si le profileur est coupé)"""
+        if not self.profiler.enabled:
+            return None
+        if self.panel is None or self._frames_until_refresh <= 0:
+            self.panel = self._build_panel()
+            self._frames_until_refresh = self.refresh_every
+        self._frames_until_refresh -= 1
+        return screen.blit(self.panel, (screen.get_width() - self.width - 10, 10))
+
+    def _build_panel(self):
+        profiler = self.profiler
+        stats = profiler.stage_stats(self.max_rows)
+        height = 8 + self.row_height * (len(stats) + 3) + self.graph_height + 8
+        panel = pygame.Surface((self.width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        last, mean, p50, p99 = profiler.summarize(profiler.frames)
+        y = 6
+        self._text(panel, "Profileur (F3)", 8, y, (255, 215, 0))
+        self._text(panel, f"image {last:5.2f} ms  p50 {p50:5.2f}  p99 {p99:5.2f}", 120, y, (255, 255, 255))
+        y += self.row_height + 4
+
+        # En-tête puis une ligne par étape, de la plus coûteuse à la moins coûteuse
+        self._text(panel, "étape", 8, y, (160, 160, 160))
+        for x, label in ((220, "moy"), (270, "p50"), (320, "p99")):
+            self._text(panel, label, x, y, (160, 160, 160))
+        y += self.row_height
+        for name, _, stage_mean, stage_p50, stage_p99 in stats:
+            color = (255, 120, 120) if stage_p99 > TARGET_MS / 4 else (220, 220, 220)
+            self._text(panel, name, 8, y, color)
+            for x, value in ((220, stage_mean), (270, stage_p50), (320, stage_p99)):
+                self._text(panel, f"{value:5.2f}", x, y, color)
+            y += self.row_height
+
+        self._draw_graph(panel, pygame.Rect(8, y + 4, self.width - 16, self.graph_height))
+        return panel
+
+    def _draw_graph(self, panel, rect):
+        pygame.draw.rect(panel, (40, 40, 40, 200), rect)
+        target_y = rect.bottom - int(rect.height * min(1.0, TARGET_MS / GRAPH_MAX_MS))
+        pygame.draw.line(panel, (90, 160, 90), (rect.left, target_y), (rect.right - 1, target_y))
+        frames = self.profiler.frame_times_ms()
+        if len(frames) < 2:
+            return
+        step = rect.width / (self.profiler.capacity - 1)
+        points = [
+            (rect.left + int(i * step), rect.bottom - 1 - int((rect.height - 1) * min(1.0, ms / GRAPH_MAX_MS)))
+            for i, ms in enumerate(frames)
+        ]
+        pygame.draw.lines(panel, (255, 200, 0), False, points)
+
+    def _text(self, panel, text, x, y, color):
+        panel.blit(self.font.render(text, True, color), (x, y))
@@ -6,36 +6,163 @@ Main entry point for "Tu n'es pas le héros"
 Jeu 2D pygame avec bots joueur allié, bot hero et allié joueur
 """
 
-import pygame
+import argparse
+import os
 import sys
+import time
+
+import pygame
 from game.game_manager import GameManager
+from game.replay import ReplayPlayer, ReplayRecorder
+from game.telemetry import Telemetry, default_log_path
 from menu.menu import Menu
 
 # Configuration de base
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
-FPS = 60
+FPS = 144  # Cadence maximale d'affichage (la simulation tourne à TICK_RATE, voir game/game_clock.py)
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Tu n'es pas le héros")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulation seule, sans fenêtre, menu, dialogues ni rendu")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="nombre de ticks à simuler en mode headless "
+                             "(défaut : 3600, ou toute la durée du replay)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="graine des flux aléatoires (partie reproductible)")
+    parser.add_argument("--record", metavar="FICHIER", default=None,
+                        help="enregistrer la partie dans un fichier de replay")
+    parser.add_argument("--replay", metavar="FICHIER", default=None,
+                        help="rejouer un fichier de replay (à vitesse réelle, ou au plus vite avec --headless)")
+    parser.add_argument("--telemetry", action="store_true",
+                        help="écrire les événements de jeu dans logs/telemetry-*.jsonl")
+    parser.add_argument("--profile", action="store_true",
+                        help="activer le profileur dès le départ (F3 pour l'afficher/masquer)")
+    parser.add_argument("--typewriter", type=float, metavar="CAR/S", default=None,
+                        help="afficher les dialogues en machine à écrire, à CAR/S caractères par seconde")
+    return parser.parse_args(argv)
+
+
+def start_telemetry(game_manager, enabled):
+    """Branche la télémétrie sur le bus d'événements du jeu (si demandée)"""
+    if not enabled:
+        return None
+    telemetry = Telemetry(game_manager.event_bus, default_log_path())
+    telemetry.start()
+    return telemetry
+
+
+def stop_telemetry(telemetry):
+    if telemetry is None:
+        return
+    telemetry.close()
+    print(f"[Télémétrie] {telemetry.written} événements écrits dans {telemetry.path}"
+          f" ({telemetry.dropped} perdus)")
+
+
+def setup_replay(game_manager, record_path, replay):
+    """Branche l'enregistrement et/ou le rejeu sur le GameManager ; retourne l'enregistreur"""
+    if replay is not None:
+        game_manager.set_replay_player(replay)
+    if record_path is None:
+        return None
+    recorder = ReplayRecorder(game_manager.seed, game_manager.clock.tick_rate)
+    game_manager.set_replay_recorder(recorder)
+    return recorder
+
+
+def finish_replay(recorder, record_path, replay):
+    """Écrit l'enregistrement et résume la vérification du rejeu"""
+    if recorder is not None:
+        size = recorder.save(record_path)
+        print(f"[Replay] {recorder.ticks} ticks enregistrés dans {record_path} ({size} octets)")
+    if replay is not None:
+        status = "identique" if replay.desyncs == 0 else f"{replay.desyncs} désynchronisation(s)"
+        print(f"[Replay] {replay.ticks}/{replay.total_ticks} ticks rejoués - {status}")
+
+
+def print_profile(profiler, limit=15):
+    """Résumé des étapes les plus coûteuses (ms par tick)"""
+    print(f"[Profil] {'étape':<32} {'moy':>7} {'p50':>7} {'p99':>7}")
+    for name, _, mean, p50, p99 in profiler.stage_stats(limit):
+        print(f"[Profil] {name:<32} {mean:7.3f} {p50:7.3f} {p99:7.3f}")
+
+
+def run_headless(frames, seed=None, record_path=None, replay=None, telemetry=False, profile=False):
+    """Simule frames ticks aussi vite que possible et affiche un résumé"""
+    # Pilotes SDL factices : aucune fenêtre ni sortie audio
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    if replay is not None:
+        seed = replay.seed
+        if frames is None:
+            frames = replay.total_ticks
+    elif frames is None:
+        frames = 3600
+    game_manager = GameManager(screen, headless=True, seed=seed)
+    recorder = setup_replay(game_manager, record_path, replay)
+    telemetry = start_telemetry(game_manager, telemetry)
+    if profile:
+        game_manager.profiler.enabled = True
+
+    ticks = 0
+    start = time.perf_counter()
+    while ticks < frames and not game_manager.should_quit:
+        game_manager.update()
+        ticks += 1
+    elapsed = time.perf_counter() - start
+
+    rate = ticks / elapsed if elapsed > 0 else float("inf")
+    hero = game_manager.bot.position
+    print(f"[headless] graine {game_manager.seed}")
+    print(f"[headless] {ticks} ticks en {elapsed:.2f}s ({rate:.0f} ticks/s, "
+          f"{game_manager.get_now() / 1000:.1f}s simulées)")
+    print(f"[headless] héros: ({hero[0]:.1f}, {hero[1]:.1f}) - pourcentage: {game_manager.percentage:.1f}% "
+          f"- fin de partie: {game_manager.game_ended}")
+    finish_replay(recorder, record_path, replay)
+    stop_telemetry(telemetry)
+    if profile:
+        print_profile(game_manager.profiler)
+    pygame.quit()
+
 
 def main():
     """Point d'entrée principal du jeu"""
+    args = parse_args()
+    replay = ReplayPlayer.load(args.replay) if args.replay else None
+    if args.headless:
+        run_headless(args.frames, args.seed, args.record, replay, args.telemetry, args.profile)
+        return
+
     # Initialisation de pygame
     pygame.init()
     pygame.mixer.init()  # Initialiser le mixer pour la musique
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Bro thinks he's the main character 💀 - GameJam Groupe 12")
 
-    # Menu principal
-    menu = Menu(screen)
-    menu.draw_menu()
-    started_game = menu.run()
-    if not started_game:
-        return
+    # Menu principal (pas de menu pour regarder un replay)
+    if replay is None:
+        menu = Menu(screen)
+        menu.draw_menu()
+        started_game = menu.run()
+        if not started_game:
+            return
 
     # Lancement du jeu
     clock = pygame.time.Clock()
-    game_manager = GameManager(screen)
+    game_manager = GameManager(screen, seed=replay.seed if replay else args.seed)
+    recorder = setup_replay(game_manager, args.record, replay)
+    telemetry = start_telemetry(game_manager, args.telemetry)
+    if args.profile:
+        game_manager.toggle_profiler()
+    game_manager.dialogue_manager.typewriter_speed = args.typewriter
 
-    game_manager.dialogue_manager.start_scene("scene_intro")
+    if replay is None:
+        game_manager.dialogue_manager.start_scene("scene_intro")
     running = True
     while running:
         for event in pygame.event.get():
@@ -43,6 +170,11 @@ def main():
                 running = False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                game_manager.toggle_profiler()
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                # Fenêtre découverte ou restaurée : les écrans figés doivent être renvoyés en entier
+                game_manager.presenter.invalidate()
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_n:
                 game_manager.handle_dialogue()
             # Exemple de raccourcis pour tes capacités
@@ -59,16 +191,36 @@ def main():
         if game_manager.should_quit:
             running = False
 
-        if not game_manager.dialogue_manager.is_active():
-            # Gestion des touches en continu
-            game_manager.handle_input()
-            # Mise à jour du jeu
-            game_manager.update()
-        # Rendu
-        game_manager.render()
+        if replay is not None:
+            # Les dialogues ne font que suspendre la simulation : on les passe pendant un replay
+            while game_manager.dialogue_manager.is_active():
+                game_manager.dialogue_manager.next_line()
+            if replay.finished:
+                running = False
+
+        # Temps réel écoulé depuis l'image précédente
+        frame_ms = clock.tick(FPS)
+        game_clock = game_manager.clock
+        game_manager.profiler.begin_frame()
 
-        clock.tick(FPS)
+        if game_manager.dialogue_manager.is_active():
+            # Simulation en pause pendant les dialogues
+            game_clock.pause()
+        else:
+            # Autant de ticks à pas fixe que le temps écoulé en contient
+            # (entrées comprises, via le scheduler)
+            for _ in range(game_clock.advance(frame_ms)):
+                game_manager.update()
+                if (game_manager.dialogue_manager.is_active() or game_manager.should_quit
+                        or (replay is not None and replay.finished)):
+                    game_clock.pause()
+                    break
+        # Rendu, interpolé entre les deux derniers ticks
+        game_manager.render(game_clock.alpha)
+        game_manager.profiler.end_frame()
 
+    finish_replay(recorder, args.record, replay)
+    stop_telemetry(telemetry)
     pygame.quit()
     sys.exit()
 
@@ -7,6 +7,7 @@ from utils.animation import (
     change_direction,
     advance_animation,
 )
+from game.game_clock import TICK_MS
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
@@ -170,12 +171,15 @@ class Player(pygame.sprite.Sprite):
         self.image = self.animations[self.current_direction][0]
 
     def update(self):
+        """Enchaîne les phases du joueur (le jeu passe par le SystemScheduler)"""
+        self.update_attraction_system()
+        self.update_animation()
+
+    def update_animation(self):
+        """Synchronise le rect, avance l'animation et gère le son de course"""
         self.rect.center = self.position
         self.feet.move(self.rect.midbottom)
 
-        # Gestion du système d'attraction automatique
-        self.update_attraction_system()
-
         if self.is_moving:
             # Détermine la direction d'animation appropriée
             animation_direction = self.determine_animation_direction()
@@ -222,8 +226,8 @@ class Player(pygame.sprite.Sprite):
         
         # Si on est hors de portée
         if current_distance > self.max_distance_from_ally:
-            # Incrémenter le timer (approximation: 16ms par frame à 60 FPS)
-            self.time_outside_range += 16
+            # Incrémenter le timer d'un tick de simulation
+            self.time_outside_range += TICK_MS
             
             # Si on a dépassé le temps limite, commencer l'attraction
             if self.time_outside_range >= self.max_time_outside:
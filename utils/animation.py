@@ -1,13 +1,27 @@
-"""Utility helpers for loading and updating sprite animations."""
+"""Utility helpers for loading and updating sprite animations.
+
+Frequently spawned sprites (projectiles, traps) should go through the asset
+cache (:func:`get_image`, :func:`get_directional_animations`): every image is
+decoded and converted once, then the same surfaces are shared by all
+instances. Cached surfaces and frame lists must be treated as read-only.
+"""
 from __future__ import annotations
 
-from typing import Dict, Mapping, Sequence, Tuple
+import os
+from typing import Dict, Hashable, Mapping, Optional, Sequence, Tuple
 
 import pygame
 
 
 FrameList = Sequence[pygame.Surface]
 AnimationsDict = Dict[str, FrameList]
+Crop = Optional[Tuple[int, int, int, int]]
+Tint = Optional[Tuple[int, int, int]]
+
+# (path, crop, scale, tint) -> converted surface
+_image_cache: Dict[Tuple[str, Crop, float, Tint], pygame.Surface] = {}
+# (path, frame layout, scale, tint) -> direction -> frames
+_animation_cache: Dict[Tuple[str, Hashable, float, Tint], AnimationsDict] = {}
 
 
 def load_sprite_sheet(path: str) -> pygame.Surface:
@@ -15,6 +29,54 @@ def load_sprite_sheet(path: str) -> pygame.Surface:
     return pygame.image.load(path).convert_alpha()
 
 
+def tint_surface(surface: pygame.Surface, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Return a copy of *surface* multiplied by *color* (with the bots' subtle alpha of 100)."""
+    tinted = surface.copy()
+    overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    overlay.fill((*color, 100))
+    tinted.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return tinted
+
+
+def _scaled(surface: pygame.Surface, scale: float) -> pygame.Surface:
+    if scale == 1.0:
+        return surface
+    width, height = surface.get_size()
+    return pygame.transform.scale(surface, (max(1, int(width * scale)), max(1, int(height * scale))))
+
+
+def get_image(
+    path: str,
+    crop: Crop = None,
+    scale: float = 1.0,
+    tint: Tint = None,
+) -> pygame.Surface:
+    """Return the cached, converted image for ``(path, crop, scale, tint)``.
+
+    The file is decoded only the first time any variant of it is requested.
+    """
+    path = os.path.normpath(path)
+    key = (path, crop, scale, tint)
+    image = _image_cache.get(key)
+    if image is not None:
+        return image
+
+    sheet_key = (path, None, 1.0, None)
+    sheet = _image_cache.get(sheet_key)
+    if sheet is None:
+        sheet = load_sprite_sheet(path)
+        _image_cache[sheet_key] = sheet
+    if key == sheet_key:
+        return sheet
+
+    image = sheet.subsurface(pygame.Rect(crop)).copy() if crop is not None else sheet
+    image = _scaled(image, scale)
+    if tint is not None:
+        image = tint_surface(image, tint)
+    _image_cache[key] = image
+    return image
+
+
 def extract_frames(
     sheet: pygame.Surface,
     row_index: int,
@@ -64,6 +126,50 @@ def load_directional_animations(
     }
 
 
+def get_directional_animations(
+    path: str,
+    frame_width: int,
+    frame_height: int,
+    rows_by_direction: Mapping[str, int],
+    *,
+    columns: int = 4,
+    scale: float = 1.0,
+    tint: Tint = None,
+) -> AnimationsDict:
+    """Cached version of :func:`load_directional_animations` for a sheet on disk.
+
+    All callers asking for the same layout share the same frame lists.
+    """
+    path = os.path.normpath(path)
+    layout = (frame_width, frame_height, tuple(sorted(rows_by_direction.items())), columns)
+    key = (path, layout, scale, tint)
+    animations = _animation_cache.get(key)
+    if animations is None:
+        animations = load_directional_animations(
+            get_image(path),
+            frame_width,
+            frame_height,
+            rows_by_direction,
+            columns=columns,
+            scale=scale,
+        )
+        if tint is not None:
+            animations = {
+                direction: [tint_surface(frame, tint) for frame in frames]
+                for direction, frames in animations.items()
+            }
+        # Tuples: the shared lists cannot be modified in place by mistake
+        animations = {direction: tuple(frames) for direction, frames in animations.items()}
+        _animation_cache[key] = animations
+    return animations
+
+
+def clear_asset_cache() -> None:
+    """Drop every cached surface (e.g. after the display mode changes)."""
+    _image_cache.clear()
+    _animation_cache.clear()
+
+
 def change_direction(
     current_direction: str,
     new_direction: str,
@@ -97,8 +203,12 @@ def advance_animation(
 
 __all__ = [
     "load_sprite_sheet",
+    "tint_surface",
+    "get_image",
     "extract_frames",
     "load_directional_animations",
+    "get_directional_animations",
+    "clear_asset_cache",
     "change_direction",
     "advance_animation",
 ]
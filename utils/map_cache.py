@@ -0,0 +1,75 @@
+"""Helpers for the generated caches stored next to a TMX map."""
+from __future__ import annotations
+
+import hashlib
+import os
+import xml.etree.ElementTree as ElementTree
+from typing import List
+
+
+def file_digest(path: str) -> bytes:
+    """Return the SHA-256 digest of the file at *path*."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def map_sources(tmx_path: str) -> List[str]:
+    """Return the files a TMX map's tiles are drawn from: external ``.tsx``
+    tilesets and every tileset/tile image, in document order.
+
+    Paths are resolved relative to the file that references them. Files that
+    cannot be parsed are listed but not followed.
+    """
+    sources: List[str] = []
+
+    def collect_images(element: ElementTree.Element, base: str) -> None:
+        for image in element.iter("image"):
+            if image.get("source"):
+                sources.append(os.path.normpath(os.path.join(base, image.get("source"))))
+
+    base = os.path.dirname(tmx_path)
+    root = ElementTree.parse(tmx_path).getroot()
+    for tileset in root.iter("tileset"):
+        source = tileset.get("source")
+        if source is None:
+            collect_images(tileset, base)
+            continue
+        tsx_path = os.path.normpath(os.path.join(base, source))
+        sources.append(tsx_path)
+        try:
+            collect_images(ElementTree.parse(tsx_path).getroot(), os.path.dirname(tsx_path))
+        except (OSError, ElementTree.ParseError):
+            pass
+    return sources
+
+
+def map_digest(tmx_path: str) -> bytes:
+    """Return a SHA-256 over the TMX file and every tileset file it draws from.
+
+    Use this instead of :func:`file_digest` for caches of rendered pixels, so
+    that editing a tileset image invalidates them too.
+    """
+    digest = hashlib.sha256(file_digest(tmx_path))
+    for path in map_sources(tmx_path):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        try:
+            digest.update(file_digest(path))
+        except OSError:
+            digest.update(b"missing")
+    return digest.digest()
+
+
+def cache_path(map_path: str, suffix: str) -> str:
+    """Return the cache file path for *map_path* (``map.tmx`` -> ``map<suffix>``)."""
+    return os.path.splitext(map_path)[0] + suffix
+
+
+__all__ = [
+    "file_digest",
+    "map_sources",
+    "map_digest",
+    "cache_path",
+]
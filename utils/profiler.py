@@ -0,0 +1,141 @@
+"""Lightweight frame profiler built on :func:`time.perf_counter_ns`.
+
+Each named stage keeps its last ``capacity`` samples (nanoseconds) in a ring
+buffer; statistics (mean, p50, p99) are computed on demand, typically a few
+times per second by the overlay. Stages are timed either by the system
+scheduler (one stage per registered system) or with :meth:`Profiler.scope`.
+
+When the profiler is disabled, :meth:`Profiler.scope` returns a shared no-op
+context manager and the scheduler skips timing entirely, so the cost is one
+attribute check per phase.
+"""
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_CAPACITY = 240  # Samples kept per stage (4 s at 60 ticks/s)
+
+
+class SampleRing:
+    """Fixed-size ring buffer of integer samples (nanoseconds)."""
+
+    __slots__ = ("samples", "index", "count")
+
+    def __init__(self, capacity: int) -> None:
+        self.samples: List[int] = [0] * capacity
+        self.index = 0
+        self.count = 0
+
+    def add(self, value: int) -> None:
+        samples = self.samples
+        samples[self.index] = value
+        self.index = (self.index + 1) % len(samples)
+        if self.count < len(samples):
+            self.count += 1
+
+    def last(self) -> int:
+        if self.count == 0:
+            return 0
+        return self.samples[self.index - 1]
+
+    def ordered(self) -> List[int]:
+        """Samples from oldest to newest."""
+        if self.count < len(self.samples):
+            return self.samples[:self.count]
+        return self.samples[self.index:] + self.samples[:self.index]
+
+    def clear(self) -> None:
+        self.index = 0
+        self.count = 0
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.record(self.name, time.perf_counter_ns() - self.start)
+
+
+class Profiler:
+    """Per-stage timings and frame times, toggled at runtime."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False) -> None:
+        self.capacity = capacity
+        self.enabled = enabled
+        self.stages: Dict[str, SampleRing] = {}
+        self.frames = SampleRing(capacity)
+        self._frame_start = 0
+
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.reset()
+        return self.enabled
+
+    def reset(self) -> None:
+        for ring in self.stages.values():
+            ring.clear()
+        self.frames.clear()
+        self._frame_start = 0
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        ring = self.stages.get(name)
+        if ring is None:
+            ring = self.stages[name] = SampleRing(self.capacity)
+        ring.add(elapsed_ns)
+
+    def scope(self, name: str):
+        """Context manager timing the enclosed block as stage *name*."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self) -> None:
+        if self.enabled and self._frame_start:
+            self.frames.add(time.perf_counter_ns() - self._frame_start)
+
+    @staticmethod
+    def summarize(ring: SampleRing) -> Tuple[float, float, float, float]:
+        """(last, mean, p50, p99) of a ring, in milliseconds."""
+        if ring.count == 0:
+            return 0.0, 0.0, 0.0, 0.0
+        samples = np.asarray(ring.ordered(), dtype=np.float64) / 1e6
+        p50, p99 = np.percentile(samples, (50, 99))
+        return ring.last() / 1e6, float(samples.mean()), float(p50), float(p99)
+
+    def stage_stats(self, limit: Optional[int] = None) -> List[Tuple[str, float, float, float, float]]:
+        """(name, last, mean, p50, p99) per stage, most expensive (mean) first."""
+        stats = [(name,) + self.summarize(ring) for name, ring in self.stages.items() if ring.count]
+        stats.sort(key=lambda row: row[2], reverse=True)
+        return stats if limit is None else stats[:limit]
+
+    def frame_times_ms(self) -> List[float]:
+        return [sample / 1e6 for sample in self.frames.ordered()]
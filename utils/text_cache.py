@@ -0,0 +1,106 @@
+"""Shared font and rendered-text caches for per-frame UI labels.
+
+Fonts are built once per ``(path, size)``. Rendered labels are kept in a
+bounded LRU keyed by ``(font, text, colour, antialias, outline)``, so a label
+that does not change between frames costs a dictionary lookup and a blit,
+without rasterising any glyph. Labels that change every frame (timers,
+distances) simply cycle through the LRU.
+
+Returned surfaces are shared and must be treated as read-only.
+"""
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+Color = Tuple[int, ...]
+Outline = Optional[Tuple[Color, int]]
+
+TEXT_CACHE_CAPACITY = 512
+
+# Offsets of the outline copies (8 directions), scaled by the outline width
+_OUTLINE_OFFSETS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+# (path, size) -> font
+_font_cache: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+# (path, size, text, colour, antialias, outline) -> surface, least recently used first
+_text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+def get_font(path: Optional[str], size: int) -> pygame.font.Font:
+    """Return the shared font for ``(path, size)``; ``None`` is pygame's default font."""
+    if path is not None:
+        path = os.path.normpath(path)
+    key = (path, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = _font_cache[key] = pygame.font.Font(path, size)
+    return font
+
+
+def _render_outlined(font: pygame.font.Font, text: str, color: Color, antialias: bool,
+                     outline_color: Color, width: int) -> pygame.Surface:
+    base = font.render(text, antialias, color)
+    shadow = font.render(text, antialias, outline_color)
+    surface = pygame.Surface((base.get_width() + 2 * width, base.get_height() + 2 * width), pygame.SRCALPHA)
+    for dx, dy in _OUTLINE_OFFSETS:
+        surface.blit(shadow, (width + dx * width, width + dy * width))
+    surface.blit(base, (width, width))
+    return surface
+
+
+def render_text(
+    text: str,
+    size: int,
+    color: Color,
+    path: Optional[str] = None,
+    antialias: bool = True,
+    outline: Outline = None,
+) -> pygame.Surface:
+    """Return the cached surface of *text* rendered with the font ``(path, size)``.
+
+    *outline* is ``(colour, width)``: the text is drawn over eight copies in
+    that colour, offset by *width* pixels, and the surface grows by
+    ``2 * width`` in each dimension.
+    """
+    key = (path, size, text, tuple(color), antialias, outline)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        _stats["hits"] += 1
+        return surface
+
+    _stats["misses"] += 1
+    font = get_font(path, size)
+    if outline is None:
+        surface = font.render(text, antialias, color)
+    else:
+        surface = _render_outlined(font, text, color, antialias, outline[0], outline[1])
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_CAPACITY:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+def clear_text_cache() -> None:
+    """Drop every rendered label (fonts are kept)."""
+    _text_cache.clear()
+
+
+def text_cache_info() -> Dict[str, int]:
+    """Hit/miss counters and current size of the label cache."""
+    return {"hits": _stats["hits"], "misses": _stats["misses"], "size": len(_text_cache),
+            "fonts": len(_font_cache)}
+
+
+__all__ = [
+    "TEXT_CACHE_CAPACITY",
+    "get_font",
+    "render_text",
+    "clear_text_cache",
+    "text_cache_info",
+]